@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+
+import argparse
+import timeit
+
+from enuActor.drivers.hxp_drivers import replyParser
+
+
+def legacyParse(error, returnedString, nbOutputs):
+    """Character by character split and eval(), as hxp_drivers used to decode every reply."""
+    if (error != 0):
+        return [error, returnedString]
+
+    i, j, retList = 0, 0, [error]
+
+    for paramNb in range(nbOutputs):
+
+        while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
+            j += 1
+
+        retList.append(eval(returnedString[i:i + j]))
+
+        i, j = i + j + 1, 0
+
+    return retList
+
+
+replies = {'GroupStatusGet': (('int',), '12'),
+           'GroupPositionCurrentGet': (6 * ('double',), '0.0123456789,-0.0987654321,1.25,0.000125,-0.00025,0.0005'),
+           'PositionerCorrectorPIDFFVelocityGet': (('bool',) + 11 * ('double',),
+                                                   '1,' + ','.join(['12.3456789'] * 11)),
+           }
+
+
+def benchmark(number):
+    """Time legacy and compiled parsers on typical replies, return results in microseconds per call."""
+    results = dict()
+
+    for apiName, (outputTypes, returnedString) in replies.items():
+        parser = replyParser(*outputTypes)
+        legacy = timeit.timeit(lambda: legacyParse(0, returnedString, len(outputTypes)), number=number)
+        compiled = timeit.timeit(lambda: replyParser(*outputTypes)(0, returnedString), number=number)
+
+        assert parser(0, returnedString) == legacyParse(0, returnedString, len(outputTypes))
+        results[apiName] = (1e6 * legacy / number, 1e6 * compiled / number)
+
+    return results
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Compare hexapod reply parsing cost per call, before and after.')
+    parser.add_argument('--number', type=int, default=20000, help='number of calls per measurement.')
+    args = parser.parse_args()
+
+    print(f'{"API call":<40}{"eval (us)":>12}{"parser (us)":>14}{"speedup":>10}')
+    for apiName, (legacy, compiled) in benchmark(args.number).items():
+        print(f'{apiName:<40}{legacy:>12.2f}{compiled:>14.2f}{legacy / compiled:>9.1f}x')
@@ -0,0 +1,225 @@
+#!/usr/bin/env python
+
+import argparse
+import importlib
+import json
+import os
+import platform
+import sys
+import timeit
+from types import ModuleType, SimpleNamespace
+
+import numpy as np
+from enuActor.utils import slitGeometry, slitMotionProfile
+
+baselinePath = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'slitBenchmarks.json')
+
+# representative slit configuration, only the values used by the benchmarked functions.
+config = dict(focus_axis=[1, 0, 0, 0, 0, 0], dither_x_axis=[0, 0, 1, 0, 0, 0], dither_y_axis=[0, 1, 0, 0, 0, 0],
+              pix_to_mm=[0.021, 0.0147], dither_xpix_to_v_angle=0.0276, radius=42.0, positionTolerance=0.001)
+
+referenceArray = np.arange(10000, dtype=float)
+
+
+class Anything(object):
+    """Stand-in accepting any call or attribute, enough to define and instantiate the actor classes."""
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def __call__(self, *args, **kwargs):
+        return Anything()
+
+    def __getattr__(self, name):
+        return Anything()
+
+    def __mul__(self, other):
+        return Anything()
+
+
+def stubAttribute(name):
+    """Module level __getattr__ of stubbed modules, import machinery attributes are left undefined."""
+    if name.startswith('__'):
+        raise AttributeError(name)
+
+    return Anything()
+
+
+def stubActorDependencies():
+    """Stub ics and opscore modules which cannot be imported, so that the actor wrappers are always benchmarked.
+
+    The wrappers do not call them, timings are the same as with the real modules.
+    """
+    stubs = {'ics.utils.fsm.fsmThread': dict(FSMThread=type('FSMThread', (), {})),
+             'ics.utils.threading': dict(threaded=lambda func: func, blocking=lambda func: func,
+                                         singleShot=lambda func: func),
+             'ics.utils.tcp.utils': dict(), 'ics.utils.time': dict(),
+             'ics.utils.sps.lamps.controllers.digitalLoggers': dict(), 'ics.utils.sps.lamps.controllers.aten': dict(),
+             'opscore.protocols.keys': dict(), 'opscore.protocols.types': dict()}
+
+    for moduleName, attributes in stubs.items():
+        try:
+            importlib.import_module(moduleName)
+            continue
+        except ImportError:
+            pass
+
+        parts = moduleName.split('.')
+        for i in range(1, len(parts) + 1):
+            name = '.'.join(parts[:i])
+            if name not in sys.modules:
+                sys.modules[name] = ModuleType(name)
+                sys.modules[name].__getattr__ = stubAttribute
+            if i > 1:
+                setattr(sys.modules['.'.join(parts[:i - 1])], parts[i - 1], sys.modules[name])
+
+        for attr, value in attributes.items():
+            setattr(sys.modules[moduleName], attr, value)
+
+
+def repeated(func, number=1000):
+    """Return a callable calling func number times, so that sub-microsecond cases are timed in aggregate."""
+    calls = range(number)
+
+    def loop():
+        for i in calls:
+            func()
+
+    return loop
+
+
+def referenceWorkload():
+    """Fixed mix of interpreter and numpy work, measured in the same run as the cases so that ratios are portable."""
+    return sum(i * i for i in range(1000)) + float(np.cumsum(referenceArray)[-1])
+
+
+def slitCoords(nRows, seed=0):
+    """Return (nRows, 6) coordinates mixing home, undef and offset positions, as seen in slitPosition keywords."""
+    rng = np.random.default_rng(seed)
+    coords = rng.normal(scale=0.5, size=(nRows, 6))
+    coords[:, 3:] *= 1e-4
+    coords[::4] = 0
+    coords[1::7, 0] = np.nan
+
+    return coords
+
+
+def wrapperCases():
+    """Cases going through the slit controller and SlitCmd wrappers, actor dependencies are stubbed if missing."""
+    stubActorDependencies()
+    from enuActor.Commands.SlitCmd import SlitCmd
+    from enuActor.Controllers.slit import slit
+
+    singleRow = slitCoords(1)
+    actor = SimpleNamespace(actorConfig=dict(slit=config), controllers=dict(slit=SimpleNamespace(coords=[0.] * 6)))
+    slitCmd = SlitCmd(actor)
+    mmKeys = dict(X=SimpleNamespace(values=[0.5]), Y=SimpleNamespace(values=[-0.2]))
+    pixelKeys = dict(X=SimpleNamespace(values=[3]), Y=SimpleNamespace(values=[1.5]), pixels=None)
+
+    return {
+        'slit.convertToWorld': lambda: slit.convertToWorld(singleRow),
+        'slit.slitPosition': lambda: slit.slitPosition(singleRow, config),
+        'SlitCmd.ditherCoords(mm)': lambda: slitCmd.ditherCoords(mmKeys),
+        'SlitCmd.ditherCoords(pixels)': lambda: slitCmd.ditherCoords(pixelKeys, reference='absolute'),
+    }
+
+
+def makeCases():
+    """Return {name: callable}, each one timed independently."""
+    singleRow, manyRows = slitCoords(1), slitCoords(10000)
+    positions = slitCoords(1000)
+
+    return {
+        'makeJerkProfile(0.3mm/s)': lambda: slitMotionProfile.makeJerkProfile(0.3, maxAcceleration=1.2),
+        'profileSegments(0.3mm/s)': lambda: slitMotionProfile.profileSegments(0.3, maxAcceleration=1.2),
+        'calculateDistanceBeforeAtSpeed(0.3mm/s) x1000':
+            repeated(lambda: slitMotionProfile.calculateDistanceBeforeAtSpeed(0.3)),
+        'calculateDistanceBeforeAtSpeed(-0.8mm/s) x1000':
+            repeated(lambda: slitMotionProfile.calculateDistanceBeforeAtSpeed(-0.8)),
+        'convertToWorld(1 row)': lambda: slitGeometry.convertToWorld(singleRow),
+        'convertToWorld(10000 rows)': lambda: slitGeometry.convertToWorld(manyRows),
+        'slitPositions(1 row)': lambda: slitGeometry.slitPositions(singleRow, config),
+        'slitPositions(1000 rows)': lambda: slitGeometry.slitPositions(positions, config),
+        'ditherCoords(mm)': lambda: slitGeometry.ditherCoords(np.zeros(6), config, X=0.5, Y=-0.2),
+        'ditherCoords(pixels)': lambda: slitGeometry.ditherCoords(np.zeros(6), config, X=3, Y=1.5, unit='pixels'),
+        **wrapperCases(),
+    }
+
+
+def benchmark(cases, repeat=5):
+    """Return reference time and {name: best time per call}, in microseconds.
+
+    The reference workload is timed right before each measurement of each case, and the best of them is kept as the
+    reference for that case, so that ratios do not depend on how the machine speed drifts during the run.
+    """
+    reference = timeit.Timer(referenceWorkload)
+    referenceNumber, __ = reference.autorange()
+    referenceTimes, results = dict(), dict()
+
+    for name, func in cases.items():
+        timer = timeit.Timer(func)
+        number, __ = timer.autorange()
+        measures = [(reference.timeit(referenceNumber) / referenceNumber, timer.timeit(number) / number)
+                    for i in range(repeat)]
+
+        referenceTimes[name] = 1e6 * min(referenceTime for referenceTime, __ in measures)
+        results[name] = 1e6 * min(elapsed for __, elapsed in measures)
+
+    return referenceTimes, results
+
+
+def compare(ratios, baseline, threshold):
+    """Return (regressed, missing) : cases slower than threshold times their baseline, both relative to the
+    reference, and cases found in only one of ratios and baseline, which are therefore not gated."""
+    regressed = [name for name, ratio in ratios.items() if name in baseline and ratio > threshold * baseline[name]]
+    missing = sorted(set(ratios) ^ set(baseline))
+
+    return regressed, missing
+
+
+def main(makeCases, baselinePath, description):
+    """Time cases relative to the reference workload, compare them to baseline and exit with 1 if any regressed or
+    if cases and baseline do not match, unless saving a new baseline."""
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument('--repeat', type=int, default=5, help='number of measurements per case, best one is kept.')
+    parser.add_argument('--threshold', type=float, default=2.0, help='regression if slower than threshold*baseline.')
+    parser.add_argument('--baseline', type=str, default=baselinePath, help='baseline json file.')
+    parser.add_argument('--save', action='store_true', help='save results as the new baseline.')
+    args = parser.parse_args()
+
+    references, results = benchmark(makeCases(), args.repeat)
+    ratios = {name: elapsed / references[name] for name, elapsed in results.items()}
+    reference = min(references.values())
+
+    try:
+        with open(args.baseline) as baselineFile:
+            baseline = json.load(baselineFile)['ratios']
+    except FileNotFoundError:
+        baseline = dict()
+
+    regressions, missing = compare(ratios, baseline, args.threshold)
+
+    print(f'reference workload : {reference:.2f} us')
+    print(f'{"case":<45}{"current (us)":>15}{"baseline ratio":>16}{"current ratio":>15}{"change":>8}')
+    for name, ratio in ratios.items():
+        ref = baseline.get(name, np.nan)
+        flag = '  REGRESSION' if name in regressions else ''
+        print(f'{name:<45}{results[name]:>15.2f}{ref:>16.4f}{ratio:>15.4f}{ratio / ref:>8.2f}{flag}')
+
+    if args.save:
+        with open(args.baseline, 'w') as baselineFile:
+            json.dump(dict(machine=platform.machine(), python=platform.python_version(), numpy=np.__version__,
+                           reference=round(reference, 3),
+                           ratios={name: round(ratio, 5) for name, ratio in ratios.items()}),
+                      baselineFile, indent=2)
+        print(f'baseline saved to {args.baseline}')
+    elif regressions or missing:
+        if regressions:
+            print(f'{len(regressions)} case(s) slower than {args.threshold}x baseline')
+        if missing:
+            print(f'case(s) missing from either the run or the baseline, save a new baseline : {", ".join(missing)}')
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main(makeCases, baselinePath, description='Time slit motion profile and geometry, compare to baseline.')
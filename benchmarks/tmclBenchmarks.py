@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+
+import os
+from struct import pack
+
+import numpy as np
+from enuActor.drivers import rexm_drivers
+from enuActor.drivers.rexm_drivers import PACKET_SIZE, TMCM
+from slitBenchmarks import main, repeated
+
+baselinePath = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tmclBenchmarks.json')
+
+
+def legacyEncode(cmd, ctype, motorAddress, data):
+    """Removed sendPacket.cmdBytes, kept as a reference : numpy scalars, format parsed and checksum summed per call."""
+    values = np.uint8(TMCM.MODULE_ADDRESS), np.uint8(cmd), np.uint8(ctype), np.uint8(motorAddress), np.int32(data)
+    checksum = sum(pack('>BBBBi', *values)) % 256
+    return pack('>BBBBiB', *values, checksum)
+
+
+def statusReplies():
+    """Return the six replies of a status transaction, back-to-back as received from the controller."""
+    buffer = bytearray(6 * PACKET_SIZE)
+
+    for i, data in enumerate([0, 1, -1200, 6907, 1, 0]):
+        rexm_drivers.encodeInto(buffer, i * PACKET_SIZE, TMCM.TMCL_GAP, ctype=100, motorAddress=1, data=data,
+                                moduleAddress=2)
+
+    return buffer
+
+
+def makeCases():
+    """Return {name: callable}, each one timed independently."""
+    packet = bytearray(PACKET_SIZE)
+    replies = statusReplies()
+    view = memoryview(replies)
+
+    def decodeStatus():
+        return [rexm_drivers.decodeFrom(view, offset) for offset in range(0, len(view), PACKET_SIZE)]
+
+    # every case is well below a microsecond, they are timed in aggregate to keep the gate stable.
+    cases = {
+        'legacy encode(SAP)': lambda: legacyEncode(TMCM.TMCL_SAP, 4, 0, 1611),
+        'encode(SAP)': lambda: TMCM.sap(4, 1611),
+        'encodeInto(SAP)': lambda: rexm_drivers.encodeInto(packet, 0, TMCM.TMCL_SAP, 4, 0, 1611),
+        'cached query(GAP 3)': lambda: TMCM.gap(3),
+        'checksum': lambda: rexm_drivers.checksum(view),
+        'decodeFrom(1 reply)': lambda: rexm_drivers.decodeFrom(view),
+        'decodeFrom(status, 6 replies)': decodeStatus,
+    }
+
+    return {f'{name} x1000': repeated(func) for name, func in cases.items()}
+
+if __name__ == '__main__':
+    main(makeCases, baselinePath, description='Time TMCL packet encoding and decoding, compare to baseline.')
@@ -1,15 +1,14 @@
 #!/usr/bin/env python
 
 import argparse
-import datetime
 import os
 import time
 
-import pandas as pd
 from enuActor.drivers import hxp_drivers
+from enuActor.utils import slitRecording
 
 
-def recordSlitPosition(host, sampleTime, port=5001, rootDir='.'):
+def recordSlitPosition(host, sampleTime, port=5001, rootDir='.', gathering=False, divisor=1, csv=False):
     """
     This function records the slit position of a Hexapod for a given sample time.
 
@@ -18,17 +17,22 @@ def recordSlitPosition(host, sampleTime, port=5001, rootDir='.'):
     sampleTime (int or float): The duration for which the slit position needs to be recorded in seconds.
     port (int): The port number of the Hexapod. Default is 5001.
     rootDir (str): The root directory where the recorded data will be saved. Default is the current directory.
+    gathering (bool): Use the controller gathering instead of host polling. Default is False.
+    divisor (int): With gathering, sample every divisor servo cycles. Default is 1.
+    csv (bool): Also export the recording to csv. Default is False.
 
     Returns:
-    None
+    str: The path of the binary recording.
 
     Raises:
     RuntimeError: If the connection to the Hexapod fails.
 
-    The function records the slit position of the Hexapod for the given sample time at a frequency of 100 Hz.
-    The data is stored in a pandas DataFrame and saved as a CSV file in the specified root directory. The CSV file
-    name contains the Hexapod's IP address, the start time of the recording in ISO format without microseconds,
-    and the suffix '_slitPosition.csv'.
+    The function records the slit position of the Hexapod for the given sample time at a frequency of 100 Hz, or at
+    the servo rate / divisor with gathering, samples being then taken and timestamped by the controller.
+    Samples are streamed to an append-only binary file (see slitRecording.load), so memory stays constant whatever the
+    sample time. Columns are status,X,Y,Z,U,V,W,timestamp when polling. Gathering records the actuators instead, so
+    columns are then status,HEXAPOD.1,...,HEXAPOD.6,timestamp. The file name contains the spectrograph number, the
+    start time of the recording in ISO format without microseconds, and the suffix '_slitPosition.bin'.
     """
     xps = hxp_drivers.XPS()
     socketId = xps.TCP_ConnectToServer(host, port, 300)
@@ -36,38 +40,29 @@ def recordSlitPosition(host, sampleTime, port=5001, rootDir='.'):
     if socketId == -1:
         raise RuntimeError('Connection to Hexapod failed check IP & Port')
 
-    data = []
-    timestamp = []
-    start = time.time()
-
-    while (time.time() - start) < sampleTime:
-        s1 = time.time()
-        data.append(xps.GroupPositionCurrentGet(socketId, 'HEXAPOD', 6))
-        s2 = time.time()
-        timestamp.append(((s1 + s2) / 2))
-
-        time.sleep(0.01)
-
-    # cleaning socket in the end.
-    xps.TCP_CloseSocket(socketId)
-
-    df = pd.DataFrame(data, columns=['status', 'X', 'Y', 'Z', 'U', 'V', 'W'])
-    df['timestamp'] = timestamp
-
     try:
         specNum = int(host[-1])
     except:
         specNum = 0
 
-    # Convert it to datetime obje
-    dt_object = datetime.datetime.fromtimestamp(start)
-    # Convert datetime object to ISO format without microseconds
-    isoformat = dt_object.replace(microsecond=0).isoformat().replace(':', '-')
-    fileName = f'SM{specNum}_slitPosition_{isoformat}.csv'
+    filePath = os.path.join(rootDir, slitRecording.fileName(time.time(), specNum=specNum))
+    # gathering records the actuators positions, not the cartesian coordinates.
+    coordColumns = slitRecording.gatheringColumns(slitRecording.gatheringTypes) if gathering else None
+
+    try:
+        with slitRecording.SlitPositionWriter(filePath, coordColumns=coordColumns) as writer:
+            if gathering:
+                slitRecording.gatherSlitPosition(xps, socketId, sampleTime, writer, divisor=divisor)
+            else:
+                slitRecording.pollSlitPosition(xps, socketId, sampleTime, writer)
+    finally:
+        # cleaning socket in the end.
+        xps.TCP_CloseSocket(socketId)
 
-    filePath = os.path.join(rootDir, fileName)
+    if csv:
+        slitRecording.exportCsv(filePath)
 
-    df.to_csv(filePath)
+    return filePath
 
 
 if __name__ == '__main__':
@@ -79,8 +74,13 @@ if __name__ == '__main__':
     parser.add_argument('--port', type=int, default=5001, help='The port number of the Hexapod. Default is 5001.')
     parser.add_argument('--rootDir', type=str, default='.',
                         help='The root directory where the recorded data will be saved. Default is the current directory.')
+    parser.add_argument('--gathering', action='store_true',
+                        help='Record with the controller gathering at servo rate instead of polling at 100 Hz.')
+    parser.add_argument('--divisor', type=int, default=1,
+                        help='With --gathering, sample every divisor servo cycles. Default is 1.')
+    parser.add_argument('--csv', action='store_true', help='Also export the recording to csv.')
 
     args = parser.parse_args()
 
     # Call the recordSlitPosition function with the parsed arguments
-    recordSlitPosition(args.host, args.sampleTime, args.port, args.rootDir)
+    recordSlitPosition(args.host, args.sampleTime, args.port, args.rootDir, args.gathering, args.divisor, args.csv)
@@ -26,6 +26,8 @@ proc DisplayErrorAndClose {socketID code APIName} {
 			set tcl_argv(0) "$APIName ERROR => $code :  The TCP/IP connection was closed by an administrator"
 		} 
 	}
+	# report the error to the actor waiting for the registration
+	set code2 [catch {GlobalArraySet $socketID 0 $tcl_argv(0)}]
 	set code2 [catch "TCP_CloseSocket $socketID"] 
 	return
 }
@@ -57,5 +59,7 @@ for { set i 1 } { $i <= 6 } { incr i } {
 		DisplayErrorAndClose $socketID $code "GroupPositionCurrentGet" 
 		return 
 	} 	puts $fileID "$CurrentPosition" }# File closingclose $fileID
+# flag the registration as complete, the actor waits for it before powering off
+set code [catch "GlobalArraySet $socketID 0 registered"]
 # Close TCP socket 
 TCP_CloseSocket $socketID 
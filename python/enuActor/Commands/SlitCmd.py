@@ -1,6 +1,11 @@
 #!/usr/bin/env python
 
+import os
+import time
+
 import enuActor.Controllers.slit as slitCtrl
+import enuActor.utils.slitGeometry as slitGeometry
+import enuActor.utils.slitRecording as slitRecording
 import ics.utils.tcp.utils as tcpUtils
 import numpy as np
 import opscore.protocols.keys as keys
@@ -37,6 +42,14 @@ class SlitCmd(object):
             ('slit', 'dither [<X>] [<Y>] [@(pixels|microns)] [abs]', self.dither),
             ('slit', '@softwareLimits @(on|off) [@force]', self.hxpSoftwareLimits),
             ('slit', 'linearVerticalMove <expTime> [<pixelRange>]', self.linearVerticalMove),
+            ('slit', 'record <duration> [<divisor>] [@csv]', self.record),
+            ('slit', 'perf [@reset]', self.perf),
+            ('slit', 'estimate [<X>] [<Y>] [<Z>] [<U>] [<V>] [<W>] [abs]', self.estimate),
+            ('slit', 'sequence focus <offsets> [@(microns)] [@sync] [<timeout>]', self.focusSequence),
+            ('slit', 'sequence dither [<xOffsets>] [<yOffsets>] [@(pixels|microns)] [@sync] [<timeout>]',
+             self.ditherSequence),
+            ('slit', 'sequence next', self.sequenceNext),
+            ('slit', 'sequence stop', self.sequenceStop),
 
             ('slit', 'convert <X> <Y> <Z> <U> <V> <W>', self.convert),
             ('slit', 'stop', self.stop),
@@ -56,7 +69,14 @@ class SlitCmd(object):
                                         keys.Key('shift', types.Float(), help='move along shift axis'),
                                         keys.Key('expTime', types.Float(), help='expTime'),
                                         keys.Key('pixelRange', types.Float() * (1, 2),
-                                                 help='pixels array(start, stop )')
+                                                 help='pixels array(start, stop )'),
+                                        keys.Key('duration', types.Float(), help='recording duration in seconds'),
+                                        keys.Key('divisor', types.Int(), help='sample every divisor servo cycles'),
+                                        keys.Key('offsets', types.Float() * (1,), help='focus offsets'),
+                                        keys.Key('xOffsets', types.Float() * (1,), help='dither X offsets'),
+                                        keys.Key('yOffsets', types.Float() * (1,), help='dither Y offsets'),
+                                        keys.Key('timeout', types.Float(),
+                                                 help='maximum time waiting for sequence next in seconds')
                                         )
 
     @property
@@ -141,44 +161,25 @@ class SlitCmd(object):
     @blocking
     def dither(self, cmd):
         """Move wrt dither axis."""
-        focusAxis = np.array(self.config('focus_axis'), dtype=bool)
-        ditherXaxis = np.array(self.config('dither_x_axis'), dtype=bool)
-        ditherYaxis = np.array(self.config('dither_y_axis'), dtype=bool)
-
-        pix2mm = self.config('pix_to_mm')
-        pixToV = self.config('dither_xpix_to_v_angle')
-        radius = self.config('radius')
-
         cmdKeys = cmd.cmd.keywords
         reference = 'absolute' if 'abs' in cmdKeys else 'relative'
 
-        if not ('X' in cmdKeys or 'Y' in cmdKeys):
-            raise ValueError('X or Y at least needs to be specified')
-
-        coeffX, coeffY = 1, 1
-        coeffX, coeffY = pix2mm if 'pixels' in cmdKeys else [coeffX, coeffY]
-        coeffX, coeffY = [0.001, 0.001] if 'microns' in cmdKeys else [coeffX, coeffY]
+        coords = self.ditherCoords(cmdKeys, reference=reference)
 
-        coords = np.array([c for c in self.controller.coords], dtype=float) if reference == 'absolute' else np.zeros(6)
-        coords[ditherXaxis] = coeffX * cmdKeys['X'].values[0] if 'X' in cmdKeys else coords[ditherXaxis]
-        coords[ditherYaxis] = coeffY * cmdKeys['Y'].values[0] if 'Y' in cmdKeys else coords[ditherYaxis]
-
-        # overriding  with the new method (INSTRM-2575).
-        if 'pixels' in cmdKeys and 'X' in cmdKeys:
-            pixels = cmdKeys['X'].values[0]
-            V = pixels * pixToV
+        self.controller.substates.move(cmd, reference=reference, coords=coords)
+        self.controller.generate(cmd)
 
-            phi = np.deg2rad(-V)
-            X = radius * (np.cos(phi) - 1.0)
-            Z = radius * np.sin(phi)
+    def ditherCoords(self, cmdKeys, reference='relative'):
+        """Return coordinates to move to from dither command keywords."""
+        if not ('X' in cmdKeys or 'Y' in cmdKeys):
+            raise ValueError('X or Y at least needs to be specified')
 
-            # overriding coords.
-            coords[focusAxis] = X
-            coords[ditherXaxis] = Z
-            coords[4] = V
+        unit = 'pixels' if 'pixels' in cmdKeys else 'microns' if 'microns' in cmdKeys else 'mm'
+        X = cmdKeys['X'].values[0] if 'X' in cmdKeys else None
+        Y = cmdKeys['Y'].values[0] if 'Y' in cmdKeys else None
 
-        self.controller.substates.move(cmd, reference=reference, coords=coords)
-        self.controller.generate(cmd)
+        coords = np.array(self.controller.coords, dtype=float) if reference == 'absolute' else np.zeros(6)
+        return slitGeometry.ditherCoords(coords, self.actor.actorConfig['slit'], X=X, Y=Y, unit=unit)
 
     @threaded
     def getSystem(self, cmd):
@@ -296,13 +297,121 @@ class SlitCmd(object):
         self.controller.substates.move(cmd, reference='absolute', coords=startCoords)
         self.controller.generate(cmd, doFinish=False)
 
+        # trajectory accuracy suffers from motion kernel overload.
+        if self.controller.health is not None and self.controller.health.overloaded:
+            cmd.warn('text="hxp motion kernel overloaded, linear move accuracy might be degraded"')
+
+        # timeout is increased by the controller for that move only.
+        self.controller.substates.slide(cmd, speed=targetSpeed, startPosition=startPosition, coords=endCoords)
+        self.controller.generate(cmd)
+
+    @singleShot
+    def record(self, cmd):
+        """Record actuators position with the controller gathering, on its own socket so motions are not held."""
+        cmdKeys = cmd.cmd.keywords
+
+        duration = cmdKeys['duration'].values[0]
+        divisor = cmdKeys['divisor'].values[0] if 'divisor' in cmdKeys else 1
         try:
-            # temporary increasing timeout.
-            self.controller.myxps.hangLimit = round(totalMotion / targetSpeed) + 30
-            self.controller.substates.slide(cmd, speed=targetSpeed, startPosition=startPosition, coords=endCoords)
-            self.controller.generate(cmd)
+            rootDir = self.config('recordingRoot')
+        except KeyError:
+            rootDir = '/data/enu/slitPosition'
+
+        filePath = os.path.join(rootDir, slitRecording.fileName(time.time(), specNum=self.actor.ids.specNum))
+        cmd.inform(f'text="recording slit position for {duration:.1f}s ..."')
+
+        try:
+            socketId = self.controller.connectSock('recording')
+            coordColumns = slitRecording.gatheringColumns(slitRecording.gatheringTypes)
+            with slitRecording.SlitPositionWriter(filePath, coordColumns=coordColumns) as writer:
+                slitRecording.gatherSlitPosition(self.controller.myxps, socketId, duration, writer, divisor=divisor)
         finally:
-            self.controller.myxps.hangLimit = 45
+            self.controller.closeSock('recording')
+
+        if 'csv' in cmdKeys:
+            filePath = slitRecording.exportCsv(filePath)
+
+        cmd.finish(f'text="{writer.nSamples} samples recorded in {filePath}"')
+
+    def perf(self, cmd):
+        """Report hexapod calls latency percentiles (ms) and error counts per function and socket, reset if requested."""
+        perfStats = self.controller.perfStats
+
+        for funcName, sockName, count, mean, p50, p90, p99, maxi, errors in perfStats.summary():
+            latencies = ','.join(['%.3f' % (1000 * t) for t in [mean, p50, p90, p99, maxi]])
+            cmd.inform(f'slitPerf="{funcName}","{sockName}",{count},{latencies}')
+
+            for errorCode, nErrors in sorted(errors.items()):
+                cmd.inform(f'slitPerfErrors="{funcName}","{sockName}",{errorCode},{nErrors}')
+
+        if 'reset' in cmd.cmd.keywords:
+            perfStats.reset()
+            cmd.inform('text="hexapod perf stats reset"')
+
+        cmd.finish()
+
+    def estimate(self, cmd):
+        """Estimate move strategy, duration and timeout, relative by default, missing coordinates are not moved."""
+        cmdKeys = cmd.cmd.keywords
+        reference = 'absolute' if 'abs' in cmdKeys else 'relative'
+        current = self.controller.coords if reference == 'absolute' else 6 * [0.]
+        coords = [cmdKeys[c].values[0] if c in cmdKeys else current[i] for i, c in enumerate(self.coordsName)]
+
+        strategy, duration = self.controller.estimateMove(coords, reference=reference)
+        cmd.finish(f'slitMoveEstimate={strategy},{duration:.2f},{self.controller.moveTimeout(duration):.1f}')
+
+    @blocking
+    def focusSequence(self, cmd):
+        """Move through a list of absolute focus offsets back to back."""
+        cmdKeys = cmd.cmd.keywords
+        coeff = 0.001 if 'microns' in cmdKeys else 1
+        focusAxis = np.array(self.config('focus_axis'), dtype=bool)
+        offsets = np.array(cmdKeys['offsets'].values, dtype=float)
+
+        grid = np.tile(np.array(self.controller.coords, dtype=float), (len(offsets), 1))
+        grid[:, focusAxis] = coeff * offsets[:, None]
+
+        self.runSequence(cmd, grid)
+
+    @blocking
+    def ditherSequence(self, cmd):
+        """Move through a grid of absolute dither offsets back to back, X x Y if both are given."""
+        cmdKeys = cmd.cmd.keywords
+
+        if not ('xOffsets' in cmdKeys or 'yOffsets' in cmdKeys):
+            raise ValueError('xOffsets or yOffsets at least needs to be specified')
+
+        unit = 'pixels' if 'pixels' in cmdKeys else 'microns' if 'microns' in cmdKeys else 'mm'
+        xOffsets = cmdKeys['xOffsets'].values if 'xOffsets' in cmdKeys else [None]
+        yOffsets = cmdKeys['yOffsets'].values if 'yOffsets' in cmdKeys else [None]
+        current = np.array(self.controller.coords, dtype=float)
+
+        grid = np.array([slitGeometry.ditherCoords(current, self.actor.actorConfig['slit'], X=X, Y=Y, unit=unit)
+                         for X in xOffsets for Y in yOffsets])
+
+        self.runSequence(cmd, grid)
+
+    def runSequence(self, cmd, grid):
+        """Check the whole grid against the limits, then go through it in one SEQUENCING state."""
+        cmdKeys = cmd.cmd.keywords
+        sync = 'sync' in cmdKeys
+        timeout = cmdKeys['timeout'].values[0] if 'timeout' in cmdKeys else 600
+
+        self.controller.checkGridLimits(grid)
+        cmd.inform(f'text="running {len(grid)} steps slit sequence{" in sync mode" if sync else ""}..."')
+
+        self.controller.substates.sequence(cmd, grid=grid, sync=sync, timeout=timeout)
+        self.controller.generate(cmd)
+
+    def sequenceNext(self, cmd):
+        """Release the next step of a sync sequence, typically once the exposure is over."""
+        self.controller.nextSequenceStep()
+        cmd.finish()
+
+    def sequenceStop(self, cmd):
+        """Stop the running sequence before its next step."""
+        self.controller.stopSequence()
+        cmd.finish('text="slit sequence stopping..."')
 
     def abort(self, cmd):
         """Stop current motion."""
@@ -320,9 +429,16 @@ class SlitCmd(object):
     @singleShot
     def stop(self, cmd):
         """Stop current motion, save hexapod position, power off hxp controller and disconnect."""
-        self.controller.substates.shutdown()
+        controller = self.controller
+        controller.substates.shutdown()
 
         self.actor.disconnect('slit', cmd=cmd)
+
+        # cutting power before the registration file is closed would lose the hexapod position.
+        if not controller.positionRegistered:
+            cmd.fail('text="hexapod position registration not confirmed, hxp controller left powered on"')
+            return
+
         self.actor.powerSwitch('slit', state='off', cmd=cmd)
 
         cmd.finish()
@@ -2,23 +2,31 @@ __author__ = 'alefur'
 
 import copy
 import logging
+import socket
 import time
+from collections import namedtuple
 from importlib import reload
 
 import enuActor.Simulators.rexm as simulator
 import ics.utils.tcp.bufferedSocket as bufferedSocket
 import ics.utils.time as pfsTime
 import numpy as np
-from enuActor.drivers.rexm_drivers import recvPacket, TMCM
+from enuActor.drivers.rexm_drivers import PACKET_SIZE, TMCM, decodeFrom
 from ics.utils.fsm.fsmThread import FSMThread
 
 reload(simulator)
 
+# one batched status query, speed in step/sec, steps in full steps.
+RexmStatus = namedtuple('RexmStatus', ['switchA', 'switchB', 'speed', 'steps', 'emergencyButton', 'emergencyFlag'])
+
 
 class rexm(FSMThread, bufferedSocket.EthComm):
     travellingTimeout = 150
     stoppingTimeout = 5
     startingTimeout = 3
+    replyTimeout = 2
+    # replies are not throttled anymore, keep the controller from being polled continuously while moving.
+    pollPeriod = 0.01
 
     switch = {(1, 0): 'low', (0, 1): 'med', (0, 0): 'undef', (1, 1): 'error'}
     toPos = {0: 'low', 1: 'med'}
@@ -175,8 +183,9 @@ class rexm(FSMThread, bufferedSocket.EthComm):
 
         :param cmd: current command.
         """
-        self.checkSafeStop(cmd)
-        self.checkStatus(cmd)
+        status = self._getStatus(cmd)
+        self.checkSafeStop(cmd, status=status)
+        self.checkStatus(cmd, status=status)
 
     def stopMotion(self, cmd, forceStop=False):
         """Abort current motion and retry until speed=0.
@@ -240,22 +249,25 @@ class rexm(FSMThread, bufferedSocket.EthComm):
         time.sleep(5)
         self.stopMotion(cmd, forceStop=True)
 
-    def checkStatus(self, cmd, genKeys=True):
+    def checkStatus(self, cmd, genKeys=True, status=None):
         """Check current status and generate rexm and rexmInfo keywords.
 
         :param cmd: current command.
+        :param status: status already queried, queried in a single transaction if None.
+        :type status: RexmStatus
         :raise: Exception with warning message.
         """
         try:
-            self.switchA = self._getAxisParameter(paramId=11, cmd=cmd)
-            self.switchB = self._getAxisParameter(paramId=10, cmd=cmd)
-            self.speed = self._getSpeed(cmd=cmd)
-            self.steps = self._getSteps(cmd=cmd)
-
+            status = self._getStatus(cmd) if status is None else status
         except:
             cmd.warn('rexm=undef')
             raise
 
+        self.switchA = status.switchA
+        self.switchB = status.switchB
+        self.speed = status.speed
+        self.steps = status.steps
+
         if not genKeys and (time.time() - self.last) < 2:
             return
 
@@ -294,14 +306,17 @@ class rexm(FSMThread, bufferedSocket.EthComm):
         if not (TMCM.SPEED_MIN <= speed <= TMCM.SPEED_MAX):
             raise ValueError(f'{speed} out of range : {TMCM.SPEED_MIN} <= speed <= {TMCM.SPEED_MAX}')
 
-    def checkSafeStop(self, cmd):
+    def checkSafeStop(self, cmd, status=None):
         """Check emergency button and emergency flag. generate rexmStop keyword.
 
         :param cmd: current command.
+        :param status: status already queried, queried in a single transaction if None.
+        :type status: RexmStatus
         :raise: Exception with warning message.
         """
-        buttonState = self._getEmergencyButtonState(cmd=cmd)
-        flagState = self._getEmergencyFlag(cmd=cmd)
+        status = self._getStatus(cmd) if status is None else status
+        buttonState = status.emergencyButton
+        flagState = status.emergencyFlag
 
         cmd.inform('rexmStop=%d,%d' % (buttonState, flagState))
 
@@ -419,6 +434,8 @@ class rexm(FSMThread, bufferedSocket.EthComm):
                 if self.abortMotion:
                     raise UserWarning('Abort motion requested')
 
+                time.sleep(rexm.pollPeriod)
+
         except:
             self.stopMotion(cmd, forceStop=True)
             raise
@@ -516,7 +533,7 @@ class rexm(FSMThread, bufferedSocket.EthComm):
         :raise: Exception with warning message.
         """
         ustep = self._getAxisParameter(1, cmd=cmd)  # get microstep count
-        return int(round(ustep / (2 ** self.stepIdx)))
+        return self._ustepToSteps(ustep)
 
     def _getSpeed(self, cmd=None):
         """Get current speed.
@@ -525,8 +542,43 @@ class rexm(FSMThread, bufferedSocket.EthComm):
         :raise: Exception with warning message.
         """
         velocity = self._getAxisParameter(paramId=3, cmd=cmd)
+        return self._velocityToSpeed(velocity)
+
+    def _ustepToSteps(self, ustep):
+        """Convert microstep count to step count.
+
+        :param ustep: microstep count.
+        :type ustep: int
+        """
+        return int(round(ustep / (2 ** self.stepIdx)))
+
+    def _velocityToSpeed(self, velocity):
+        """Convert controller velocity to speed in step/sec.
+
+        :param velocity: actual velocity as reported by the controller.
+        :type velocity: int
+        """
         return int(round(velocity / (2 ** (self.pulseDivisor + self.stepIdx) * (65536 / 16e6))))  # speed in step/sec
 
+    def _getStatus(self, cmd=None):
+        """Get limit switches, speed, step count, emergency button and flag in a single transaction.
+
+        :param cmd: current command.
+        :return: current status.
+        :rtype: RexmStatus
+        :raise: Exception with warning message.
+        """
+        switchA, switchB, velocity, ustep, notButton, flag = self.sendCommands(TMCM.gap(paramId=11),
+                                                                              TMCM.gap(paramId=10),
+                                                                              TMCM.gap(paramId=3),
+                                                                              TMCM.gap(paramId=1),
+                                                                              TMCM.gio(paramId=10, motorAddress=0),
+                                                                              TMCM.ggp(paramId=11, motorAddress=2),
+                                                                              cmd=cmd)
+
+        return RexmStatus(switchA=switchA, switchB=switchB, speed=self._velocityToSpeed(velocity),
+                          steps=self._ustepToSteps(ustep), emergencyButton=not int(notButton), emergencyFlag=flag)
+
     def _setSpeed(self, speedMm, cmd=None):
         """Set motor speed.
 
@@ -644,9 +696,23 @@ class rexm(FSMThread, bufferedSocket.EthComm):
         :type doClose: bool
         :return: response decoded
         """
+        reply, = self.sendCommands(cmdBytes, doClose=doClose, cmd=cmd)
+        return reply
+
+    def sendCommands(self, *cmdBytes, doClose=False, cmd=None):
+        """Send TMCL packets back-to-back to rexm controller, then read the replies in order.
+
+        :param cmdBytes: bytes to send, one packet per argument.
+        :param doClose: close socket.
+        :param cmd: current command.
+        :type cmdBytes: bytes
+        :type doClose: bool
+        :return: responses decoded, in the same order.
+        :raise: RuntimeError if any reply has a wrong checksum or an error status.
+        """
         if cmd is None:
             cmd = self.actor.bcast
-        if len(cmdBytes) != 9:
+        if any(len(packet) != PACKET_SIZE for packet in cmdBytes):
             raise ValueError('cmdStr is badly formatted')
 
         self.logger.debug('sending %r', cmdBytes)
@@ -654,35 +720,71 @@ class rexm(FSMThread, bufferedSocket.EthComm):
         s = self.connectSock()
 
         try:
-            s.sendall(cmdBytes)
+            s.sendall(b''.join(cmdBytes))
         except:
             self.closeSock()
             raise
 
-        reply = self.getOneResponse(sock=s, cmd=cmd)
+        # read every reply before checking any, so that the next transaction starts on a clean stream.
+        packets = memoryview(bytearray(len(cmdBytes) * PACKET_SIZE))
+        self._recvInto(sock=s, view=packets)
+        replies = [self._decodePacket(packets, offset) for offset in range(0, len(packets), PACKET_SIZE)]
 
         if doClose:
             self.closeSock()
 
-        return reply
+        return replies
 
-    def getOneResponse(self, sock=None, cmd=None):
-        """Attempt to receive data from the socket.
+    def _recvInto(self, sock, view):
+        """Fill view with incoming bytes, waiting at most replyTimeout.
 
         :param sock: socket.
-        :param cmd: command.
-        :return: reply : the single response string, with EOLs stripped.
-        :raise: IOError : from any communication errors.
+        :param view: writable memoryview, one or several packets long.
+        :raise: socket.timeout if view is not filled within replyTimeout.
+        :raise: ConnectionError if the connection has been closed.
+        """
+        received = 0
+
+        timeout = sock.gettimeout()
+        deadline = time.time() + rexm.replyTimeout
+
+        try:
+            while received < len(view):
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    raise socket.timeout(f'rexm reply incomplete after {rexm.replyTimeout}s : '
+                                         f'{received}/{len(view)} bytes')
+
+                sock.settimeout(remaining)
+                nbytes = sock.recv_into(view[received:])
+
+                if not nbytes:
+                    raise ConnectionError('rexm controller closed the connection')
+
+                received += nbytes
+        except:
+            # a partial reply would shift all the following ones, start over from a new connection.
+            self.closeSock()
+            raise
+
+        sock.settimeout(timeout)
+
+    def _decodePacket(self, buffer, offset=0):
+        """Check reply checksum and status, return reply data.
+
+        :param buffer: received bytes.
+        :param offset: reply offset in buffer.
+        :return: reply data.
+        :raise: RuntimeError if checksum is wrong or status reports an error.
         """
-        time.sleep(0.05)
-        if sock is None:
-            sock = self.connectSock()
+        try:
+            replyAddress, moduleAddress, status, cmd, reply = decodeFrom(buffer, offset)
+        except ValueError:
+            raise RuntimeError('wrong checksum in rexm reply')
 
-        ret = recvPacket(sock.recv(9))
-        if ret.status != 100:
-            raise RuntimeError(TMCM.controllerStatus[ret.status])
+        if status != 100:
+            raise RuntimeError(TMCM.controllerStatus[status])
 
-        reply = ret.data
         self.logger.debug('received %r', reply)
 
         return reply
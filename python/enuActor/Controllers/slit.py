@@ -1,7 +1,9 @@
 __author__ = 'alefur'
 
+import contextlib
 import logging
 import socket
+import threading
 import time
 from importlib import reload
 
@@ -9,53 +11,48 @@ import enuActor.Simulators.slit as simulator
 import ics.utils.time as pfsTime
 import numpy as np
 from enuActor.drivers import hxp_drivers
+from enuActor.utils import slitGeometry, slitMotionProfile, slitRecording
+from enuActor.utils.perfStats import PerfStats
+from enuActor.utils.slitHealth import HealthMonitor
+from enuActor.utils.slitTelemetry import SlitTelemetry
 from ics.utils.fsm.fsmThread import FSMThread
-from twisted.internet import reactor
 
 reload(simulator)
 
 
 class slit(FSMThread):
     timeout = 2
+    # axis displacement below which an axis is considered not moving, so keeping its last approach direction.
+    approachTolerance = 1e-5
+    # adaptive move timeout, moveTimeoutFactor * estimated duration + moveTimeoutOffset in seconds.
+    moveTimeoutFactor = 2
+    moveTimeoutOffset = 10
+    # KillWithRegistration completion is polled every shutdownPollPeriod, up to shutdownTimeout seconds.
+    shutdownPollPeriod = 0.2
+    shutdownTimeout = 30
+    # global array element KillWithRegistration.tcl sets once the registration file is closed, see hexapod/.
+    registrationFlag = 0
+    registrationPending = 'pending'
+    registrationDone = 'registered'
+    # without the flag, the registration is considered complete registrationDelay after the kill : the script waits
+    # 2s then writes the current positions. A flag still pending registrationTimeout after the kill means an older
+    # script which never sets it.
+    registrationDelay = 5
+    registrationTimeout = 10
+    # coordinate systems and home position closer than that are considered already set.
+    initTolerance = 1e-5
 
     @staticmethod
     def convertToWorld(array):
-        def degToRad(deg):
-            return 2 * np.pi * deg / 360
-
-        [X, Y, Z, U, V, W] = array
-        x = X * np.cos(degToRad(W)) - Y * np.sin(degToRad(W))
-        y = X * np.sin(degToRad(W)) + Y * np.cos(degToRad(W))
+        """Rotate X, Y by W, see slitGeometry for (N, 6) arrays."""
+        [[x, y, Z, U, V, W]] = slitGeometry.convertToWorld(array)
         return [round(x, 5), round(y, 5), float(Z), float(U), float(V), float(W)]
 
     @staticmethod
     def slitPosition(coords, config):
-        """Interpret slit position from current coordinates."""
-        # consider any nans or angle out of tolerance as undef.
-        if any(np.isnan(coords)) or np.max(np.abs(coords[3:])) > config['positionTolerance']:
-            return 'undef'
-
-        # eerk
-        [xPixToMm, yPixToMm] = config['pix_to_mm']
-
-        posStr = []
-
-        [focus, ditherY, ditherX, _, _, _] = coords
-        if abs(focus) > config['positionTolerance']:
-            sign = '+' if focus > 0 else '-'
-            posStr.append(f'focus{sign}{round(abs(focus), 2)}mm')
-        if abs(ditherX) > config['positionTolerance']:
-            sign = '+' if ditherX > 0 else '-'
-            posStr.append(f'ditherFib{sign}{round(abs(ditherX) / xPixToMm, 1)}pix')
-        if abs(ditherY) > config['positionTolerance']:
-            sign = '+' if ditherY > 0 else '-'
-            posStr.append(f'ditherWav{sign}{round(abs(ditherY) / yPixToMm, 1)}pix')
-
-        if posStr:
-            # format correctly with space.
-            return f'''"{' '.join(posStr)}"'''
-        else:
-            return 'home'
+        """Interpret slit position from current coordinates, see slitGeometry for (N, 6) arrays."""
+        [position] = slitGeometry.slitPositions(coords, config)
+        return position
 
     def __init__(self, actor, name, loglevel=logging.DEBUG):
         """This sets up the connections to/from the hub, the logger, and the twisted reactor.
@@ -64,11 +61,12 @@ class slit(FSMThread):
         :param name: controller name.
         :type name: str
         """
-        substates = ['IDLE', 'MOVING', 'SLIDING', 'SHUTDOWN', 'FAILED']
+        substates = ['IDLE', 'MOVING', 'SLIDING', 'SEQUENCING', 'SHUTDOWN', 'FAILED']
         events = [{'name': 'move', 'src': 'IDLE', 'dst': 'MOVING'},
                   {'name': 'slide', 'src': 'IDLE', 'dst': 'SLIDING'},
-                  {'name': 'idle', 'src': ['MOVING', 'SLIDING', 'SHUTDOWN'], 'dst': 'IDLE'},
-                  {'name': 'fail', 'src': ['MOVING', 'SLIDING', 'SHUTDOWN'], 'dst': 'FAILED'},
+                  {'name': 'sequence', 'src': 'IDLE', 'dst': 'SEQUENCING'},
+                  {'name': 'idle', 'src': ['MOVING', 'SLIDING', 'SEQUENCING', 'SHUTDOWN'], 'dst': 'IDLE'},
+                  {'name': 'fail', 'src': ['MOVING', 'SLIDING', 'SEQUENCING', 'SHUTDOWN'], 'dst': 'FAILED'},
                   {'name': 'shutdown', 'src': ['IDLE'], 'dst': 'SHUTDOWN'},
                   ]
 
@@ -76,6 +74,7 @@ class slit(FSMThread):
 
         self.addStateCB('MOVING', self.moving)
         self.addStateCB('SLIDING', self.sliding)
+        self.addStateCB('SEQUENCING', self.sequencing)
 
         self.sim = simulator.SlitSim()
 
@@ -84,7 +83,29 @@ class slit(FSMThread):
         self.myxps = None
         self.socks = {'main': -1,
                       'emergency': -1,
-                      'slitPosition': -1}
+                      'recording': -1,
+                      'telemetry': -1,
+                      'health': -1}
+        # error and status strings are static, loaded once at connection.
+        self.hxpErrorStrings = dict()
+        self.hxpStatusStrings = dict()
+        # per actuator (velocity, acceleration, jerkTime) used to estimate move durations, loaded once at connection.
+        self.sgammaParameters = dict()
+        # latency and error codes of every call to the controller.
+        self.perfStats = PerfStats()
+        # direction of the last motion per axis, 0 if unknown.
+        self.lastApproach = np.zeros(6)
+        # optional background position and status sampling, see _loadCfg.
+        self.telemetry = None
+        # controller health, sampled at a low rate.
+        self.health = None
+        # end of the last command which may have changed position or status, older telemetry is obsolete.
+        self.lastCommandEnd = 0
+        # sequence synchronization, set by slit sequence next|stop.
+        self.sequenceNext = threading.Event()
+        self.sequenceStopped = False
+        # set once KillWithRegistration has confirmed the position file is written and closed.
+        self.positionRegistered = False
 
         self.logger = logging.getLogger(self.name)
         self.logger.setLevel(loglevel)
@@ -135,6 +156,26 @@ class slit(FSMThread):
             self.softwareLimitsActivated = self.controllerConfig['activateSoftwareLimits']
         except:
             self.softwareLimitsActivated = True
+        # controller event signaling that the slit is at speed.
+        try:
+            self.atSpeedTrigger = self.controllerConfig['atSpeedTrigger']
+        except:
+            self.atSpeedTrigger = f'{self.groupName}.SGamma.ConstantVelocityStart'
+        # telemetry sampling period in seconds, disabled if None.
+        try:
+            self.telemetryPeriod = self.controllerConfig['telemetryPeriod']
+        except:
+            self.telemetryPeriod = None
+        # largest distance in mm between the work origin and the hexapod upper joints, bounds actuators displacement.
+        try:
+            self.jointRadius = self.controllerConfig['jointRadius']
+        except:
+            self.jointRadius = 150
+        # health sampling period in seconds, disabled if 0.
+        try:
+            self.healthPeriod = self.controllerConfig['healthPeriod']
+        except:
+            self.healthPeriod = 60
 
     def _openComm(self, cmd):
         """Open socket slit hexapod controller or simulate it.
@@ -146,14 +187,107 @@ class slit(FSMThread):
         self.connectSock(sockName='main')
         self.connectSock(sockName='emergency')
 
+        self._loadStringTables()
+        self._loadSGammaParameters(cmd)
+
+        if self.telemetryPeriod:
+            self.telemetry = SlitTelemetry(self._sampleTelemetry, self.telemetryPeriod).start()
+
+        if self.healthPeriod:
+            self.health = HealthMonitor(self._sampleHealth, self.healthPeriod,
+                                        correctorPeriod=1 / slitRecording.servoRate,
+                                        onOverload=self._reportOverload).start()
+
+    def _loadStringTables(self):
+        """Download error and status strings tables, so that codes are translated without any round trip.
+
+        Tables are optional, unknown codes being queried live anyway.
+        """
+        try:
+            errorList, statusList = self.batchErrorChecker((self.myxps.ErrorListGet,),
+                                                           (self.myxps.GroupStatusListGet,))
+        except Exception as e:
+            self.logger.warning(f'could not load hxp strings tables : {e}')
+            return
+
+        self.hxpErrorStrings.update(slit.parseCodeList(errorList))
+        self.hxpStatusStrings.update(slit.parseCodeList(statusList))
+
+    def _loadSGammaParameters(self, cmd):
+        """Download SGamma and maximum velocity and acceleration parameters of every actuator in a single round trip.
+
+        Hexapod moves are planned in actuator space, so the parameters are the ones of the HEXAPOD.1..6 positioners.
+        Parameters are optional, move durations are simply not estimated without them.
+
+        :param cmd: current command.
+        """
+        positioners = [f'{self.groupName}.{actuator}' for actuator in range(1, 7)]
+        calls = [(self.myxps.PositionerSGammaParametersGet, positioner) for positioner in positioners]
+        calls += [(self.myxps.PositionerMaximumVelocityAndAccelerationGet, positioner) for positioner in positioners]
+
+        self.sgammaParameters.clear()
+
+        try:
+            replies = self.batchErrorChecker(*calls)
+        except Exception as e:
+            self.logger.exception('could not load hxp SGamma parameters')
+            cmd.warn(f'text="could not load hxp SGamma parameters, move durations will not be estimated : {e}"')
+            return
+
+        for positioner, sgamma, maximums in zip(positioners, replies[:6], replies[6:]):
+            [velocity, acceleration, minJerkTime, maxJerkTime] = sgamma
+            [maxVelocity, maxAcceleration] = maximums
+            # longest jerk time, so that the estimate is an upper bound.
+            self.sgammaParameters[positioner] = (min(velocity, maxVelocity), min(acceleration, maxAcceleration),
+                                                 maxJerkTime)
+
+    @staticmethod
+    def parseCodeList(codeList):
+        """Parse a 'code : text' list, as returned by ErrorListGet and GroupStatusListGet.
+
+        :param codeList: entries separated by ';' or newlines.
+        :type codeList: str
+        :return: {code: text}, entries which cannot be parsed are skipped.
+        :rtype: dict
+        """
+        table = dict()
+
+        for entry in codeList.replace('\n', ';').split(';'):
+            code, sep, text = entry.partition(':')
+            try:
+                table[int(code)] = text.strip()
+            except ValueError:
+                continue
+
+        return table
+
     def _closeComm(self, cmd):
         """Close socket.
 
         :param cmd: current command.
         """
+        if self.telemetry is not None:
+            self.telemetry.stop()
+            self.telemetry = None
+            self.closeSock(sockName='telemetry')
+
+        if self.health is not None:
+            self.health.stop()
+            self.health = None
+            self.closeSock(sockName='health')
+
         self.closeSock(sockName='main')
         self.closeSock(sockName='emergency')
 
+    def _sampleTelemetry(self):
+        """Get current position and status code, pipelined on telemetry socket.
+
+        :return: position [x, y, z, u, v, w], status code.
+        :rtype: tuple
+        """
+        return tuple(self.batchErrorChecker((self.myxps.GroupPositionCurrentGet, self.groupName, 6),
+                                            (self.myxps.GroupStatusGet, self.groupName), sockName='telemetry'))
+
     def _testComm(self, cmd):
         """Test communication.
 
@@ -179,7 +313,9 @@ class slit(FSMThread):
         # Make sure that the outside world knows that the axis positions are soon to be invalid.
         # There are many failures out of the loop, so declare now.
         self.declareNewHexapodPosition(cmd, invalid=True)
+        self.lastApproach[:] = 0
 
+        skipped = []
         hxpStatus = int(self._getHxpStatus())
         if doHome:
             cmd.inform('text="killing existing socket..."')
@@ -198,6 +334,7 @@ class slit(FSMThread):
 
             elif hxpStatus in [10, 11, 12, 13, 14, 15, 16, 17, 18]:
                 cmd.inform('text="hxp is ready..."')
+                skipped.append('initialize')
 
             elif hxpStatus == 20:
                 self.motionEnable(cmd=cmd)
@@ -205,17 +342,36 @@ class slit(FSMThread):
             else:
                 raise RuntimeError('hxp needs to be fully initialize')
 
-        self._hexapodCoordinateSysSet('Work', self.workSystem)
-        self.getSystem(cmd, 'Work')
-
-        self._hexapodCoordinateSysSet('Tool', self.toolSystem)
-        self.getSystem(cmd, 'Tool')
+        # current systems, status and position in a single round trip.
+        work, tool, hxpStatus, position = self.batchErrorChecker(
+            (self.myxps.HexapodCoordinateSystemGet, self.groupName, 'Work'),
+            (self.myxps.HexapodCoordinateSystemGet, self.groupName, 'Tool'),
+            (self.myxps.GroupStatusGet, self.groupName),
+            (self.myxps.GroupPositionCurrentGet, self.groupName, 6))
+
+        for system, current, target in [('Work', work, self.workSystem), ('Tool', tool, self.toolSystem)]:
+            if np.allclose(current, target, rtol=0, atol=slit.initTolerance):
+                skipped.append(f'set{system}')
+                self._updateSystem(cmd, system, current)
+            else:
+                self._hexapodCoordinateSysSet(system, target)
+                self.getSystem(cmd, system)
 
-        if int(self._getHxpStatus()) not in [10, 11, 12, 13, 14, 15, 16, 17, 18]:
+        if int(hxpStatus) not in [10, 11, 12, 13, 14, 15, 16, 17, 18]:
             raise RuntimeError('hexapod not in ready state, going home aborted ...')
 
-        cmd.inform('text="going to home ..."')
-        self._hexapodMoveAbsolute([0, 0, 0, 0, 0, 0])
+        # position is tool in work, only meaningful if none of them has been changed in between.
+        self.coords = position if {'setWork', 'setTool'}.issubset(skipped) else [np.nan] * 6
+
+        if np.allclose(self.coords, 0, rtol=0, atol=slit.initTolerance):
+            skipped.append('goHome')
+        else:
+            cmd.inform('text="going to home ..."')
+            self._hexapodMoveAbsolute([0, 0, 0, 0, 0, 0])
+
+        if skipped:
+            cmd.inform(f'text="slit init skipped : {",".join(skipped)}"')
+
         self.doPersist = True
 
     def getStatus(self, cmd):
@@ -223,18 +379,30 @@ class slit(FSMThread):
 
         :param cmd: current command.
         """
-        self.checkPosition(cmd=cmd)
-        self.checkStatus(cmd=cmd)
+        hxpStatus = self.checkPosition(cmd=cmd, withStatus=True)
+        self.checkStatus(cmd=cmd, hxpStatus=hxpStatus)
+        self.genHealthKeys(cmd)
 
-    def checkPosition(self, cmd):
+    def checkPosition(self, cmd, withStatus=False):
         """Get 6-tuple current coordinates, generate slit and slitPosition keywords.
 
         :param cmd: current command.
+        :param withStatus: if true, hexapod status is also retrieved within the same round trip.
+        :type withStatus: bool
+        :return: hexapod status code if withStatus.
         """
         self.coords = [np.nan] * 6
+        hxpStatus = None
+        snapshot = self._telemetrySnapshot()
 
         try:
-            self.coords = self._getCurrentPosition()
+            if snapshot is not None:
+                self.coords, hxpStatus = list(snapshot.coords), snapshot.hxpStatus
+            elif withStatus:
+                self.coords, hxpStatus = self._getCurrentPositionAndStatus()
+            else:
+                self.coords = self._getCurrentPosition()
+
             self.declareNewHexapodPosition(cmd)
 
         finally:
@@ -242,7 +410,56 @@ class slit(FSMThread):
             genKeys('slit=%s' % ','.join(['%.5f' % p for p in self.coords]))
             genKeys('slitPosition=%s' % self.slitPosition(self.coords, config=self.controllerConfig))
 
-    def checkStatus(self, cmd, sockName='main'):
+        return hxpStatus
+
+    def _sampleHealth(self):
+        """Get controller health in a single round trip on health socket, kernel min/max periods are reset after.
+
+        :return: (temperature, fan speed), kernel loads, kernel min/max periods, voltages, ''.
+        :rtype: list
+        """
+        return self.batchErrorChecker((self.myxps.CPUTemperatureAndFanSpeedGet,),
+                                      (self.myxps.ControllerMotionKernelTimeLoadGet,),
+                                      (self.myxps.ControllerMotionKernelPeriodMinMaxGet,),
+                                      (self.myxps.CPUCoreAndBoardSupplyVoltagesGet,),
+                                      (self.myxps.ControllerMotionKernelPeriodMinMaxReset,), sockName='health')
+
+    def _reportOverload(self, overloaded, sample):
+        """Broadcast motion kernel overload as soon as it changes, from the health thread."""
+        genKeys = self.actor.bcast.warn if overloaded else self.actor.bcast.inform
+        genKeys(f'hxpOverload={overloaded}')
+
+    def genHealthKeys(self, cmd):
+        """Generate controller health keywords, summarized over the health history.
+
+        :param cmd: current command.
+        """
+        if self.health is None:
+            return
+
+        summary = self.health.summary()
+        if summary is None:
+            return
+
+        temperature, temperatureMax, fanSpeed, loadMean, loadMax, correctorPeriodMax, nOverloaded, nSamples = summary
+        cmd.inform(f'hxpHealth={temperature:.1f},{temperatureMax:.1f},{fanSpeed:.0f},{loadMean:.3f},{loadMax:.3f},'
+                   f'{correctorPeriodMax * 1e6:.1f},{nOverloaded},{nSamples}')
+        cmd.inform('hxpVoltages=%s' % ','.join(['%.3f' % v for v in self.health.latest.voltages]))
+
+        genKeys = cmd.warn if self.health.overloaded else cmd.inform
+        genKeys(f'hxpOverload={self.health.overloaded}')
+
+    def _telemetrySnapshot(self):
+        """Return telemetry snapshot if fresh, taken after the last command and within two sampling periods.
+
+        :return: latest snapshot, None if telemetry is disabled or data is stale.
+        """
+        if self.telemetry is None:
+            return None
+
+        return self.telemetry.snapshot(maxAge=2 * self.telemetryPeriod, since=self.lastCommandEnd)
+
+    def checkStatus(self, cmd, sockName='main', hxpStatus=None):
         """
         Retrieve and report the current status of the hexapod controller.
 
@@ -257,8 +474,10 @@ class slit(FSMThread):
             Command object used to report status back to the user.
         sockName : str, optional
             Socket name to use for communication with the controller (default: 'main').
+        hxpStatus : int, optional
+            Status code already retrieved, queried from the controller if None.
         """
-        hxpStatus = self._getHxpStatus(sockName=sockName)
+        hxpStatus = self._getHxpStatus(sockName=sockName) if hxpStatus is None else hxpStatus
         cmd.inform('hxpStatus=%d,"%s"' % (int(hxpStatus), self._getHxpStatusString(hxpStatus, sockName=sockName)))
         cmd.inform(f'hxpSoftwareLimits={self.hxpSoftwareLimits}')
 
@@ -277,53 +496,280 @@ class slit(FSMThread):
             if reference == 'absolute':
                 # First check if desired position is within range.
                 self._checkHexaLimits(coords)
-                # Then move to the desired position + the hysteresis correction.
-                self._hexapodMoveAbsolute(np.array(coords) + self.hysteresisCorrection)
-                self.checkPosition(cmd)
-                # then move to the desired position.
-                return self._hexapodMoveAbsolute(coords)
+                strategy, duration = self.estimateMove(coords)
+                cmd.inform(f'slitMoveEstimate={strategy},{duration:.2f},{self.moveTimeout(duration):.1f}')
+                return self._moveAbsolute(cmd, coords, strategy)
             else:
-                return self._hexapodMoveIncremental('Work', coords)
+                strategy, duration = self.estimateMove(coords, reference='relative')
+                cmd.inform(f'slitMoveEstimate={strategy},{duration:.2f},{self.moveTimeout(duration):.1f}')
+                ret = self._hexapodMoveIncremental('Work', coords)
+                self._updateLastApproach(coords)
+                return ret
+
         except UserWarning:
             self.doPersist = False
+            self.lastApproach[:] = 0
             raise
 
+        except Exception:
+            self.lastApproach[:] = 0
+            raise
+
+    def _moveAbsolute(self, cmd, coords, strategy, doCheckPosition=True):
+        """Move to coords, through coords + hysteresisCorrection first if strategy is 'hysteresis'.
+
+        :param cmd: current command.
+        :param coords: [x, y, z, u, v, w].
+        :param strategy: 'direct' or 'hysteresis', see _approachStrategy.
+        :param doCheckPosition: generate slit keywords after the hysteresis pre-move.
+        :raise: Exception with warning message.
+        """
+        start = None
+
+        if strategy == 'hysteresis':
+            # Then move to the desired position + the hysteresis correction.
+            start = np.array(coords) + self.hysteresisCorrection
+            self._hexapodMoveAbsolute(start)
+            # final leg being opposite to the correction.
+            motion = -self.hysteresisCorrection
+            if doCheckPosition:
+                self.checkPosition(cmd)
+        else:
+            motion = np.array(coords) - np.array(self.coords)
+
+        # then move to the desired position, coming from the pre-move target whether coords were refreshed or not.
+        ret = self._hexapodMoveAbsolute(coords, start=start)
+        self._updateLastApproach(motion)
+
+        return ret
+
+    def _approachStrategy(self, coords):
+        """Return 'direct' if every hysteresis corrected axis would end up approached from the correction side, coming
+        from the current position, 'hysteresis' if a pre-move to coords + hysteresisCorrection is needed.
+
+        :param coords: [x, y, z, u, v, w].
+        :type coords: list
+        :rtype: str
+        """
+        current = np.array(self.coords, dtype=float)
+        if np.isnan(current).any():
+            return 'hysteresis'
+
+        # moving from coords + hysteresisCorrection to coords, so opposite to the correction.
+        required = -np.sign(self.hysteresisCorrection)
+        motion = np.array(coords, dtype=float) - current
+        approach = np.where(np.abs(motion) > slit.approachTolerance, np.sign(motion), self.lastApproach)
+
+        return 'direct' if ((required == 0) | (approach == required)).all() else 'hysteresis'
+
+    def _updateLastApproach(self, motion):
+        """Keep track of the direction of the last motion for every axis that moved.
+
+        :param motion: final leg displacement [dx, dy, dz, du, dv, dw].
+        """
+        motion = np.array(motion, dtype=float)
+        moving = np.abs(motion) > slit.approachTolerance
+        self.lastApproach[moving] = np.sign(motion[moving])
+
     def sliding(self, cmd, speed, startPosition, coords):
         """Move to coords in the reference.
+
+        slitAtSpeed=True is generated once startPosition is crossed, detected from the controller at speed event
+        followed by a single timed wait, rather than polling the position.
+
         :param cmd: current command.
         :param speed: mm/s
         :param totalMotion:
         :raise: Exception with warning message.
         """
+        atSpeed = threading.Event()
+        moveDone = threading.Event()
+
+        # the slide gets its own socket, so the waiting thread can only ever read and close that one. Closing a socket
+        # does not release a select() blocked on it, so the wait is bounded by the move duration instead.
+        slideTimeout = self.velocityMoveTimeout(*coords[:3], abs(speed))
+        socketId = self.openSock()
+        self.myxps.setHangLimit(socketId, slideTimeout)
+
+        def getPosition():
+            return self.errorChecker(self.myxps.GroupPositionCurrentGet, self.groupName, 6, sockName='slitPosition',
+                                     socketId=socketId)
+
+        def waitToReachStartPosition(eventConfigured):
+            try:
+                if eventConfigured:
+                    # blocking until the controller signals the trajectory constant velocity start.
+                    self.errorChecker(self.myxps.EventExtendedWait, sockName='slitPosition', socketId=socketId)
+                else:
+                    time.sleep(1)
+
+                if moveDone.is_set():
+                    return
+
+                # at speed now, startPosition is reached after a single timed wait.
+                [x, y, z, u, v, w] = getPosition()
+                time.sleep(max((startPosition - z) / speed, 0))
+                self.coords = getPosition()
+
+                atSpeed.set()
+                cmd.inform('slitAtSpeed=True')
+                cmd.inform('slit=%s' % ','.join(['%.5f' % p for p in self.coords]))
+                cmd.inform('slitPosition=%s' % self.slitPosition(self.coords, config=self.controllerConfig))
+
+            except Exception as e:
+                if not moveDone.is_set():
+                    cmd.warn('text=%s' % self.actor.strTraceback(e))
+
+            finally:
+                self.myxps.TCP_CloseSocket(socketId)
 
-        def waitToReachStartPosition():
-            if not self.substates.current == 'SLIDING':
-                return
+        try:
+            self.errorChecker(self.myxps.EventExtendedConfigurationTriggerSet, [self.atSpeedTrigger], ['0'], ['0'],
+                              ['0'], ['0'], sockName='slitPosition', socketId=socketId)
+            eventConfigured = True
+        except Exception as e:
+            self.logger.warning(f'could not configure {self.atSpeedTrigger} event, falling back on timing: {e}')
+            eventConfigured = False
 
-            [x, y, z, u, v, w] = self.errorChecker(self.myxps.GroupPositionCurrentGet, self.groupName, 6,
-                                                   sockName='slitPosition')
-            direction = 1 if speed > 0 else -1
+        threading.Thread(target=waitToReachStartPosition, args=(eventConfigured,), daemon=True).start()
 
-            # wait until you reach desired startPosition
-            while direction * (z - startPosition) < 0:
-                [x, y, z, u, v, w] = self.errorChecker(self.myxps.GroupPositionCurrentGet, self.groupName, 6,
-                                                       sockName='slitPosition')
-                time.sleep(0.01)
+        try:
+            ret = self._HexapodMoveIncrementalControlWithTargetVelocity(*coords[:3], abs(speed))
+            self._updateLastApproach(coords)
+        except Exception:
+            self.lastApproach[:] = 0
+            raise
+        finally:
+            moveDone.set()
 
-            self.coords = [x, y, z, u, v, w]
+        cmd.inform('slitAtSpeed=False')
 
-            cmd.inform('slitAtSpeed=True')
-            cmd.inform('slit=%s' % ','.join(['%.5f' % p for p in self.coords]))
-            cmd.inform('slitPosition=%s' % self.slitPosition(self.coords, config=self.controllerConfig))
+        return ret
 
-            self.closeSock(sockName='slitPosition')
+    def actuatorDisplacement(self, displacement):
+        """Upper bound of the actuators length change for a cartesian displacement.
 
-        reactor.callLater(1, waitToReachStartPosition)
+        An actuator length cannot change more than its upper joint moves, and a joint at most jointRadius away from
+        the work origin moves by at most the translation plus jointRadius times the rotation angle.
 
-        ret = self._HexapodMoveIncrementalControlWithTargetVelocity(*coords[:3], abs(speed))
-        cmd.inform('slitAtSpeed=False')
+        :param displacement: [dx, dy, dz, du, dv, dw], angles in degrees.
+        :return: actuator displacement in mm.
+        :rtype: float
+        """
+        translation = np.linalg.norm(displacement[:3])
+        rotation = np.deg2rad(np.sum(np.abs(displacement[3:])))
 
-        return ret
+        return translation + self.jointRadius * rotation
+
+    def estimateMoveDuration(self, displacement):
+        """Estimate the duration of a displacement, actuators moving together the slowest one gives the duration.
+
+        :param displacement: [dx, dy, dz, du, dv, dw].
+        :return: duration in seconds, nan if it cannot be estimated.
+        :rtype: float
+        """
+        if len(self.sgammaParameters) != 6 or np.isnan(displacement).any():
+            return np.nan
+
+        actuatorDisplacement = self.actuatorDisplacement(displacement)
+
+        return max([slitMotionProfile.moveDuration(actuatorDisplacement, *params)
+                    for params in self.sgammaParameters.values()])
+
+    def estimateMove(self, coords, reference='absolute'):
+        """Estimate how a move to coords would be done, and how long it would take.
+
+        :param coords: [x, y, z, u, v, w].
+        :param reference: 'absolute' or 'relative'.
+        :return: strategy, duration in seconds (nan if it cannot be estimated).
+        :rtype: tuple
+        """
+        coords = np.array(coords, dtype=float)
+
+        if reference == 'relative':
+            return 'relative', self.estimateMoveDuration(coords)
+
+        current = np.array(self.coords, dtype=float)
+        strategy = self._approachStrategy(coords)
+
+        if strategy == 'hysteresis':
+            duration = self.estimateMoveDuration(coords + self.hysteresisCorrection - current)
+            duration += self.estimateMoveDuration(self.hysteresisCorrection)
+        else:
+            duration = self.estimateMoveDuration(coords - current)
+
+        return strategy, duration
+
+    @staticmethod
+    def velocityMoveTimeout(dX, dY, dZ, Velocity):
+        """Return the time to wait for a constant velocity move, with enough margin for acceleration and deceleration."""
+        return round(np.linalg.norm([dX, dY, dZ]) / Velocity) + 30
+
+    def moveTimeout(self, duration):
+        """Return the time to wait for a move to complete, default hangLimit if duration is unknown."""
+        if np.isnan(duration):
+            return hxp_drivers.XPS.hangLimit
+
+        return slit.moveTimeoutFactor * duration + slit.moveTimeoutOffset
+
+    @contextlib.contextmanager
+    def hangLimit(self, timeout, sockName='main'):
+        """Wait up to timeout seconds for replies on that socket, within that context only."""
+        socketId = self.connectSock(sockName)
+        self.myxps.setHangLimit(socketId, timeout)
+        try:
+            yield
+        finally:
+            self.myxps.setHangLimit(socketId, None)
+
+    def sequencing(self, cmd, grid, sync=False, timeout=600):
+        """Move through a whole grid of absolute coordinates, already limit checked, back to back.
+
+        Only the position is read after each step, slitSequence=step,nSteps,strategy,x,y,z,u,v,w is generated.
+        In sync mode, every step but the first waits for slit sequence next.
+
+        :param cmd: current command.
+        :param grid: (N, 6) absolute coordinates.
+        :param sync: wait for slit sequence next before each step.
+        :param timeout: maximum time waiting for slit sequence next, in seconds.
+        :type sync: bool
+        :raise: Exception with warning message.
+        """
+        self.doPersist = True
+        self.sequenceNext.clear()
+        self.sequenceStopped = False
+
+        try:
+            for step, coords in enumerate(grid):
+                if sync and step and not self.sequenceNext.wait(timeout):
+                    raise RuntimeError(f'no slit sequence next received after {timeout}s')
+
+                self.sequenceNext.clear()
+
+                if self.sequenceStopped:
+                    cmd.warn(f'text="slit sequence stopped before step {step}/{len(grid)}"')
+                    return
+
+                strategy = self._approachStrategy(coords)
+                self._moveAbsolute(cmd, coords, strategy, doCheckPosition=False)
+                self.coords = self._getCurrentPosition()
+                self.declareNewHexapodPosition(cmd)
+
+                position = ','.join(['%.5f' % p for p in self.coords])
+                cmd.inform(f'slitSequence={step},{len(grid)},{strategy},{position}')
+
+        except Exception:
+            self.lastApproach[:] = 0
+            raise
+
+    def nextSequenceStep(self):
+        """Release the next sequence step, in sync mode."""
+        self.sequenceNext.set()
+
+    def stopSequence(self):
+        """Stop the sequence before its next step, current move is not interrupted."""
+        self.sequenceStopped = True
+        self.sequenceNext.set()
 
     def shutdown(self, cmd):
         """Save current controller position and kill connection.
@@ -332,12 +778,77 @@ class slit(FSMThread):
         :raise: Exception with warning message.
         """
         self.doPersist = True
+        self.positionRegistered = False
 
         cmd.inform('text="Kill and save hexapod position..."')
+        start = time.time()
+        try:
+            self.errorChecker(self.myxps.GlobalArraySet, slit.registrationFlag, slit.registrationPending,
+                              sockName='emergency')
+        except RuntimeError as e:
+            cmd.warn(f'text="could not reset registration flag, relying on hexapod status : {e}"')
+
         self._TCLScriptExecute('KillWithRegistration.tcl')
 
-        # the script actually return immediately, so we need to wait, pretty ugly but has been proven to work...
-        time.sleep(10)
+        # the script actually return immediately, so waiting for it to flag the registration file as closed.
+        self._waitForRegistration(cmd)
+        self.positionRegistered = True
+
+        hxpStatus = int(self._getHxpStatus(sockName='emergency'))
+        cmd.inform('hxpStatus=%d,"%s"' % (hxpStatus, self._getHxpStatusString(hxpStatus, sockName='emergency')))
+        cmd.inform(f'slitShutdownTime={time.time() - start:.2f}')
+
+    def _waitForRegistration(self, cmd):
+        """Poll the registration flag on the emergency socket until KillWithRegistration.tcl has closed its file.
+
+        The group is killed well before that, the script still waits 2s and writes the current positions, so the
+        killed state alone does not tell that the controller can be powered off. If the flag is not available, or
+        never set by an older script, falls back on the hexapod status : killed for long enough for the script to
+        complete.
+
+        :param cmd: current command.
+        :raise: RuntimeError if the script failed or did not complete after shutdownTimeout.
+        """
+        deadline = time.time() + slit.shutdownTimeout
+        killedSince = None
+
+        while True:
+            flag = self._getRegistrationFlag()
+
+            if flag == slit.registrationDone:
+                return
+
+            # any other value is the error message set by the script.
+            if flag not in [None, slit.registrationPending]:
+                raise RuntimeError(f'KillWithRegistration failed : {flag}')
+
+            hxpStatus = int(self._getHxpStatus(sockName='emergency'))
+            # same states as the ones initialized from registration.
+            killedSince = (killedSince or time.time()) if hxpStatus in [0, 7] else None
+            killedFor = time.time() - killedSince if killedSince else 0
+
+            if (flag is None and killedFor > slit.registrationDelay) or killedFor > slit.registrationTimeout:
+                cmd.warn(f'text="registration not flagged by KillWithRegistration.tcl, hexapod killed for '
+                         f'{killedFor:.1f}s, considering it complete, please upload hexapod/KillWithRegistration.tcl"')
+                return
+
+            if time.time() > deadline:
+                raise RuntimeError(f'hexapod position registration not completed after {slit.shutdownTimeout}s, '
+                                   f'hxpStatus={hxpStatus}')
+
+            time.sleep(slit.shutdownPollPeriod)
+
+    def _getRegistrationFlag(self):
+        """Return the registration flag set by KillWithRegistration.tcl, None if it cannot be read or is unset.
+
+        :rtype: str
+        """
+        try:
+            flag = self.errorChecker(self.myxps.GlobalArrayGet, slit.registrationFlag, sockName='emergency')
+        except RuntimeError:
+            return None
+
+        return flag if flag else None
 
     def getSystem(self, cmd, system):
         """Get system from the controller and update the actor's current value.
@@ -348,17 +859,28 @@ class slit(FSMThread):
         :raise: ValueError if the coordinate system does not exist
         """
         ret = self._hexapodCoordinateSysGet(system)
+        return self._updateSystem(cmd, system, ret)
+
+    def _updateSystem(self, cmd, system, coords):
+        """Update the actor's current value of a coordinate system already read from the controller.
+
+        :param system: Work|Tool|Base.
+        :param coords: [x, y, z, u, v, w] coordinate system definition.
+        :type system: str
+        :return:  [x, y, z, u, v, w] coordinate system definition.
+        :raise: ValueError if the coordinate system does not exist
+        """
         if system == 'Work':
-            self.workSystem = ret
+            self.workSystem = coords
         elif system == 'Tool':
-            self.toolSystem = ret
+            self.toolSystem = coords
         elif system == 'Base':
             pass
         else:
             raise ValueError('system : %s does not exist' % system)
 
-        cmd.inform('slit%s=%s' % (system, ','.join(['%.5f' % p for p in ret])))
-        return ret
+        cmd.inform('slit%s=%s' % (system, ','.join(['%.5f' % p for p in coords])))
+        return coords
 
     def setSystem(self, system, coords):
         """Send new coordinate system to the controller.
@@ -445,6 +967,8 @@ class slit(FSMThread):
             If `_abort()` or the status check fails.
         """
         cmd.inform('text="aborting motion..."')
+        # no further sequence step.
+        self.stopSequence()
         try:
             self._abort()
         except Exception as e:
@@ -466,7 +990,10 @@ class slit(FSMThread):
         self.doAbort(cmd)
 
         if self.substates.current == 'SHUTDOWN':
-            self.shutdown(cmd)
+            try:
+                self.shutdown(cmd)
+            except Exception as e:
+                cmd.warn('text=%s' % self.actor.strTraceback(e))
 
         try:
             self.getStatus(cmd)
@@ -484,6 +1011,16 @@ class slit(FSMThread):
         """
         return self.errorChecker(self.myxps.GroupPositionCurrentGet, self.groupName, 6)
 
+    def _getCurrentPositionAndStatus(self):
+        """Get current position and status code, pipelined on main socket.
+
+        :return: position [x, y, z, u, v, w], status code.
+        :rtype: tuple
+        :raise: RuntimeError if an error is raised by errorChecker.
+        """
+        return tuple(self.batchErrorChecker((self.myxps.GroupPositionCurrentGet, self.groupName, 6),
+                                            (self.myxps.GroupStatusGet, self.groupName)))
+
     def _getHxpStatus(self, sockName='main'):
         """
         Query the raw numeric status code of the hexapod controller.
@@ -529,7 +1066,10 @@ class slit(FSMThread):
         RuntimeError
             If the controller returns an error or if communication fails.
         """
-        return self.errorChecker(self.myxps.GroupStatusStringGet, code, sockName=sockName)
+        if code not in self.hxpStatusStrings:
+            self.hxpStatusStrings[code] = self.errorChecker(self.myxps.GroupStatusStringGet, code, sockName=sockName)
+
+        return self.hxpStatusStrings[code]
 
     def _kill(self):
         """Kill socket.
@@ -578,19 +1118,24 @@ class slit(FSMThread):
         return self.errorChecker(self.myxps.HexapodCoordinateSystemSet, self.groupName, coordSystem,
                                  *coords)
 
-    def _hexapodMoveAbsolute(self, absCoords):
+    def _hexapodMoveAbsolute(self, absCoords, start=None):
         """
         Move hexapod in absolute.
         In our application, hexapod has a smaller range of motion due to the mechanical interfaces.
         Therefore software limits are set to prevent any risk of collision.
 
         :param coords: [x, y, z, u, v, w].
+        :param start: position the move starts from, used to estimate its duration, current coords by default.
         :type coords: list
         :return: ''
         :raise: RuntimeError if an error is raised by errorChecker.
         """
         self._checkHexaLimits(absCoords)
-        return self.errorChecker(self.myxps.HexapodMoveAbsolute, self.groupName, 'Work', *absCoords)
+        start = self.coords if start is None else start
+        duration = self.estimateMoveDuration(np.array(absCoords, dtype=float) - np.array(start, dtype=float))
+
+        with self.hangLimit(self.moveTimeout(duration)):
+            return self.errorChecker(self.myxps.HexapodMoveAbsolute, self.groupName, 'Work', *absCoords)
 
     def _hexapodMoveIncremental(self, coordSystem, relCoords):
         """
@@ -605,9 +1150,10 @@ class slit(FSMThread):
         """
         futureCoords = np.array(self.coords) + np.array(relCoords)
         self._checkHexaLimits(futureCoords)
+        duration = self.estimateMoveDuration(np.array(relCoords, dtype=float))
 
-        return self.errorChecker(self.myxps.HexapodMoveIncremental, self.groupName, coordSystem,
-                                 *relCoords)
+        with self.hangLimit(self.moveTimeout(duration)):
+            return self.errorChecker(self.myxps.HexapodMoveIncremental, self.groupName, coordSystem, *relCoords)
 
     def _hexapodDisable(self):
         """Disable hexapod.
@@ -645,8 +1191,9 @@ class slit(FSMThread):
         """Linear trajectory in work coordinate system.
         :raise: RuntimeError if an error is raised by errorChecker.
         """
-        return self.errorChecker(self.myxps.HexapodMoveIncrementalControlWithTargetVelocity,
-                                 self.groupName, 'Work', 'Line', dX, dY, dZ, Velocity)
+        with self.hangLimit(self.velocityMoveTimeout(dX, dY, dZ, Velocity)):
+            return self.errorChecker(self.myxps.HexapodMoveIncrementalControlWithTargetVelocity,
+                                     self.groupName, 'Work', 'Line', dX, dY, dZ, Velocity)
 
     def _abort(self):
         """
@@ -666,6 +1213,26 @@ class slit(FSMThread):
         if ret == -22:
             self.logger.info("Hexapod was not moving — no need to stop (Error -22: Not allowed action).")
 
+    def checkGridLimits(self, grid):
+        """Check a whole (N, 6) grid of future coordinates at once, hysteresis pre-approach positions included.
+
+        Whether a step is approached directly is only known once the previous step is done, so every step is assumed
+        to possibly go through coords + hysteresisCorrection first.
+
+        :raise: UserWarning listing the steps which exceed.
+        """
+        if not self.softwareLimitsActivated:
+            return
+
+        grid = np.atleast_2d(grid)
+
+        for targets, kind in [(grid, 'steps'), (grid + self.hysteresisCorrection, 'pre-approach of steps')]:
+            exceed = ~((self.lowerBounds <= targets) & (targets <= self.upperBounds))
+
+            if exceed.any():
+                steps = np.flatnonzero(exceed.any(axis=1))
+                raise UserWarning(f'[X, Y, Z, U, V, W] exceed for {kind} {steps.tolist()} : not permitted')
+
     def _checkHexaLimits(self, futureCoords):
         """Check hexapod future coordinates.
         :return: ''
@@ -678,7 +1245,7 @@ class slit(FSMThread):
             if not lim_inf <= coord <= lim_sup:
                 raise UserWarning("[X, Y, Z, U, V, W] exceed : %.5f not permitted" % coord)
 
-    def errorChecker(self, func, *args, sockName='main', handleDeviceError=True):
+    def errorChecker(self, func, *args, sockName='main', handleDeviceError=True, socketId=None):
         """
         Execute a driver-level function with structured error handling for Newport HXP100Meca controllers.
 
@@ -700,6 +1267,9 @@ class slit(FSMThread):
             Name of the controller socket to use (default: 'main').
         handleDeviceError : bool, optional
             Whether to decode and raise detailed device-level errors (default: True).
+        socketId : int, optional
+            Already connected socket to use instead of sockName's, closing it is left to the caller. sockName then only
+            labels the call.
 
         Returns
         -------
@@ -713,40 +1283,118 @@ class slit(FSMThread):
         UserWarning
             For expected device limits or user-level constraints (e.g., motion bounds exceeded).
         """
+        socketId = self.connectSock(sockName) if socketId is None else socketId
+        start = time.perf_counter()
+        try:
+            buf = func(socketId, *args)
+        finally:
+            # anything but a query may change position or status.
+            if not func.__name__.endswith('Get') and sockName != 'telemetry':
+                self.lastCommandEnd = time.time()
+
+        self.perfStats.add(func.__name__, sockName, time.perf_counter() - start, buf[0])
+
+        # Retry if controller still initializing
+        if buf[0] == -21:
+            self.logger.debug('Hxp controller in initialization...')
+            time.sleep(2)
+            return self.errorChecker(func, *args, sockName=sockName, socketId=socketId)
+
+        return self._checkReply(buf, func.__name__, socketId, sockName, handleDeviceError)
+
+    def batchErrorChecker(self, *calls, sockName='main', handleDeviceError=True):
+        """
+        Execute several driver-level functions in a single round trip, with the same error handling as `errorChecker`.
+
+        Commands are written back-to-back on the socket and replies are read in order, so the calls must not depend
+        on each other's results.
+
+        Parameters
+        ----------
+        *calls : tuple
+            (func, *args) for each call, as they would be given to `errorChecker`.
+        sockName : str, optional
+            Name of the controller socket to use (default: 'main').
+        handleDeviceError : bool, optional
+            Whether to decode and raise detailed device-level errors (default: True).
+
+        Returns
+        -------
+        list
+            The result of each function call, in the same order as calls.
+
+        Raises
+        ------
+        RuntimeError
+            For unrecoverable communication or device errors, the first failing call raises.
+        UserWarning
+            For expected device limits or user-level constraints (e.g., motion bounds exceeded).
+        """
         socketId = self.connectSock(sockName)
-        buf = func(socketId, *args)
+        start = time.perf_counter()
+        bufs = self.myxps.batch(socketId, *[(func.__name__,) + tuple(args) for func, *args in calls])
+        self.perfStats.add('+'.join(func.__name__ for func, *args in calls), sockName, time.perf_counter() - start,
+                           next((buf[0] for buf in bufs if buf[0]), 0))
+
+        # Retry if controller still initializing
+        if any(buf[0] == -21 for buf in bufs):
+            self.logger.debug('Hxp controller in initialization...')
+            time.sleep(2)
+            return self.batchErrorChecker(*calls, sockName=sockName)
+
+        return [self._checkReply(buf, func.__name__, socketId, sockName, handleDeviceError)
+                for buf, (func, *args) in zip(bufs, calls)]
 
+    def _checkReply(self, buf, funcName, socketId, sockName, handleDeviceError=True):
+        """
+        Check the reply of a driver-level function, raise on error.
+
+        Parameters
+        ----------
+        buf : list
+            Reply from the driver, the first element is an error code (0 if no error).
+        funcName : str
+            Name of the function being checked (for clearer error messages).
+        socketId : int
+            Socket ID used to communicate with the controller.
+        sockName : str
+            Name of the controller socket.
+        handleDeviceError : bool, optional
+            Whether to decode and raise detailed device-level errors (default: True).
+
+        Returns
+        -------
+        Any
+            The reply (excluding the error code), either a scalar or a tuple, the error code if not raised.
+        """
         errorCode = buf[0]
 
         # no error are reported, just return the buffer.
         if not errorCode:
             return buf[1:] if len(buf) > 2 else buf[1]
 
-        # Retry if controller still initializing
-        if errorCode == -21:
-            self.logger.debug('Hxp controller in initialization...')
-            time.sleep(2)
-            return self.errorChecker(func, *args, sockName=sockName)
-
         # checking for network error.
-        self._handleNetworkErrors(errorCode, sockName, func.__name__)
+        self._handleNetworkErrors(errorCode, socketId, sockName, funcName)
 
         if handleDeviceError:
-            self._handleDeviceErrors(errorCode, socketId, func.__name__)
+            self._handleDeviceErrors(errorCode, socketId, funcName)
 
         return errorCode
 
-    def _handleNetworkErrors(self, errorCode, sockName, funcName):
+    def _handleNetworkErrors(self, errorCode, socketId, sockName, funcName):
         """
         Handle low-level network-related errors from the hexapod controller.
 
         This method handles cases such as TCP timeout or closed connections
-        and raises appropriate exceptions. It also ensures the associated socket is closed.
+        and raises appropriate exceptions. It also ensures the associated socket is closed, unless it is a socket owned
+        by the caller rather than the named one.
 
         Parameters
         ----------
         errorCode : int
             Error code returned from the driver function.
+        socketId : int
+            Socket ID used to communicate with the controller.
         sockName : str
             Identifier of the socket connection (e.g., 'main').
         funcName : str
@@ -757,11 +1405,15 @@ class slit(FSMThread):
         RuntimeError
             Raised with a descriptive message for known network error codes.
         """
-        if errorCode == -2:
+        if errorCode not in [-2, -108]:
+            return
+
+        if self.socks.get(sockName) == socketId:
             self.closeSock(sockName)
+
+        if errorCode == -2:
             raise RuntimeError(f"{funcName}: TCP timeout")
-        elif errorCode == -108:
-            self.closeSock(sockName)
+        else:
             raise RuntimeError(f"{funcName}: TCP/IP connection was closed by an admin")
 
     def _handleDeviceErrors(self, errorCode, socketId, funcName):
@@ -769,8 +1421,8 @@ class slit(FSMThread):
         Handle device-level errors returned by the hexapod controller.
 
         This method interprets known hardware-related error codes, retrieves
-        the corresponding error message using `ErrorStringGet`, and raises
-        appropriate exceptions with detailed context.
+        the corresponding error message from the preloaded table, or using `ErrorStringGet`
+        for unknown codes, and raises appropriate exceptions with detailed context.
 
         Parameters
         ----------
@@ -788,7 +1440,10 @@ class slit(FSMThread):
         RuntimeError
             For unexpected or generic device-level errors.
         """
-        errorStatus, errorStr = self.myxps.ErrorStringGet(socketId, errorCode)
+        if errorCode in self.hxpErrorStrings:
+            errorStatus, errorStr = 0, self.hxpErrorStrings[errorCode]
+        else:
+            errorStatus, errorStr = self.myxps.ErrorStringGet(socketId, errorCode)
 
         if errorCode == -17:
             raise UserWarning(f'{funcName}: [X, Y, Z, U, V, W] exceed — {errorStr}')
@@ -809,14 +1464,22 @@ class slit(FSMThread):
         :raise: socket.error if connection fails
         """
         if self.socks[sockName] == -1:
-            socketId = self.myxps.TCP_ConnectToServer(self.host, self.port, slit.timeout)
+            self.socks[sockName] = self.openSock()
 
-            if socketId == -1:
-                raise socket.error('Connection to Hexapod failed check IP & Port')
+        return self.socks[sockName]
 
-            self.socks[sockName] = socketId
+    def openSock(self):
+        """Connect a new socket which is not registered, the caller is responsible for closing it.
 
-        return self.socks[sockName]
+        :return: socketId.
+        :raise: socket.error if connection fails
+        """
+        socketId = self.myxps.TCP_ConnectToServer(self.host, self.port, slit.timeout)
+
+        if socketId == -1:
+            raise socket.error('Connection to Hexapod failed check IP & Port')
+
+        return socketId
 
     def closeSock(self, sockName='main'):
         """close socket.
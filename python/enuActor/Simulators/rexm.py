@@ -92,8 +92,13 @@ class RexmSim(socket.socket):
         return self.motorConfig[4]
 
     def sendall(self, cmdBytes, flags=None):
-        """Send fake packets, append fake response to buffer."""
+        """Send fake packets, append fake responses to buffer, packets being processed in order."""
         time.sleep(0.01)
+        for i in range(0, len(cmdBytes), 9):
+            self.processPacket(cmdBytes[i:i + 9])
+
+    def processPacket(self, cmdBytes):
+        """Process one fake packet, append fake response to buffer."""
         packet = recvFake(*unpack('>BBBBIB', cmdBytes))
 
         if packet.cmd == TMCM.TMCL_MST:
@@ -211,5 +216,19 @@ class RexmSim(socket.socket):
         self.buf = self.buf[1:]
         return ret.cmdBytes
 
+    def recv_into(self, buffer, nbytes=0, flags=None):
+        """Copy and remove fake response from buffer, timing out like a socket if there is none."""
+        time.sleep(0.01)
+        if not self.buf:
+            raise socket.timeout('timed out')
+
+        view = memoryview(buffer)
+        nbytes = nbytes if nbytes else len(view)
+        ret = self.buf[0].cmdBytes[:nbytes]
+        self.buf = self.buf[1:]
+        view[:len(ret)] = ret
+
+        return len(ret)
+
     def close(self):
         pass
@@ -1,6 +1,5 @@
 __author__ = 'alefur'
 
-import socket
 import time
 from random import randint
 
@@ -8,17 +7,11 @@ from random import randint
 class SlitSim(object):
     MAX_NB_SOCKETS = 100
 
-    # Global variables
-    __sockets = {}
-    __usedSockets = {}
-    __nbSockets = 0
-
     def __init__(self):
         """Fake slit hexapod tcp server."""
         object.__init__(self)
-        SlitSim.__nbSockets = 0
-        for socketId in range(self.MAX_NB_SOCKETS):
-            SlitSim.__usedSockets[socketId] = 0
+        self.__usedSockets = set()
+        self.__freeSocketIds = list(reversed(range(self.MAX_NB_SOCKETS)))
 
         self.home = [0 for i in range(6)]
         self.tool = [0 for i in range(6)]
@@ -26,6 +19,8 @@ class SlitSim(object):
         self.base = [0.00000, 0.00000, 25.00000, 0.00000, 0.00000, 0.00000]
         self.intStatus = 7
         self.emergencyStop = False
+        self.gathering = None
+        self.globalArray = dict()
 
     def TCP_ConnectToServer(self, IP, port, timeOut):
         """Fake the connection to tcp server."""
@@ -34,36 +29,31 @@ class SlitSim(object):
         if type(port) is not int:
             raise TypeError
 
-        socketId = 0
-        if (SlitSim.__nbSockets < self.MAX_NB_SOCKETS):
-            while (SlitSim.__usedSockets[socketId] == 1 and socketId < self.MAX_NB_SOCKETS):
-                socketId += 1
-            if (socketId == self.MAX_NB_SOCKETS):
-                return -1
-        else:
+        if not self.__freeSocketIds:
             return -1
 
-        SlitSim.__usedSockets[socketId] = 1
-        SlitSim.__nbSockets += 1
-        try:
-            pass
-            # SlitSim.__sockets[socketId] = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            # SlitSim.__sockets[socketId].settimeout(timeOut)
-            # SlitSim.__sockets[socketId].connect((IP, port))
-            # SlitSim.__sockets[socketId].setblocking(1)
-        except socket.error:
-            return -1
+        socketId = self.__freeSocketIds.pop()
+        self.__usedSockets.add(socketId)
 
         return socketId
 
     def TCP_CloseSocket(self, socketId):
-        if (socketId >= 0 and socketId < self.MAX_NB_SOCKETS):
-            try:
-                # SlitSim.__sockets[socketId].close()
-                SlitSim.__usedSockets[socketId] = 0
-                SlitSim.__nbSockets -= 1
-            except socket.error:
-                pass
+        if socketId not in self.__usedSockets:
+            return
+
+        self.__usedSockets.remove(socketId)
+        self.__freeSocketIds.append(socketId)
+
+    def setHangLimit(self, socketId, hangLimit=None):
+        # simulated replies never hang.
+        pass
+
+    def batch(self, socketId, *calls):
+        """Fake pipelined calls, simply executed one after the other."""
+        if socketId not in self.__usedSockets:
+            return
+
+        return [getattr(self, apiName)(socketId, *args) for apiName, *args in calls]
 
     def GroupPositionCurrentGet(self, socketId, GroupName, nbElement):
         time.sleep(0.5)
@@ -138,15 +128,22 @@ class SlitSim(object):
     def GroupStatusGet(self, socketId, GroupName):
         return [0, self.intStatus]
 
+    statusStrings = {0: 'Not initialized state',
+                     7: 'Not initialized state due to a GroupKill or KillAll command',
+                     10: 'Ready state due to an AbortMove command',
+                     11: "Ready state from homing", 12: "Ready state from motion",
+                     13: "Ready State due to a MotionEnable command",
+                     20: "Disabled state", 42: 'Not referenced state'
+                     }
+
     def GroupStatusStringGet(self, socketId, GroupStatusCode):
-        enum = {0: 'Not initialized state',
-                7: 'Not initialized state due to a GroupKill or KillAll command',
-                10: 'Ready state due to an AbortMove command',
-                11: "Ready state from homing", 12: "Ready state from motion",
-                13: "Ready State due to a MotionEnable command",
-                20: "Disabled state", 42: 'Not referenced state'
-                }
-        return [0, enum[GroupStatusCode]]
+        return [0, SlitSim.statusStrings[GroupStatusCode]]
+
+    def GroupStatusListGet(self, socketId):
+        return [0, ';'.join([f'{code} : {text}' for code, text in SlitSim.statusStrings.items()])]
+
+    def ErrorListGet(self, socketId):
+        return [0, '0 : Successful command;-17 : Parameter out of range or incorrect;-27 : Move Aborted']
 
     def GroupMotionEnable(self, socketId, GroupName):
         self.intStatus = 13
@@ -159,11 +156,19 @@ class SlitSim(object):
     def TCLScriptExecuteAndWait(self, socketId, TCLFileName, TaskName, ParametersList):
         if TCLFileName == 'KillWithRegistration.tcl':
             self.intStatus = 7
+            self.globalArray[0] = 'registered'
         elif TCLFileName == 'InitializeFromRegistration.tcl':
             self.intStatus = 12
 
         return [0, '']
 
+    def GlobalArrayGet(self, socketId, Number):
+        return [0, self.globalArray.get(Number, '')]
+
+    def GlobalArraySet(self, socketId, Number, ValueString):
+        self.globalArray[Number] = ValueString
+        return [0, '']
+
     def HexapodMoveIncrementalControlWithTargetVelocity(self, socketId, GroupName, CoordinateSystem,
                                                         HexapodTrajectoryType, dX, dY, dZ, Velocity):
 
@@ -174,3 +179,60 @@ class SlitSim(object):
             time.sleep(0.1)
 
         return [0, '']
+
+    def EventExtendedConfigurationTriggerSet(self, socketId, ExtendedEventName, EventParameter1, EventParameter2,
+                                             EventParameter3, EventParameter4):
+        return [0, '']
+
+    def EventExtendedWait(self, socketId):
+        # simulated acceleration.
+        time.sleep(0.3)
+        return [0, '']
+
+    def GatheringReset(self, socketId):
+        self.gathering = None
+        return [0, '']
+
+    def GatheringConfigurationSet(self, socketId, Type):
+        return [0, '']
+
+    def GatheringRun(self, socketId, DataNumber, Divisor):
+        # simulated servo rate is 10 kHz.
+        self.gathering = (time.time(), DataNumber, Divisor / 10000)
+        return [0, '']
+
+    def GatheringStop(self, socketId):
+        start, nSamples, period = self.gathering
+        self.gathering = (start, self.GatheringCurrentNumberGet(socketId)[1], period)
+        return [0, '']
+
+    def GatheringCurrentNumberGet(self, socketId):
+        if self.gathering is None:
+            return [0, 0, 1000000]
+
+        start, nSamples, period = self.gathering
+        return [0, min(int((time.time() - start) / period), nSamples), 1000000]
+
+    def GatheringDataGet(self, socketId, IndexPoint):
+        return [0, ';'.join(['%.6f' % p for p in self.pos])]
+
+    def PositionerSGammaParametersGet(self, socketId, PositionerName):
+        return [0, 1.0, 4.0, 0.005, 0.05]
+
+    def PositionerMaximumVelocityAndAccelerationGet(self, socketId, PositionerName):
+        return [0, 2.0, 8.0]
+
+    def CPUTemperatureAndFanSpeedGet(self, socketId):
+        return [0, 45.0, 3000.0]
+
+    def ControllerMotionKernelTimeLoadGet(self, socketId):
+        return [0, 0.35, 0.15, 0.1, 0.1]
+
+    def ControllerMotionKernelPeriodMinMaxGet(self, socketId):
+        return [0, 9.9e-05, 1.01e-04, 9.9e-04, 1.01e-03, 9.9e-03, 1.01e-02]
+
+    def ControllerMotionKernelPeriodMinMaxReset(self, socketId):
+        return [0, '']
+
+    def CPUCoreAndBoardSupplyVoltagesGet(self, socketId):
+        return [0, 1.2, 3.3, 5.0, 12.0, -12.0, 2.5, 1.8, 24.0]
@@ -0,0 +1,137 @@
+# Asyncio XPS Python class
+#
+#  for HXP Firmware V2.1.x
+#
+#  Same API as hxp_drivers.XPS, each call returns a coroutine instead of blocking a thread.
+
+import asyncio
+import contextlib
+import contextvars
+
+from enuActor.drivers.hxp_drivers import XPS, _commandRecorder, splitReply
+
+# per-call deadline, overrides hangLimit (and per socket hangLimit) for every call made within AsyncXPS.deadline().
+_deadline = contextvars.ContextVar('deadline', default=None)
+
+
+class AsyncXPS(XPS):
+    # Largest reply that can be read (GatheringDataGet, *ListGet...).
+    STREAM_LIMIT = 2 ** 24
+
+    def __init__(self):
+        """Asyncio client for the Newport HXP controller.
+
+        API calls are inherited from XPS, only the transport differs : commands are built and replies decoded by the
+        exact same code, but each call is a coroutine. Several sockets can be driven concurrently from one event loop,
+        calls on the same socket are serialized.
+        """
+        XPS.__init__(self)
+        self.__streams = {}
+        self.__freeSocketIds = list(reversed(range(self.MAX_NB_SOCKETS)))
+
+    # Send command and decode return
+    def _execute(self, socketId, command, parser):
+        deadline = _deadline.get()
+        return self.__query(socketId, command, parser, self.getHangLimit(socketId) if deadline is None else deadline)
+
+    async def __query(self, socketId, command, parser, deadline):
+        """Send command and wait for the reply until deadline, in seconds."""
+        if socketId not in self.__streams:
+            return
+
+        reader, writer, lock = self.__streams[socketId]
+
+        async with lock:
+            try:
+                writer.write(command.encode())
+                reply = await asyncio.wait_for(reader.readuntil(XPS.END_OF_API), deadline)
+            except (asyncio.TimeoutError, asyncio.IncompleteReadError, asyncio.LimitOverrunError, OSError):
+                # a late reply would be read by the next call, so that socket cannot be trusted anymore.
+                self.__dropSocket(socketId)
+                return [-2, '']
+
+        return parser(*splitReply(reply[:-len(XPS.END_OF_API)]))
+
+    async def batch(self, socketId, *calls):
+        """Pipeline several API calls on one socket, see XPS.batch."""
+        if socketId not in self.__streams:
+            return
+
+        deadline = _deadline.get()
+        deadline = self.getHangLimit(socketId) if deadline is None else deadline
+        commands, parsers = zip(*[XPS._bind(apiName)(_commandRecorder, socketId, *args) for apiName, *args in calls])
+        reader, writer, lock = self.__streams[socketId]
+
+        async with lock:
+            try:
+                writer.write(''.join(commands).encode())
+                # one deadline for the whole batch, not for each reply.
+                replies = await asyncio.wait_for(self.__readReplies(reader, len(commands)), deadline)
+            except (asyncio.TimeoutError, asyncio.IncompleteReadError, asyncio.LimitOverrunError, OSError):
+                self.__dropSocket(socketId)
+                return len(commands) * [[-2, '']]
+
+        return [parser(*splitReply(reply[:-len(XPS.END_OF_API)])) for parser, reply in zip(parsers, replies)]
+
+    @staticmethod
+    async def __readReplies(reader, nbReplies):
+        """Read nbReplies replies, in order."""
+        return [await reader.readuntil(XPS.END_OF_API) for i in range(nbReplies)]
+
+    @contextlib.contextmanager
+    def deadline(self, timeout):
+        """Use timeout, in seconds, instead of hangLimit for every call made within that context."""
+        token = _deadline.set(timeout)
+        try:
+            yield
+        finally:
+            _deadline.reset(token)
+
+    # TCP_ConnectToServer
+    async def TCP_ConnectToServer(self, IP, port, timeOut):
+        if not self.__freeSocketIds:
+            return -1
+
+        try:
+            reader, writer = await asyncio.wait_for(asyncio.open_connection(IP, port, limit=AsyncXPS.STREAM_LIMIT),
+                                                    timeOut)
+        except (asyncio.TimeoutError, OSError):
+            return -1
+
+        socketId = self.__freeSocketIds.pop()
+        self.__streams[socketId] = (reader, writer, asyncio.Lock())
+
+        return socketId
+
+    # TCP_SetTimeout
+    def TCP_SetTimeout(self, socketId, timeOut):
+        # deadlines are given by hangLimit or deadline(), nothing to do at the socket level.
+        pass
+
+    # TCP_CloseSocket
+    async def TCP_CloseSocket(self, socketId):
+        writer = self.__dropSocket(socketId)
+        if writer is None:
+            return
+
+        try:
+            await writer.wait_closed()
+        except OSError:
+            pass
+
+    def __dropSocket(self, socketId):
+        """Forget socketId and close the underlying transport."""
+        streams = self.__streams.pop(socketId, None)
+        if streams is None:
+            return
+
+        reader, writer, lock = streams
+        self.setHangLimit(socketId, None)
+        self.__freeSocketIds.append(socketId)
+        writer.close()
+
+        return writer
+
+    # GetLibraryVersion
+    async def GetLibraryVersion(self):
+        return XPS.GetLibraryVersion(self)
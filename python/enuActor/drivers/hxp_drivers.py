@@ -8,2826 +8,675 @@
 
 #  See Programmer's manual for more information on XPS function calls
 
+import functools
+import re
 import select
 import socket
 
 
-class XPS(object):
-    # Defines
-    MAX_NB_SOCKETS = 100
-    hangLimit = 45
-    # Global variables
-    __sockets = {}
-    __usedSockets = {}
-    __nbSockets = 0
-
-    # Initialization Function
-    def __init__(self):
-        XPS.__nbSockets = 0
-        for socketId in range(self.MAX_NB_SOCKETS):
-            XPS.__usedSockets[socketId] = 0
-
-    # Send command and get return
-    def __sendAndReceive(self, socketId, command):
-        try:
-            XPS.__sockets[socketId].send(command.encode())
-            ret = ''
-            while (ret.find(',EndOfAPI') == -1):
-                ret += self.getOutput(XPS.__sockets[socketId])
-        except socket.timeout:
-            return [-2, '']
-        except socket.error:
-            return [-2, '']
-
-        for i in range(len(ret)):
-            if (ret[i] == ','):
-                return [int(ret[0:i]), ret[i + 1:-9]]
-
-    def getOutput(self, sock):
-        """ Block/timeout for input, then return all (<=1kB) available input. """
-
-        readers, writers, broken = select.select([sock.fileno()], [], [], self.hangLimit)
-        if len(readers) == 0:
-            raise socket.timeout('Timed out reading character from hxp')
-
-        return sock.recv(1024).decode()
-
-    # TCP_ConnectToServer
-    def TCP_ConnectToServer(self, IP, port, timeOut):
-        socketId = 0
-        if (XPS.__nbSockets < self.MAX_NB_SOCKETS):
-            while (XPS.__usedSockets[socketId] == 1 and socketId < self.MAX_NB_SOCKETS):
-                socketId += 1
-            if (socketId == self.MAX_NB_SOCKETS):
-                return -1
-        else:
-            return -1
-
-        XPS.__usedSockets[socketId] = 1
-        XPS.__nbSockets += 1
-        try:
-            XPS.__sockets[socketId] = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            XPS.__sockets[socketId].settimeout(timeOut)
-            XPS.__sockets[socketId].connect((IP, port))
-            XPS.__sockets[socketId].setblocking(1)
-        except socket.error:
-            return -1
-
-        return socketId
-
-    # TCP_SetTimeout
-    def TCP_SetTimeout(self, socketId, timeOut):
-        if (XPS.__usedSockets[socketId] == 1):
-            XPS.__sockets[socketId].settimeout(timeOut)
-
-    # TCP_CloseSocket
-    def TCP_CloseSocket(self, socketId):
-        if (socketId >= 0 and socketId < self.MAX_NB_SOCKETS):
-            try:
-                XPS.__sockets[socketId].close()
-                XPS.__usedSockets[socketId] = 0
-                XPS.__nbSockets -= 1
-            except socket.error:
-                pass
-
-    # GetLibraryVersion
-    def GetLibraryVersion(self):
-        return ['HXP Firmware V2.1.x']
-
-    # ControllerMotionKernelTimeLoadGet :  Get controller motion kernel time load
-    def ControllerMotionKernelTimeLoadGet(self, socketId):
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'ControllerMotionKernelTimeLoadGet(double *,double *,double *,double *)'
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-        if (error != 0):
-            return [error, returnedString]
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(4):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # ElapsedTimeGet :  Return elapsed time from controller power on
-    def ElapsedTimeGet(self, socketId):
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'ElapsedTimeGet(double *)'
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-        if (error != 0):
-            return [error, returnedString]
-
-        i, j, retList = 0, 0, [error]
-        while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-            j += 1
-        retList.append(eval(returnedString[i:i + j]))
-
-        return retList
-
-    # ErrorStringGet :  Return the error string corresponding to the error code
-    def ErrorStringGet(self, socketId, ErrorCode):
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'ErrorStringGet(' + str(ErrorCode) + ',char *)'
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-        return [error, returnedString]
-
-    # FirmwareVersionGet :  Return firmware version
-    def FirmwareVersionGet(self, socketId):
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'FirmwareVersionGet(char *)'
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-        return [error, returnedString]
-
-    # TCLScriptExecute :  Execute a TCL script from a TCL file
-    def TCLScriptExecute(self, socketId, TCLFileName, TaskName, ParametersList):
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'TCLScriptExecute(' + TCLFileName + ',' + TaskName + ',' + ParametersList + ')'
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-        return [error, returnedString]
-
-    # TCLScriptExecuteAndWait :  Execute a TCL script from a TCL file and wait the end of execution to return
-    def TCLScriptExecuteAndWait(self, socketId, TCLFileName, TaskName, InputParametersList):
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'TCLScriptExecuteAndWait(' + TCLFileName + ',' + TaskName + ',' + InputParametersList + ',char *)'
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-        return [error, returnedString]
-
-    # TCLScriptKill :  Kill TCL Task
-    def TCLScriptKill(self, socketId, TaskName):
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'TCLScriptKill(' + TaskName + ')'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # TCLScriptKillAll :  Kill all TCL Tasks
-
-    def TCLScriptKillAll(self, socketId):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'TCLScriptKillAll()'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # TimerGet :  Get a timer
-
-    def TimerGet(self, socketId, TimerName):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'TimerGet(' + TimerName + ',int *)'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        if (error != 0):
-            return [error, returnedString]
-
-        i, j, retList = 0, 0, [error]
-
-        while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-            j += 1
-
-        retList.append(eval(returnedString[i:i + j]))
-
-        return retList
-
-    # TimerSet :  Set a timer
-
-    def TimerSet(self, socketId, TimerName, FrequencyTicks):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'TimerSet(' + TimerName + ',' + str(FrequencyTicks) + ')'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # Reboot :  Reboot the controller
-
-    def Reboot(self, socketId):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'Reboot()'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # Login :  Log in
-
-    def Login(self, socketId, Name, Password):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'Login(' + Name + ',' + Password + ')'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # CloseAllOtherSockets :  Close all socket beside the one used to send this command
-
-    def CloseAllOtherSockets(self, socketId):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'CloseAllOtherSockets()'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # EventAdd :  ** OBSOLETE ** Add an event
-
-    def EventAdd(self, socketId, PositionerName, EventName, EventParameter, ActionName, ActionParameter1,
-                 ActionParameter2, ActionParameter3):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'EventAdd(' + PositionerName + ',' + EventName + ',' + EventParameter + ',' + ActionName + ',' + ActionParameter1 + ',' + ActionParameter2 + ',' + ActionParameter3 + ')'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # EventGet :  ** OBSOLETE ** Read events and actions list
-
-    def EventGet(self, socketId, PositionerName):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'EventGet(' + PositionerName + ',char *)'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # EventRemove :  ** OBSOLETE ** Delete an event
-
-    def EventRemove(self, socketId, PositionerName, EventName, EventParameter):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'EventRemove(' + PositionerName + ',' + EventName + ',' + EventParameter + ')'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # EventWait :  ** OBSOLETE ** Wait an event
-
-    def EventWait(self, socketId, PositionerName, EventName, EventParameter):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'EventWait(' + PositionerName + ',' + EventName + ',' + EventParameter + ')'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # EventExtendedConfigurationTriggerSet :  Configure one or several events
-
-    def EventExtendedConfigurationTriggerSet(self, socketId, ExtendedEventName, EventParameter1, EventParameter2,
-                                             EventParameter3, EventParameter4):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'EventExtendedConfigurationTriggerSet('
-
-        for i in range(len(ExtendedEventName)):
-
-            if (i > 0):
-                command += ','
-
-            command += ExtendedEventName[i] + ',' + EventParameter1[i] + ',' + EventParameter2[i] + ',' + \
-                       EventParameter3[i] + ',' + EventParameter4[i]
-
-        command += ')'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # EventExtendedConfigurationTriggerGet :  Read the event configuration
-
-    def EventExtendedConfigurationTriggerGet(self, socketId):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'EventExtendedConfigurationTriggerGet(char *)'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # EventExtendedConfigurationActionSet :  Configure one or several actions
-
-    def EventExtendedConfigurationActionSet(self, socketId, ExtendedActionName, ActionParameter1, ActionParameter2,
-                                            ActionParameter3, ActionParameter4):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'EventExtendedConfigurationActionSet('
-
-        for i in range(len(ExtendedActionName)):
-
-            if (i > 0):
-                command += ','
-
-            command += ExtendedActionName[i] + ',' + ActionParameter1[i] + ',' + ActionParameter2[i] + ',' + \
-                       ActionParameter3[i] + ',' + ActionParameter4[i]
-
-        command += ')'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # EventExtendedConfigurationActionGet :  Read the action configuration
-
-    def EventExtendedConfigurationActionGet(self, socketId):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'EventExtendedConfigurationActionGet(char *)'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # EventExtendedStart :  Launch the last event and action configuration and return an ID
-
-    def EventExtendedStart(self, socketId):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'EventExtendedStart(int *)'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        if (error != 0):
-            return [error, returnedString]
-
-        i, j, retList = 0, 0, [error]
-
-        while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-            j += 1
-
-        retList.append(eval(returnedString[i:i + j]))
-
-        return retList
-
-    # EventExtendedAllGet :  Read all event and action configurations
-
-    def EventExtendedAllGet(self, socketId):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'EventExtendedAllGet(char *)'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # EventExtendedGet :  Read the event and action configuration defined by ID
-
-    def EventExtendedGet(self, socketId, ID):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'EventExtendedGet(' + str(ID) + ',char *,char *)'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # EventExtendedRemove :  Remove the event and action configuration defined by ID
-
-    def EventExtendedRemove(self, socketId, ID):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'EventExtendedRemove(' + str(ID) + ')'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # EventExtendedWait :  Wait events from the last event configuration
-
-    def EventExtendedWait(self, socketId):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'EventExtendedWait()'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # GatheringConfigurationGet :  Read different mnemonique type
-
-    def GatheringConfigurationGet(self, socketId):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'GatheringConfigurationGet(char *)'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # GatheringConfigurationSet :  Configuration acquisition
-
-    def GatheringConfigurationSet(self, socketId, Type):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'GatheringConfigurationSet('
-
-        for i in range(len(Type)):
-
-            if (i > 0):
-                command += ','
-
-            command += Type[i]
-
-        command += ')'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # GatheringCurrentNumberGet :  Maximum number of samples and current number during acquisition
-
-    def GatheringCurrentNumberGet(self, socketId):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'GatheringCurrentNumberGet(int *,int *)'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        if (error != 0):
-            return [error, returnedString]
-
-        i, j, retList = 0, 0, [error]
-
-        for paramNb in range(2):
-
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-
-            retList.append(eval(returnedString[i:i + j]))
-
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # GatheringStopAndSave :  Stop acquisition and save data
-
-    def GatheringStopAndSave(self, socketId):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'GatheringStopAndSave()'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # GatheringDataAcquire :  Acquire a configured data
-
-    def GatheringDataAcquire(self, socketId):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'GatheringDataAcquire()'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # GatheringDataGet :  Get a data line from gathering buffer
-
-    def GatheringDataGet(self, socketId, IndexPoint):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'GatheringDataGet(' + str(IndexPoint) + ',char *)'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # GatheringReset :  Empty the gathered data in memory to start new gathering from scratch
-
-    def GatheringReset(self, socketId):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'GatheringReset()'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # GatheringRun :  Start a new gathering
-
-    def GatheringRun(self, socketId, DataNumber, Divisor):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'GatheringRun(' + str(DataNumber) + ',' + str(Divisor) + ')'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # GatheringStop :  Stop the data gathering (without saving to file)
-
-    def GatheringStop(self, socketId):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'GatheringStop()'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # GatheringExternalConfigurationSet :  Configuration acquisition
-
-    def GatheringExternalConfigurationSet(self, socketId, Type):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'GatheringExternalConfigurationSet('
-
-        for i in range(len(Type)):
-
-            if (i > 0):
-                command += ','
-
-            command += Type[i]
-
-        command += ')'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # GatheringExternalConfigurationGet :  Read different mnemonique type
-
-    def GatheringExternalConfigurationGet(self, socketId):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'GatheringExternalConfigurationGet(char *)'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # GatheringExternalCurrentNumberGet :  Maximum number of samples and current number during acquisition
-
-    def GatheringExternalCurrentNumberGet(self, socketId):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'GatheringExternalCurrentNumberGet(int *,int *)'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        if (error != 0):
-            return [error, returnedString]
-
-        i, j, retList = 0, 0, [error]
-
-        for paramNb in range(2):
-
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-
-            retList.append(eval(returnedString[i:i + j]))
-
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # GatheringExternalStopAndSave :  Stop acquisition and save data
-
-    def GatheringExternalStopAndSave(self, socketId):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'GatheringExternalStopAndSave()'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # GlobalArrayGet :  Get global array value
-
-    def GlobalArrayGet(self, socketId, Number):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'GlobalArrayGet(' + str(Number) + ',char *)'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # GlobalArraySet :  Set global array value
-
-    def GlobalArraySet(self, socketId, Number, ValueString):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'GlobalArraySet(' + str(Number) + ',' + ValueString + ')'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # DoubleGlobalArrayGet :  Get double global array value
-
-    def DoubleGlobalArrayGet(self, socketId, Number):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'DoubleGlobalArrayGet(' + str(Number) + ',double *)'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        if (error != 0):
-            return [error, returnedString]
-
-        i, j, retList = 0, 0, [error]
-
-        while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-            j += 1
-
-        retList.append(eval(returnedString[i:i + j]))
-
-        return retList
-
-    # DoubleGlobalArraySet :  Set double global array value
-
-    def DoubleGlobalArraySet(self, socketId, Number, DoubleValue):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'DoubleGlobalArraySet(' + str(Number) + ',' + str(DoubleValue) + ')'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # GPIOAnalogGet :  Read analog input or analog output for one or few input
-
-    def GPIOAnalogGet(self, socketId, GPIOName):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'GPIOAnalogGet('
-
-        for i in range(len(GPIOName)):
-
-            if (i > 0):
-                command += ','
-
-            command += GPIOName[i] + ',' + 'double *'
-
-        command += ')'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        if (error != 0):
-            return [error, returnedString]
-
-        i, j, retList = 0, 0, [error]
-
-        for paramNb in range(len(GPIOName)):
-
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-
-            retList.append(eval(returnedString[i:i + j]))
-
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # GPIOAnalogSet :  Set analog output for one or few output
-
-    def GPIOAnalogSet(self, socketId, GPIOName, AnalogOutputValue):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'GPIOAnalogSet('
-
-        for i in range(len(GPIOName)):
-
-            if (i > 0):
-                command += ','
-
-            command += GPIOName[i] + ',' + str(AnalogOutputValue[i])
-
-        command += ')'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # GPIOAnalogGainGet :  Read analog input gain (1, 2, 4 or 8) for one or few input
-
-    def GPIOAnalogGainGet(self, socketId, GPIOName):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'GPIOAnalogGainGet('
-
-        for i in range(len(GPIOName)):
-
-            if (i > 0):
-                command += ','
-
-            command += GPIOName[i] + ',' + 'int *'
-
-        command += ')'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        if (error != 0):
-            return [error, returnedString]
-
-        i, j, retList = 0, 0, [error]
-
-        for paramNb in range(len(GPIOName)):
-
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-
-            retList.append(eval(returnedString[i:i + j]))
-
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # GPIOAnalogGainSet :  Set analog input gain (1, 2, 4 or 8) for one or few input
-
-    def GPIOAnalogGainSet(self, socketId, GPIOName, AnalogInputGainValue):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'GPIOAnalogGainSet('
-
-        for i in range(len(GPIOName)):
-
-            if (i > 0):
-                command += ','
-
-            command += GPIOName[i] + ',' + str(AnalogInputGainValue[i])
-
-        command += ')'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # GPIODigitalGet :  Read digital output or digital input
-
-    def GPIODigitalGet(self, socketId, GPIOName):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'GPIODigitalGet(' + GPIOName + ',unsigned short *)'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        if (error != 0):
-            return [error, returnedString]
-
-        i, j, retList = 0, 0, [error]
-
-        while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-            j += 1
-
-        retList.append(eval(returnedString[i:i + j]))
-
-        return retList
-
-    # GPIODigitalSet :  Set Digital Output for one or few output TTL
-
-    def GPIODigitalSet(self, socketId, GPIOName, Mask, DigitalOutputValue):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'GPIODigitalSet(' + GPIOName + ',' + str(Mask) + ',' + str(DigitalOutputValue) + ')'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # GroupCorrectorOutputGet :  Return corrector outputs
-
-    def GroupCorrectorOutputGet(self, socketId, GroupName, nbElement):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'GroupCorrectorOutputGet(' + GroupName + ','
-
-        for i in range(nbElement):
-
-            if (i > 0):
-                command += ','
-
-            command += 'double *'
-
-        command += ')'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        if (error != 0):
-            return [error, returnedString]
-
-        i, j, retList = 0, 0, [error]
-
-        for paramNb in range(nbElement):
-
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-
-            retList.append(eval(returnedString[i:i + j]))
-
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # GroupHomeSearch :  Start home search sequence
-
-    def GroupHomeSearch(self, socketId, GroupName):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'GroupHomeSearch(' + GroupName + ')'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # GroupHomeSearchAndRelativeMove :  Start home search sequence and execute a displacement
-
-    def GroupHomeSearchAndRelativeMove(self, socketId, GroupName, TargetDisplacement):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'GroupHomeSearchAndRelativeMove(' + GroupName + ','
-
-        for i in range(len(TargetDisplacement)):
-
-            if (i > 0):
-                command += ','
-
-            command += str(TargetDisplacement[i])
-
-        command += ')'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # GroupReadyAtPosition :  Go to READY state with the users positions
-
-    def GroupReadyAtPosition(self, socketId, GroupName, EncoderPosition1, EncoderPosition2, EncoderPosition3,
-                             EncoderPosition4, EncoderPosition5, EncoderPosition6):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'GroupReadyAtPosition(' + GroupName + ',' + str(EncoderPosition1) + ',' + str(
-            EncoderPosition2) + ',' + str(EncoderPosition3) + ',' + str(EncoderPosition4) + ',' + str(
-            EncoderPosition5) + ',' + str(EncoderPosition6) + ')'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # GroupInitialize :  Start the initialization
-
-    def GroupInitialize(self, socketId, GroupName):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'GroupInitialize(' + GroupName + ')'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # GroupInitializeWithEncoderCalibration :  Start the initialization with encoder calibration
-
-    def GroupInitializeWithEncoderCalibration(self, socketId, GroupName):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'GroupInitializeWithEncoderCalibration(' + GroupName + ')'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # GroupKill :  Kill the group
-
-    def GroupKill(self, socketId, GroupName):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'GroupKill(' + GroupName + ')'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # GroupMoveAbort :  Abort a move
-
-    def GroupMoveAbort(self, socketId, GroupName):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'GroupMoveAbort(' + GroupName + ')'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # GroupMoveAbsolute :  Do an absolute move
-
-    def GroupMoveAbsolute(self, socketId, GroupName, TargetPosition):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'GroupMoveAbsolute(' + GroupName + ','
-
-        for i in range(len(TargetPosition)):
-
-            if (i > 0):
-                command += ','
-
-            command += str(TargetPosition[i])
-
-        command += ')'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # GroupMoveRelative :  Do a relative move
-
-    def GroupMoveRelative(self, socketId, GroupName, TargetDisplacement):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'GroupMoveRelative(' + GroupName + ','
-
-        for i in range(len(TargetDisplacement)):
-
-            if (i > 0):
-                command += ','
-
-            command += str(TargetDisplacement[i])
-
-        command += ')'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # GroupMotionDisable :  Set Motion disable on selected group
-
-    def GroupMotionDisable(self, socketId, GroupName):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'GroupMotionDisable(' + GroupName + ')'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # GroupMotionEnable :  Set Motion enable on selected group
-
-    def GroupMotionEnable(self, socketId, GroupName):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'GroupMotionEnable(' + GroupName + ')'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # GroupPositionCorrectedProfilerGet :  Return corrected profiler positions
-
-    def GroupPositionCorrectedProfilerGet(self, socketId, GroupName, PositionX, PositionY):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'GroupPositionCorrectedProfilerGet(' + GroupName + ',' + str(PositionX) + ',' + str(
-            PositionY) + ',double *,double *)'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        if (error != 0):
-            return [error, returnedString]
-
-        i, j, retList = 0, 0, [error]
-
-        for paramNb in range(2):
-
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-
-            retList.append(eval(returnedString[i:i + j]))
-
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # GroupPositionCurrentGet :  Return current positions
-
-    def GroupPositionCurrentGet(self, socketId, GroupName, nbElement):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'GroupPositionCurrentGet(' + GroupName + ','
-
-        for i in range(nbElement):
-
-            if (i > 0):
-                command += ','
-
-            command += 'double *'
-
-        command += ')'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        if (error != 0):
-            return [error, returnedString]
-
-        i, j, retList = 0, 0, [error]
-
-        for paramNb in range(nbElement):
-
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-
-            retList.append(eval(returnedString[i:i + j]))
-
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # GroupPositionSetpointGet :  Return setpoint positions
-
-    def GroupPositionSetpointGet(self, socketId, GroupName, nbElement):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'GroupPositionSetpointGet(' + GroupName + ','
-
-        for i in range(nbElement):
-
-            if (i > 0):
-                command += ','
-
-            command += 'double *'
-
-        command += ')'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        if (error != 0):
-            return [error, returnedString]
-
-        i, j, retList = 0, 0, [error]
-
-        for paramNb in range(nbElement):
-
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-
-            retList.append(eval(returnedString[i:i + j]))
-
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # GroupPositionTargetGet :  Return target positions
-
-    def GroupPositionTargetGet(self, socketId, GroupName, nbElement):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'GroupPositionTargetGet(' + GroupName + ','
-
-        for i in range(nbElement):
-
-            if (i > 0):
-                command += ','
-
-            command += 'double *'
-
-        command += ')'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        if (error != 0):
-            return [error, returnedString]
-
-        i, j, retList = 0, 0, [error]
-
-        for paramNb in range(nbElement):
-
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-
-            retList.append(eval(returnedString[i:i + j]))
-
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # GroupStatusGet :  Return group status
-
-    def GroupStatusGet(self, socketId, GroupName):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'GroupStatusGet(' + GroupName + ',int *)'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        if (error != 0):
-            return [error, returnedString]
-
-        i, j, retList = 0, 0, [error]
-
-        while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-            j += 1
-
-        retList.append(eval(returnedString[i:i + j]))
-
-        return retList
-
-    # GroupStatusStringGet :  Return the group status string corresponding to the group status code
-
-    def GroupStatusStringGet(self, socketId, GroupStatusCode):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'GroupStatusStringGet(' + str(GroupStatusCode) + ',char *)'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # KillAll :  Put all groups in 'Not initialized' state
-
-    def KillAll(self, socketId):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'KillAll()'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # RestartApplication :  Restart the Controller
-
-    def RestartApplication(self, socketId):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'RestartApplication()'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # PositionerBacklashGet :  Read backlash value and status
-
-    def PositionerBacklashGet(self, socketId, PositionerName):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'PositionerBacklashGet(' + PositionerName + ',double *,char *)'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        if (error != 0):
-            return [error, returnedString]
-
-        i, j, retList = 0, 0, [error]
-
-        for paramNb in range(2):
-
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-
-            retList.append(eval(returnedString[i:i + j]))
-
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # PositionerBacklashSet :  Set backlash value
-
-    def PositionerBacklashSet(self, socketId, PositionerName, BacklashValue):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'PositionerBacklashSet(' + PositionerName + ',' + str(BacklashValue) + ')'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # PositionerBacklashEnable :  Enable the backlash
-
-    def PositionerBacklashEnable(self, socketId, PositionerName):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'PositionerBacklashEnable(' + PositionerName + ')'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # PositionerBacklashDisable :  Disable the backlash
-
-    def PositionerBacklashDisable(self, socketId, PositionerName):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'PositionerBacklashDisable(' + PositionerName + ')'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # PositionerCorrectorNotchFiltersSet :  Update filters parameters
-
-    def PositionerCorrectorNotchFiltersSet(self, socketId, PositionerName, NotchFrequency1, NotchBandwith1, NotchGain1,
-                                           NotchFrequency2, NotchBandwith2, NotchGain2):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'PositionerCorrectorNotchFiltersSet(' + PositionerName + ',' + str(NotchFrequency1) + ',' + str(
-            NotchBandwith1) + ',' + str(NotchGain1) + ',' + str(NotchFrequency2) + ',' + str(
-            NotchBandwith2) + ',' + str(NotchGain2) + ')'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # PositionerCorrectorNotchFiltersGet :  Read filters parameters
-
-    def PositionerCorrectorNotchFiltersGet(self, socketId, PositionerName):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'PositionerCorrectorNotchFiltersGet(' + PositionerName + ',double *,double *,double *,double *,double *,double *)'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        if (error != 0):
-            return [error, returnedString]
-
-        i, j, retList = 0, 0, [error]
-
-        for paramNb in range(6):
-
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-
-            retList.append(eval(returnedString[i:i + j]))
-
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # PositionerCorrectorPIDFFAccelerationSet :  Update corrector parameters
-
-    def PositionerCorrectorPIDFFAccelerationSet(self, socketId, PositionerName, ClosedLoopStatus, KP, KI, KD, KS,
-                                                IntegrationTime, DerivativeFilterCutOffFrequency, GKP, GKI, GKD, KForm,
-                                                FeedForwardGainAcceleration):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'PositionerCorrectorPIDFFAccelerationSet(' + PositionerName + ',' + str(ClosedLoopStatus) + ',' + str(
-            KP) + ',' + str(KI) + ',' + str(KD) + ',' + str(KS) + ',' + str(IntegrationTime) + ',' + str(
-            DerivativeFilterCutOffFrequency) + ',' + str(GKP) + ',' + str(GKI) + ',' + str(GKD) + ',' + str(
-            KForm) + ',' + str(FeedForwardGainAcceleration) + ')'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # PositionerCorrectorPIDFFAccelerationGet :  Read corrector parameters
-
-    def PositionerCorrectorPIDFFAccelerationGet(self, socketId, PositionerName):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'PositionerCorrectorPIDFFAccelerationGet(' + PositionerName + ',bool *,double *,double *,double *,double *,double *,double *,double *,double *,double *,double *,double *)'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        if (error != 0):
-            return [error, returnedString]
-
-        i, j, retList = 0, 0, [error]
-
-        for paramNb in range(12):
-
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-
-            retList.append(eval(returnedString[i:i + j]))
-
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # PositionerCorrectorPIDFFVelocitySet :  Update corrector parameters
-
-    def PositionerCorrectorPIDFFVelocitySet(self, socketId, PositionerName, ClosedLoopStatus, KP, KI, KD, KS,
-                                            IntegrationTime, DerivativeFilterCutOffFrequency, GKP, GKI, GKD, KForm,
-                                            FeedForwardGainVelocity):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'PositionerCorrectorPIDFFVelocitySet(' + PositionerName + ',' + str(ClosedLoopStatus) + ',' + str(
-            KP) + ',' + str(KI) + ',' + str(KD) + ',' + str(KS) + ',' + str(IntegrationTime) + ',' + str(
-            DerivativeFilterCutOffFrequency) + ',' + str(GKP) + ',' + str(GKI) + ',' + str(GKD) + ',' + str(
-            KForm) + ',' + str(FeedForwardGainVelocity) + ')'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # PositionerCorrectorPIDFFVelocityGet :  Read corrector parameters
-
-    def PositionerCorrectorPIDFFVelocityGet(self, socketId, PositionerName):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'PositionerCorrectorPIDFFVelocityGet(' + PositionerName + ',bool *,double *,double *,double *,double *,double *,double *,double *,double *,double *,double *,double *)'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        if (error != 0):
-            return [error, returnedString]
-
-        i, j, retList = 0, 0, [error]
-
-        for paramNb in range(12):
-
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-
-            retList.append(eval(returnedString[i:i + j]))
-
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # PositionerCorrectorPIDDualFFVoltageSet :  Update corrector parameters
-
-    def PositionerCorrectorPIDDualFFVoltageSet(self, socketId, PositionerName, ClosedLoopStatus, KP, KI, KD, KS,
-                                               IntegrationTime, DerivativeFilterCutOffFrequency, GKP, GKI, GKD, KForm,
-                                               FeedForwardGainVelocity, FeedForwardGainAcceleration, Friction):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'PositionerCorrectorPIDDualFFVoltageSet(' + PositionerName + ',' + str(ClosedLoopStatus) + ',' + str(
-            KP) + ',' + str(KI) + ',' + str(KD) + ',' + str(KS) + ',' + str(IntegrationTime) + ',' + str(
-            DerivativeFilterCutOffFrequency) + ',' + str(GKP) + ',' + str(GKI) + ',' + str(GKD) + ',' + str(
-            KForm) + ',' + str(FeedForwardGainVelocity) + ',' + str(FeedForwardGainAcceleration) + ',' + str(
-            Friction) + ')'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # PositionerCorrectorPIDDualFFVoltageGet :  Read corrector parameters
-
-    def PositionerCorrectorPIDDualFFVoltageGet(self, socketId, PositionerName):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'PositionerCorrectorPIDDualFFVoltageGet(' + PositionerName + ',bool *,double *,double *,double *,double *,double *,double *,double *,double *,double *,double *,double *,double *,double *)'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        if (error != 0):
-            return [error, returnedString]
-
-        i, j, retList = 0, 0, [error]
-
-        for paramNb in range(14):
-
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-
-            retList.append(eval(returnedString[i:i + j]))
-
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # PositionerCorrectorPIPositionSet :  Update corrector parameters
-
-    def PositionerCorrectorPIPositionSet(self, socketId, PositionerName, ClosedLoopStatus, KP, KI, IntegrationTime):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'PositionerCorrectorPIPositionSet(' + PositionerName + ',' + str(ClosedLoopStatus) + ',' + str(
-            KP) + ',' + str(KI) + ',' + str(IntegrationTime) + ')'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # PositionerCorrectorPIPositionGet :  Read corrector parameters
-
-    def PositionerCorrectorPIPositionGet(self, socketId, PositionerName):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'PositionerCorrectorPIPositionGet(' + PositionerName + ',bool *,double *,double *,double *)'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        if (error != 0):
-            return [error, returnedString]
-
-        i, j, retList = 0, 0, [error]
-
-        for paramNb in range(4):
-
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-
-            retList.append(eval(returnedString[i:i + j]))
-
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # PositionerCorrectorTypeGet :  Read corrector type
-
-    def PositionerCorrectorTypeGet(self, socketId, PositionerName):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'PositionerCorrectorTypeGet(' + PositionerName + ',char *)'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # PositionerCurrentVelocityAccelerationFiltersSet :  Set current velocity and acceleration cut off frequencies
-
-    def PositionerCurrentVelocityAccelerationFiltersSet(self, socketId, PositionerName, CurrentVelocityCutOffFrequency,
-                                                        CurrentAccelerationCutOffFrequency):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'PositionerCurrentVelocityAccelerationFiltersSet(' + PositionerName + ',' + str(
-            CurrentVelocityCutOffFrequency) + ',' + str(CurrentAccelerationCutOffFrequency) + ')'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # PositionerCurrentVelocityAccelerationFiltersGet :  Get current velocity and acceleration cut off frequencies
-
-    def PositionerCurrentVelocityAccelerationFiltersGet(self, socketId, PositionerName):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'PositionerCurrentVelocityAccelerationFiltersGet(' + PositionerName + ',double *,double *)'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        if (error != 0):
-            return [error, returnedString]
-
-        i, j, retList = 0, 0, [error]
-
-        for paramNb in range(2):
-
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-
-            retList.append(eval(returnedString[i:i + j]))
-
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # PositionerDriverStatusGet :  Read positioner driver status
-
-    def PositionerDriverStatusGet(self, socketId, PositionerName):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'PositionerDriverStatusGet(' + PositionerName + ',int *)'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        if (error != 0):
-            return [error, returnedString]
-
-        i, j, retList = 0, 0, [error]
-
-        while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-            j += 1
-
-        retList.append(eval(returnedString[i:i + j]))
-
-        return retList
-
-    # PositionerDriverStatusStringGet :  Return the positioner driver status string corresponding to the positioner error code
-
-    def PositionerDriverStatusStringGet(self, socketId, PositionerDriverStatus):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'PositionerDriverStatusStringGet(' + str(PositionerDriverStatus) + ',char *)'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # PositionerEncoderAmplitudeValuesGet :  Read analog interpolated encoder amplitude values
-
-    def PositionerEncoderAmplitudeValuesGet(self, socketId, PositionerName):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'PositionerEncoderAmplitudeValuesGet(' + PositionerName + ',double *,double *,double *,double *)'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        if (error != 0):
-            return [error, returnedString]
-
-        i, j, retList = 0, 0, [error]
-
-        for paramNb in range(4):
-
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-
-            retList.append(eval(returnedString[i:i + j]))
-
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # PositionerEncoderCalibrationParametersGet :  Read analog interpolated encoder calibration parameters
-
-    def PositionerEncoderCalibrationParametersGet(self, socketId, PositionerName):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'PositionerEncoderCalibrationParametersGet(' + PositionerName + ',double *,double *,double *,double *)'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        if (error != 0):
-            return [error, returnedString]
-
-        i, j, retList = 0, 0, [error]
-
-        for paramNb in range(4):
-
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-
-            retList.append(eval(returnedString[i:i + j]))
-
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # PositionerErrorGet :  Read and clear positioner error code
-
-    def PositionerErrorGet(self, socketId, PositionerName):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'PositionerErrorGet(' + PositionerName + ',int *)'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        if (error != 0):
-            return [error, returnedString]
-
-        i, j, retList = 0, 0, [error]
-
-        while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-            j += 1
-
-        retList.append(eval(returnedString[i:i + j]))
-
-        return retList
-
-    # PositionerErrorRead :  Read only positioner error code without clear it
-
-    def PositionerErrorRead(self, socketId, PositionerName):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'PositionerErrorRead(' + PositionerName + ',int *)'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        if (error != 0):
-            return [error, returnedString]
-
-        i, j, retList = 0, 0, [error]
-
-        while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-            j += 1
-
-        retList.append(eval(returnedString[i:i + j]))
-
-        return retList
-
-    # PositionerErrorStringGet :  Return the positioner status string corresponding to the positioner error code
-
-    def PositionerErrorStringGet(self, socketId, PositionerErrorCode):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'PositionerErrorStringGet(' + str(PositionerErrorCode) + ',char *)'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # PositionerHardwareStatusGet :  Read positioner hardware status
-
-    def PositionerHardwareStatusGet(self, socketId, PositionerName):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'PositionerHardwareStatusGet(' + PositionerName + ',int *)'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        if (error != 0):
-            return [error, returnedString]
-
-        i, j, retList = 0, 0, [error]
-
-        while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-            j += 1
-
-        retList.append(eval(returnedString[i:i + j]))
-
-        return retList
-
-    # PositionerHardwareStatusStringGet :  Return the positioner hardware status string corresponding to the positioner error code
-
-    def PositionerHardwareStatusStringGet(self, socketId, PositionerHardwareStatus):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'PositionerHardwareStatusStringGet(' + str(PositionerHardwareStatus) + ',char *)'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # PositionerHardInterpolatorFactorGet :  Get hard interpolator parameters
-
-    def PositionerHardInterpolatorFactorGet(self, socketId, PositionerName):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'PositionerHardInterpolatorFactorGet(' + PositionerName + ',int *)'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        if (error != 0):
-            return [error, returnedString]
-
-        i, j, retList = 0, 0, [error]
-
-        while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-            j += 1
-
-        retList.append(eval(returnedString[i:i + j]))
-
-        return retList
-
-    # PositionerHardInterpolatorFactorSet :  Set hard interpolator parameters
-
-    def PositionerHardInterpolatorFactorSet(self, socketId, PositionerName, InterpolationFactor):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'PositionerHardInterpolatorFactorSet(' + PositionerName + ',' + str(InterpolationFactor) + ')'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # PositionerMaximumVelocityAndAccelerationGet :  Return maximum velocity and acceleration of the positioner
-
-    def PositionerMaximumVelocityAndAccelerationGet(self, socketId, PositionerName):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'PositionerMaximumVelocityAndAccelerationGet(' + PositionerName + ',double *,double *)'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        if (error != 0):
-            return [error, returnedString]
-
-        i, j, retList = 0, 0, [error]
-
-        for paramNb in range(2):
-
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-
-            retList.append(eval(returnedString[i:i + j]))
-
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # PositionerMotionDoneGet :  Read motion done parameters
-
-    def PositionerMotionDoneGet(self, socketId, PositionerName):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'PositionerMotionDoneGet(' + PositionerName + ',double *,double *,double *,double *,double *)'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        if (error != 0):
-            return [error, returnedString]
-
-        i, j, retList = 0, 0, [error]
-
-        for paramNb in range(5):
-
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-
-            retList.append(eval(returnedString[i:i + j]))
-
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # PositionerMotionDoneSet :  Update motion done parameters
-
-    def PositionerMotionDoneSet(self, socketId, PositionerName, PositionWindow, VelocityWindow, CheckingTime,
-                                MeanPeriod, TimeOut):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'PositionerMotionDoneSet(' + PositionerName + ',' + str(PositionWindow) + ',' + str(
-            VelocityWindow) + ',' + str(CheckingTime) + ',' + str(MeanPeriod) + ',' + str(TimeOut) + ')'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # PositionerSGammaExactVelocityAjustedDisplacementGet :  Return adjusted displacement to get exact velocity
-
-    def PositionerSGammaExactVelocityAjustedDisplacementGet(self, socketId, PositionerName, DesiredDisplacement):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'PositionerSGammaExactVelocityAjustedDisplacementGet(' + PositionerName + ',' + str(
-            DesiredDisplacement) + ',double *)'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        if (error != 0):
-            return [error, returnedString]
-
-        i, j, retList = 0, 0, [error]
-
-        while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-            j += 1
-
-        retList.append(eval(returnedString[i:i + j]))
-
-        return retList
-
-    # PositionerSGammaParametersGet :  Read dynamic parameters for one axe of a group for a future displacement
-
-    def PositionerSGammaParametersGet(self, socketId, PositionerName):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'PositionerSGammaParametersGet(' + PositionerName + ',double *,double *,double *,double *)'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        if (error != 0):
-            return [error, returnedString]
-
-        i, j, retList = 0, 0, [error]
-
-        for paramNb in range(4):
-
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-
-            retList.append(eval(returnedString[i:i + j]))
-
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # PositionerSGammaParametersSet :  Update dynamic parameters for one axe of a group for a future displacement
-
-    def PositionerSGammaParametersSet(self, socketId, PositionerName, Velocity, Acceleration, MinimumTjerkTime,
-                                      MaximumTjerkTime):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'PositionerSGammaParametersSet(' + PositionerName + ',' + str(Velocity) + ',' + str(
-            Acceleration) + ',' + str(MinimumTjerkTime) + ',' + str(MaximumTjerkTime) + ')'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # PositionerSGammaParametersDistanceGet :  Returns distance during acceleration phase and distance during constant velocity phase
-
-    def PositionerSGammaParametersDistanceGet(self, socketId, PositionerName, Displacement, Velocity, Acceleration,
-                                              MinJerkTime, MaxJerkTime):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'PositionerSGammaParametersDistanceGet(' + PositionerName + ',' + str(Displacement) + ',' + str(
-            Velocity) + ',' + str(Acceleration) + ',' + str(MinJerkTime) + ',' + str(
-            MaxJerkTime) + ',double *,double *)'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        if (error != 0):
-            return [error, returnedString]
-
-        i, j, retList = 0, 0, [error]
-
-        for paramNb in range(2):
-
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-
-            retList.append(eval(returnedString[i:i + j]))
-
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # PositionerSGammaPreviousMotionTimesGet :  Read SettingTime and SettlingTime
-
-    def PositionerSGammaPreviousMotionTimesGet(self, socketId, PositionerName):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'PositionerSGammaPreviousMotionTimesGet(' + PositionerName + ',double *,double *)'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        if (error != 0):
-            return [error, returnedString]
-
-        i, j, retList = 0, 0, [error]
-
-        for paramNb in range(2):
-
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-
-            retList.append(eval(returnedString[i:i + j]))
-
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # PositionerStageParameterGet :  Return the stage parameter
-
-    def PositionerStageParameterGet(self, socketId, PositionerName, ParameterName):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'PositionerStageParameterGet(' + PositionerName + ',' + ParameterName + ',char *)'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # PositionerStageParameterSet :  Save the stage parameter
-
-    def PositionerStageParameterSet(self, socketId, PositionerName, ParameterName, ParameterValue):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'PositionerStageParameterSet(' + PositionerName + ',' + ParameterName + ',' + ParameterValue + ')'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # PositionerUserTravelLimitsGet :  Read UserMinimumTarget and UserMaximumTarget
-
-    def PositionerUserTravelLimitsGet(self, socketId, PositionerName):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'PositionerUserTravelLimitsGet(' + PositionerName + ',double *,double *)'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        if (error != 0):
-            return [error, returnedString]
-
-        i, j, retList = 0, 0, [error]
-
-        for paramNb in range(2):
-
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-
-            retList.append(eval(returnedString[i:i + j]))
-
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # PositionerUserTravelLimitsSet :  Update UserMinimumTarget and UserMaximumTarget
-
-    def PositionerUserTravelLimitsSet(self, socketId, PositionerName, UserMinimumTarget, UserMaximumTarget):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'PositionerUserTravelLimitsSet(' + PositionerName + ',' + str(UserMinimumTarget) + ',' + str(
-            UserMaximumTarget) + ')'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # HexapodMoveAbsolute :  Hexapod absolute move in a specific coordinate system
-
-    def HexapodMoveAbsolute(self, socketId, GroupName, CoordinateSystem, X, Y, Z, U, V, W):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'HexapodMoveAbsolute(' + GroupName + ',' + CoordinateSystem + ',' + str(X) + ',' + str(Y) + ',' + str(
-            Z) + ',' + str(U) + ',' + str(V) + ',' + str(W) + ')'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # HexapodMoveIncremental :  Hexapod incremental move in a specific coordinate system
-
-    def HexapodMoveIncremental(self, socketId, GroupName, CoordinateSystem, dX, dY, dZ, dU, dV, dW):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'HexapodMoveIncremental(' + GroupName + ',' + CoordinateSystem + ',' + str(dX) + ',' + str(
-            dY) + ',' + str(dZ) + ',' + str(dU) + ',' + str(dV) + ',' + str(dW) + ')'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # HexapodCoordinatesGet :  Get coordinates in a specific coordinate system of a point specified in another coordinate system
-
-    def HexapodCoordinatesGet(self, socketId, GroupName, CoordinateSystemIn, CoordinateSystemOut, Xin, Yin, Zin, Uin,
-                              Vin, Win):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'HexapodCoordinatesGet(' + GroupName + ',' + CoordinateSystemIn + ',' + CoordinateSystemOut + ',' + str(
-            Xin) + ',' + str(Yin) + ',' + str(Zin) + ',' + str(Uin) + ',' + str(Vin) + ',' + str(
-            Win) + ',double *,double *,double *,double *,double *,double *)'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        if (error != 0):
-            return [error, returnedString]
-
-        i, j, retList = 0, 0, [error]
-
-        for paramNb in range(6):
-
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-
-            retList.append(eval(returnedString[i:i + j]))
-
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # HexapodCoordinateSystemSet :  Modify the position of a coordinate system
-
-    def HexapodCoordinateSystemSet(self, socketId, GroupName, CoordinateSystem, X, Y, Z, U, V, W):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'HexapodCoordinateSystemSet(' + GroupName + ',' + CoordinateSystem + ',' + str(X) + ',' + str(
-            Y) + ',' + str(Z) + ',' + str(U) + ',' + str(V) + ',' + str(W) + ')'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # HexapodCoordinateSystemGet :  Get the position of a coordinate system
-
-    def HexapodCoordinateSystemGet(self, socketId, GroupName, CoordinateSystem):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'HexapodCoordinateSystemGet(' + GroupName + ',' + CoordinateSystem + ',double *,double *,double *,double *,double *,double *)'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        if (error != 0):
-            return [error, returnedString]
-
-        i, j, retList = 0, 0, [error]
-
-        for paramNb in range(6):
-
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-
-            retList.append(eval(returnedString[i:i + j]))
-
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # HexapodMoveIncrementalControl :  Hexapod trajectory (Line, Arc or Rotation) execution with the maximum velocity
-
-    def HexapodMoveIncrementalControl(self, socketId, GroupName, CoordinateSystem, HexapodTrajectoryType, dX, dY, dZ):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'HexapodMoveIncrementalControl(' + GroupName + ',' + CoordinateSystem + ',' + HexapodTrajectoryType + ',' + str(
-            dX) + ',' + str(dY) + ',' + str(dZ) + ')'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # HexapodMoveIncrementalControlWithTargetVelocity :  Hexapod trajectory (Line, Arc or Rotation) execution with a target velocity
-
-    def HexapodMoveIncrementalControlWithTargetVelocity(self, socketId, GroupName, CoordinateSystem,
-                                                        HexapodTrajectoryType, dX, dY, dZ, Velocity):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'HexapodMoveIncrementalControlWithTargetVelocity(' + GroupName + ',' + CoordinateSystem + ',' + HexapodTrajectoryType + ',' + str(
-            dX) + ',' + str(dY) + ',' + str(dZ) + ',' + str(Velocity) + ')'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # HexapodMoveIncrementalControlPulseAndGatheringSet :  Configure gathering with pulses : gathered data are X, Y, Z, U, V, W and pulses will be generated during only constant velocity
-
-    def HexapodMoveIncrementalControlPulseAndGatheringSet(self, socketId, GroupName, Divisor):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'HexapodMoveIncrementalControlPulseAndGatheringSet(' + GroupName + ',' + str(Divisor) + ')'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # HexapodMoveIncrementalControlLimitGet :  Returns the maximum velocity of carriage and the percent of the trajectory executable
-
-    def HexapodMoveIncrementalControlLimitGet(self, socketId, GroupName, CoordinateSystem, HexapodTrajectoryType, dX,
-                                              dY, dZ):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'HexapodMoveIncrementalControlLimitGet(' + GroupName + ',' + CoordinateSystem + ',' + HexapodTrajectoryType + ',' + str(
-            dX) + ',' + str(dY) + ',' + str(dZ) + ',double *,double *)'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        if (error != 0):
-            return [error, returnedString]
-
-        i, j, retList = 0, 0, [error]
-
-        for paramNb in range(2):
-
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-
-            retList.append(eval(returnedString[i:i + j]))
-
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # HexapodSGammaParametersDistanceGet :  Returns distance during acceleration phase and distance during constant velocity phase for a virtual SGamma profiler
-
-    def HexapodSGammaParametersDistanceGet(self, socketId, PositionerName, Displacement, Velocity, Acceleration,
-                                           MinJerkTime, MaxJerkTime):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'HexapodSGammaParametersDistanceGet(' + PositionerName + ',' + str(Displacement) + ',' + str(
-            Velocity) + ',' + str(Acceleration) + ',' + str(MinJerkTime) + ',' + str(
-            MaxJerkTime) + ',double *,double *)'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        if (error != 0):
-            return [error, returnedString]
-
-        i, j, retList = 0, 0, [error]
-
-        for paramNb in range(2):
+class ReplyParser(object):
+    """Decode the reply of an API call in one pass, given the output signature of that call.
 
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
+    Outputs are converted according to their C type (double *, int *, bool *, unsigned short *, char *).
+    API calls which only return strings get the reply back untouched, exactly as sent by the controller.
+    """
+    typeConverters = {'double': float, 'int': int, 'bool': int, 'unsigned short': int, 'char': str}
 
-            retList.append(eval(returnedString[i:i + j]))
+    def __init__(self, *outputTypes):
+        self.outputTypes = outputTypes
+        self.converters = tuple(ReplyParser.typeConverters[outputType] for outputType in outputTypes)
+        self.raw = all(outputType == 'char' for outputType in outputTypes)
 
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # OptionalModuleExecute :  Execute an optional module
-
-    def OptionalModuleExecute(self, socketId, ModuleFileName, TaskName):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'OptionalModuleExecute(' + ModuleFileName + ',' + TaskName + ')'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # OptionalModuleKill :  Kill an optional module
-
-    def OptionalModuleKill(self, socketId, TaskName):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'OptionalModuleKill(' + TaskName + ')'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # ControllerStatusGet :  Read controller current status
-
-    def ControllerStatusGet(self, socketId):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'ControllerStatusGet(int *)'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        if (error != 0):
-            return [error, returnedString]
-
-        i, j, retList = 0, 0, [error]
-
-        while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-            j += 1
-
-        retList.append(eval(returnedString[i:i + j]))
-
-        return retList
-
-    # ControllerStatusStringGet :  Return the controller status string corresponding to the controller status code
-
-    def ControllerStatusStringGet(self, socketId, ControllerStatusCode):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'ControllerStatusStringGet(' + str(ControllerStatusCode) + ',char *)'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # EEPROMCIESet :  Set CIE EEPROM reference string
-
-    def EEPROMCIESet(self, socketId, CardNumber, ReferenceString):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'EEPROMCIESet(' + str(CardNumber) + ',' + ReferenceString + ')'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # EEPROMDACOffsetCIESet :  Set CIE DAC offsets
-
-    def EEPROMDACOffsetCIESet(self, socketId, PlugNumber, DAC1Offset, DAC2Offset):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'EEPROMDACOffsetCIESet(' + str(PlugNumber) + ',' + str(DAC1Offset) + ',' + str(DAC2Offset) + ')'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # EEPROMDriverSet :  Set Driver EEPROM reference string
-
-    def EEPROMDriverSet(self, socketId, PlugNumber, ReferenceString):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'EEPROMDriverSet(' + str(PlugNumber) + ',' + ReferenceString + ')'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # EEPROMINTSet :  Set INT EEPROM reference string
-
-    def EEPROMINTSet(self, socketId, CardNumber, ReferenceString):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'EEPROMINTSet(' + str(CardNumber) + ',' + ReferenceString + ')'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # CPUCoreAndBoardSupplyVoltagesGet :  Get power informations
-
-    def CPUCoreAndBoardSupplyVoltagesGet(self, socketId):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'CPUCoreAndBoardSupplyVoltagesGet(double *,double *,double *,double *,double *,double *,double *,double *)'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        if (error != 0):
-            return [error, returnedString]
-
-        i, j, retList = 0, 0, [error]
-
-        for paramNb in range(8):
-
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-
-            retList.append(eval(returnedString[i:i + j]))
-
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # CPUTemperatureAndFanSpeedGet :  Get CPU temperature and fan speed
-
-    def CPUTemperatureAndFanSpeedGet(self, socketId):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'CPUTemperatureAndFanSpeedGet(double *,double *)'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        if (error != 0):
+    def __call__(self, error, returnedString):
+        if error != 0 or self.raw:
             return [error, returnedString]
 
-        i, j, retList = 0, 0, [error]
-
-        for paramNb in range(2):
-
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-
-            retList.append(eval(returnedString[i:i + j]))
-
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # ActionListGet :  Action list
-
-    def ActionListGet(self, socketId):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'ActionListGet(char *)'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # ActionExtendedListGet :  Action extended list
-
-    def ActionExtendedListGet(self, socketId):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'ActionExtendedListGet(char *)'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # APIExtendedListGet :  API method list
-
-    def APIExtendedListGet(self, socketId):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'APIExtendedListGet(char *)'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # APIListGet :  API method list without extended API
-
-    def APIListGet(self, socketId):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'APIListGet(char *)'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # ErrorListGet :  Error list
-
-    def ErrorListGet(self, socketId):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'ErrorListGet(char *)'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # EventListGet :  General event list
-
-    def EventListGet(self, socketId):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'EventListGet(char *)'
+        # last field takes whatever is left, so a trailing char * can safely contain commas.
+        fields = returnedString.split(',', len(self.converters) - 1)
 
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # GatheringListGet :  Gathering type list
-
-    def GatheringListGet(self, socketId):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'GatheringListGet(char *)'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # GatheringExtendedListGet :  Gathering type extended list
-
-    def GatheringExtendedListGet(self, socketId):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'GatheringExtendedListGet(char *)'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # GatheringExternalListGet :  External Gathering type list
-
-    def GatheringExternalListGet(self, socketId):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'GatheringExternalListGet(char *)'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # GroupStatusListGet :  Group status list
-
-    def GroupStatusListGet(self, socketId):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'GroupStatusListGet(char *)'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # HardwareInternalListGet :  Internal hardware list
-
-    def HardwareInternalListGet(self, socketId):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'HardwareInternalListGet(char *)'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # HardwareDriverAndStageGet :  Smart hardware
-
-    def HardwareDriverAndStageGet(self, socketId, PlugNumber):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'HardwareDriverAndStageGet(' + str(PlugNumber) + ',char *,char *)'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # HexapodTrajectoryListGet :  Hexapod trajectory type list
-
-    def HexapodTrajectoryListGet(self, socketId):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'HexapodTrajectoryListGet(char *)'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # ObjectsListGet :  Group name and positioner name
-
-    def ObjectsListGet(self, socketId):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'ObjectsListGet(char *)'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # PositionerErrorListGet :  Positioner error list
-
-    def PositionerErrorListGet(self, socketId):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'PositionerErrorListGet(char *)'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # PositionerHardwareStatusListGet :  Positioner hardware status list
-
-    def PositionerHardwareStatusListGet(self, socketId):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'PositionerHardwareStatusListGet(char *)'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # PositionerDriverStatusListGet :  Positioner driver status list
+        # a truncated or garbled reply is reported like a TCP timeout, so that callers drop the socket.
+        if len(fields) != len(self.converters):
+            return [-2, '']
 
-    def PositionerDriverStatusListGet(self, socketId):
+        try:
+            return [error] + [convert(field) for convert, field in zip(self.converters, fields)]
+        except ValueError:
+            return [-2, '']
 
-        if (XPS.__usedSockets[socketId] == 0):
-            return
 
-        command = 'PositionerDriverStatusListGet(char *)'
+def splitReply(reply):
+    """Split a raw reply, terminator excluded, into [error, returnedString].
+
+    A reply which cannot be decoded or whose error field is not an integer is reported like a TCP timeout.
+    """
+    try:
+        error, __, returnedString = reply.decode().partition(',')
+        return [int(error), returnedString]
+    except (UnicodeDecodeError, ValueError):
+        return [-2, '']
+
+
+@functools.lru_cache(maxsize=None)
+def replyParser(*outputTypes):
+    """Return the parser compiled for that output signature, parsers are shared between API calls."""
+    return ReplyParser(*outputTypes)
+
+
+class CommandRecorder(object):
+    """Stand-in for XPS, API calls made against it return their (command, parser) instead of being executed."""
+
+    def _execute(self, socketId, command, parser):
+        return command, parser
+
+
+_commandRecorder = CommandRecorder()
+
+
+# API calls, as given by the Programmer's manual : typed input parameters, then pointers to the outputs.
+# Lists (type Name[]) of a same call are interleaved element by element, type *[] is one output per list element and
+# type *[nbElement] a number of outputs given by the nbElement argument.
+signatures = """
+# Get controller motion kernel time load
+ControllerMotionKernelTimeLoadGet(double *, double *, double *, double *)
+# Return elapsed time from controller power on
+ElapsedTimeGet(double *)
+# Return the error string corresponding to the error code
+ErrorStringGet(int ErrorCode, char *)
+# Return firmware version
+FirmwareVersionGet(char *)
+# Execute a TCL script from a TCL file
+TCLScriptExecute(char TCLFileName, char TaskName, char ParametersList)
+# Execute a TCL script from a TCL file and wait the end of execution to return
+TCLScriptExecuteAndWait(char TCLFileName, char TaskName, char InputParametersList, char *)
+# Kill TCL Task
+TCLScriptKill(char TaskName)
+# Kill all TCL Tasks
+TCLScriptKillAll()
+# Get a timer
+TimerGet(char TimerName, int *)
+# Set a timer
+TimerSet(char TimerName, int FrequencyTicks)
+# Reboot the controller
+Reboot()
+# Log in
+Login(char Name, char Password)
+# Close all socket beside the one used to send this command
+CloseAllOtherSockets()
+# ** OBSOLETE ** Add an event
+EventAdd(char PositionerName, char EventName, char EventParameter, char ActionName, char ActionParameter1,
+    char ActionParameter2, char ActionParameter3)
+# ** OBSOLETE ** Read events and actions list
+EventGet(char PositionerName, char *)
+# ** OBSOLETE ** Delete an event
+EventRemove(char PositionerName, char EventName, char EventParameter)
+# ** OBSOLETE ** Wait an event
+EventWait(char PositionerName, char EventName, char EventParameter)
+# Configure one or several events
+EventExtendedConfigurationTriggerSet(char ExtendedEventName[], char EventParameter1[], char EventParameter2[],
+    char EventParameter3[], char EventParameter4[])
+# Read the event configuration
+EventExtendedConfigurationTriggerGet(char *)
+# Configure one or several actions
+EventExtendedConfigurationActionSet(char ExtendedActionName[], char ActionParameter1[], char ActionParameter2[],
+    char ActionParameter3[], char ActionParameter4[])
+# Read the action configuration
+EventExtendedConfigurationActionGet(char *)
+# Launch the last event and action configuration and return an ID
+EventExtendedStart(int *)
+# Read all event and action configurations
+EventExtendedAllGet(char *)
+# Read the event and action configuration defined by ID
+EventExtendedGet(int ID, char *, char *)
+# Remove the event and action configuration defined by ID
+EventExtendedRemove(int ID)
+# Wait events from the last event configuration
+EventExtendedWait()
+# Read different mnemonique type
+GatheringConfigurationGet(char *)
+# Configuration acquisition
+GatheringConfigurationSet(char Type[])
+# Maximum number of samples and current number during acquisition
+GatheringCurrentNumberGet(int *, int *)
+# Stop acquisition and save data
+GatheringStopAndSave()
+# Acquire a configured data
+GatheringDataAcquire()
+# Get a data line from gathering buffer
+GatheringDataGet(int IndexPoint, char *)
+# Empty the gathered data in memory to start new gathering from scratch
+GatheringReset()
+# Start a new gathering
+GatheringRun(int DataNumber, int Divisor)
+# Stop the data gathering (without saving to file)
+GatheringStop()
+# Configuration acquisition
+GatheringExternalConfigurationSet(char Type[])
+# Read different mnemonique type
+GatheringExternalConfigurationGet(char *)
+# Maximum number of samples and current number during acquisition
+GatheringExternalCurrentNumberGet(int *, int *)
+# Stop acquisition and save data
+GatheringExternalStopAndSave()
+# Get global array value
+GlobalArrayGet(int Number, char *)
+# Set global array value
+GlobalArraySet(int Number, char ValueString)
+# Get double global array value
+DoubleGlobalArrayGet(int Number, double *)
+# Set double global array value
+DoubleGlobalArraySet(int Number, double DoubleValue)
+# Read analog input or analog output for one or few input
+GPIOAnalogGet(char GPIOName[], double *[])
+# Set analog output for one or few output
+GPIOAnalogSet(char GPIOName[], double AnalogOutputValue[])
+# Read analog input gain (1, 2, 4 or 8) for one or few input
+GPIOAnalogGainGet(char GPIOName[], int *[])
+# Set analog input gain (1, 2, 4 or 8) for one or few input
+GPIOAnalogGainSet(char GPIOName[], int AnalogInputGainValue[])
+# Read digital output or digital input
+GPIODigitalGet(char GPIOName, unsigned short *)
+# Set Digital Output for one or few output TTL
+GPIODigitalSet(char GPIOName, unsigned short Mask, unsigned short DigitalOutputValue)
+# Return corrector outputs
+GroupCorrectorOutputGet(char GroupName, double *[nbElement])
+# Start home search sequence
+GroupHomeSearch(char GroupName)
+# Start home search sequence and execute a displacement
+GroupHomeSearchAndRelativeMove(char GroupName, double TargetDisplacement[])
+# Go to READY state with the users positions
+GroupReadyAtPosition(char GroupName, double EncoderPosition1, double EncoderPosition2, double EncoderPosition3,
+    double EncoderPosition4, double EncoderPosition5, double EncoderPosition6)
+# Start the initialization
+GroupInitialize(char GroupName)
+# Start the initialization with encoder calibration
+GroupInitializeWithEncoderCalibration(char GroupName)
+# Kill the group
+GroupKill(char GroupName)
+# Abort a move
+GroupMoveAbort(char GroupName)
+# Do an absolute move
+GroupMoveAbsolute(char GroupName, double TargetPosition[])
+# Do a relative move
+GroupMoveRelative(char GroupName, double TargetDisplacement[])
+# Set Motion disable on selected group
+GroupMotionDisable(char GroupName)
+# Set Motion enable on selected group
+GroupMotionEnable(char GroupName)
+# Return corrected profiler positions
+GroupPositionCorrectedProfilerGet(char GroupName, double PositionX, double PositionY, double *, double *)
+# Return current positions
+GroupPositionCurrentGet(char GroupName, double *[nbElement])
+# Return setpoint positions
+GroupPositionSetpointGet(char GroupName, double *[nbElement])
+# Return target positions
+GroupPositionTargetGet(char GroupName, double *[nbElement])
+# Return group status
+GroupStatusGet(char GroupName, int *)
+# Return the group status string corresponding to the group status code
+GroupStatusStringGet(int GroupStatusCode, char *)
+# Put all groups in 'Not initialized' state
+KillAll()
+# Restart the Controller
+RestartApplication()
+# Read backlash value and status
+PositionerBacklashGet(char PositionerName, double *, char *)
+# Set backlash value
+PositionerBacklashSet(char PositionerName, double BacklashValue)
+# Enable the backlash
+PositionerBacklashEnable(char PositionerName)
+# Disable the backlash
+PositionerBacklashDisable(char PositionerName)
+# Update filters parameters
+PositionerCorrectorNotchFiltersSet(char PositionerName, double NotchFrequency1, double NotchBandwith1,
+    double NotchGain1, double NotchFrequency2, double NotchBandwith2, double NotchGain2)
+# Read filters parameters
+PositionerCorrectorNotchFiltersGet(char PositionerName, double *, double *, double *, double *, double *, double *)
+# Update corrector parameters
+PositionerCorrectorPIDFFAccelerationSet(char PositionerName, int ClosedLoopStatus, double KP, double KI, double KD,
+    double KS, double IntegrationTime, double DerivativeFilterCutOffFrequency, double GKP, double GKI, double GKD,
+    double KForm, double FeedForwardGainAcceleration)
+# Read corrector parameters
+PositionerCorrectorPIDFFAccelerationGet(char PositionerName, bool *, double *, double *, double *, double *,
+    double *, double *, double *, double *, double *, double *, double *)
+# Update corrector parameters
+PositionerCorrectorPIDFFVelocitySet(char PositionerName, int ClosedLoopStatus, double KP, double KI, double KD,
+    double KS, double IntegrationTime, double DerivativeFilterCutOffFrequency, double GKP, double GKI, double GKD,
+    double KForm, double FeedForwardGainVelocity)
+# Read corrector parameters
+PositionerCorrectorPIDFFVelocityGet(char PositionerName, bool *, double *, double *, double *, double *, double *,
+    double *, double *, double *, double *, double *, double *)
+# Update corrector parameters
+PositionerCorrectorPIDDualFFVoltageSet(char PositionerName, int ClosedLoopStatus, double KP, double KI, double KD,
+    double KS, double IntegrationTime, double DerivativeFilterCutOffFrequency, double GKP, double GKI, double GKD,
+    double KForm, double FeedForwardGainVelocity, double FeedForwardGainAcceleration, double Friction)
+# Read corrector parameters
+PositionerCorrectorPIDDualFFVoltageGet(char PositionerName, bool *, double *, double *, double *, double *,
+    double *, double *, double *, double *, double *, double *, double *, double *, double *)
+# Update corrector parameters
+PositionerCorrectorPIPositionSet(char PositionerName, int ClosedLoopStatus, double KP, double KI,
+    double IntegrationTime)
+# Read corrector parameters
+PositionerCorrectorPIPositionGet(char PositionerName, bool *, double *, double *, double *)
+# Read corrector type
+PositionerCorrectorTypeGet(char PositionerName, char *)
+# Set current velocity and acceleration cut off frequencies
+PositionerCurrentVelocityAccelerationFiltersSet(char PositionerName, double CurrentVelocityCutOffFrequency,
+    double CurrentAccelerationCutOffFrequency)
+# Get current velocity and acceleration cut off frequencies
+PositionerCurrentVelocityAccelerationFiltersGet(char PositionerName, double *, double *)
+# Read positioner driver status
+PositionerDriverStatusGet(char PositionerName, int *)
+# Return the positioner driver status string corresponding to the positioner error code
+PositionerDriverStatusStringGet(int PositionerDriverStatus, char *)
+# Read analog interpolated encoder amplitude values
+PositionerEncoderAmplitudeValuesGet(char PositionerName, double *, double *, double *, double *)
+# Read analog interpolated encoder calibration parameters
+PositionerEncoderCalibrationParametersGet(char PositionerName, double *, double *, double *, double *)
+# Read and clear positioner error code
+PositionerErrorGet(char PositionerName, int *)
+# Read only positioner error code without clear it
+PositionerErrorRead(char PositionerName, int *)
+# Return the positioner status string corresponding to the positioner error code
+PositionerErrorStringGet(int PositionerErrorCode, char *)
+# Read positioner hardware status
+PositionerHardwareStatusGet(char PositionerName, int *)
+# Return the positioner hardware status string corresponding to the positioner error code
+PositionerHardwareStatusStringGet(int PositionerHardwareStatus, char *)
+# Get hard interpolator parameters
+PositionerHardInterpolatorFactorGet(char PositionerName, int *)
+# Set hard interpolator parameters
+PositionerHardInterpolatorFactorSet(char PositionerName, int InterpolationFactor)
+# Return maximum velocity and acceleration of the positioner
+PositionerMaximumVelocityAndAccelerationGet(char PositionerName, double *, double *)
+# Read motion done parameters
+PositionerMotionDoneGet(char PositionerName, double *, double *, double *, double *, double *)
+# Update motion done parameters
+PositionerMotionDoneSet(char PositionerName, double PositionWindow, double VelocityWindow, double CheckingTime,
+    double MeanPeriod, double TimeOut)
+# Return adjusted displacement to get exact velocity
+PositionerSGammaExactVelocityAjustedDisplacementGet(char PositionerName, double DesiredDisplacement, double *)
+# Read dynamic parameters for one axe of a group for a future displacement
+PositionerSGammaParametersGet(char PositionerName, double *, double *, double *, double *)
+# Update dynamic parameters for one axe of a group for a future displacement
+PositionerSGammaParametersSet(char PositionerName, double Velocity, double Acceleration, double MinimumTjerkTime,
+    double MaximumTjerkTime)
+# Returns distance during acceleration phase and distance during constant velocity phase
+PositionerSGammaParametersDistanceGet(char PositionerName, double Displacement, double Velocity,
+    double Acceleration, double MinJerkTime, double MaxJerkTime, double *, double *)
+# Read SettingTime and SettlingTime
+PositionerSGammaPreviousMotionTimesGet(char PositionerName, double *, double *)
+# Return the stage parameter
+PositionerStageParameterGet(char PositionerName, char ParameterName, char *)
+# Save the stage parameter
+PositionerStageParameterSet(char PositionerName, char ParameterName, char ParameterValue)
+# Read UserMinimumTarget and UserMaximumTarget
+PositionerUserTravelLimitsGet(char PositionerName, double *, double *)
+# Update UserMinimumTarget and UserMaximumTarget
+PositionerUserTravelLimitsSet(char PositionerName, double UserMinimumTarget, double UserMaximumTarget)
+# Hexapod absolute move in a specific coordinate system
+HexapodMoveAbsolute(char GroupName, char CoordinateSystem, double X, double Y, double Z, double U, double V,
+    double W)
+# Hexapod incremental move in a specific coordinate system
+HexapodMoveIncremental(char GroupName, char CoordinateSystem, double dX, double dY, double dZ, double dU, double dV,
+    double dW)
+# Get coordinates in a specific coordinate system of a point specified in another coordinate system
+HexapodCoordinatesGet(char GroupName, char CoordinateSystemIn, char CoordinateSystemOut, double Xin, double Yin,
+    double Zin, double Uin, double Vin, double Win, double *, double *, double *, double *, double *, double *)
+# Modify the position of a coordinate system
+HexapodCoordinateSystemSet(char GroupName, char CoordinateSystem, double X, double Y, double Z, double U, double V,
+    double W)
+# Get the position of a coordinate system
+HexapodCoordinateSystemGet(char GroupName, char CoordinateSystem, double *, double *, double *, double *, double *,
+    double *)
+# Hexapod trajectory (Line, Arc or Rotation) execution with the maximum velocity
+HexapodMoveIncrementalControl(char GroupName, char CoordinateSystem, char HexapodTrajectoryType, double dX,
+    double dY, double dZ)
+# Hexapod trajectory (Line, Arc or Rotation) execution with a target velocity
+HexapodMoveIncrementalControlWithTargetVelocity(char GroupName, char CoordinateSystem, char HexapodTrajectoryType,
+    double dX, double dY, double dZ, double Velocity)
+# Configure gathering with pulses : gathered data are X, Y, Z, U, V, W and pulses will be generated during only constant velocity
+HexapodMoveIncrementalControlPulseAndGatheringSet(char GroupName, int Divisor)
+# Returns the maximum velocity of carriage and the percent of the trajectory executable
+HexapodMoveIncrementalControlLimitGet(char GroupName, char CoordinateSystem, char HexapodTrajectoryType, double dX,
+    double dY, double dZ, double *, double *)
+# Returns distance during acceleration phase and distance during constant velocity phase for a virtual SGamma profiler
+HexapodSGammaParametersDistanceGet(char PositionerName, double Displacement, double Velocity, double Acceleration,
+    double MinJerkTime, double MaxJerkTime, double *, double *)
+# Execute an optional module
+OptionalModuleExecute(char ModuleFileName, char TaskName)
+# Kill an optional module
+OptionalModuleKill(char TaskName)
+# Read controller current status
+ControllerStatusGet(int *)
+# Return the controller status string corresponding to the controller status code
+ControllerStatusStringGet(int ControllerStatusCode, char *)
+# Set CIE EEPROM reference string
+EEPROMCIESet(int CardNumber, char ReferenceString)
+# Set CIE DAC offsets
+EEPROMDACOffsetCIESet(int PlugNumber, double DAC1Offset, double DAC2Offset)
+# Set Driver EEPROM reference string
+EEPROMDriverSet(int PlugNumber, char ReferenceString)
+# Set INT EEPROM reference string
+EEPROMINTSet(int CardNumber, char ReferenceString)
+# Get power informations
+CPUCoreAndBoardSupplyVoltagesGet(double *, double *, double *, double *, double *, double *, double *, double *)
+# Get CPU temperature and fan speed
+CPUTemperatureAndFanSpeedGet(double *, double *)
+# Action list
+ActionListGet(char *)
+# Action extended list
+ActionExtendedListGet(char *)
+# API method list
+APIExtendedListGet(char *)
+# API method list without extended API
+APIListGet(char *)
+# Error list
+ErrorListGet(char *)
+# General event list
+EventListGet(char *)
+# Gathering type list
+GatheringListGet(char *)
+# Gathering type extended list
+GatheringExtendedListGet(char *)
+# External Gathering type list
+GatheringExternalListGet(char *)
+# Group status list
+GroupStatusListGet(char *)
+# Internal hardware list
+HardwareInternalListGet(char *)
+# Smart hardware
+HardwareDriverAndStageGet(int PlugNumber, char *, char *)
+# Hexapod trajectory type list
+HexapodTrajectoryListGet(char *)
+# Group name and positioner name
+ObjectsListGet(char *)
+# Positioner error list
+PositionerErrorListGet(char *)
+# Positioner hardware status list
+PositionerHardwareStatusListGet(char *)
+# Positioner driver status list
+PositionerDriverStatusListGet(char *)
+# Get referencing action list
+ReferencingActionListGet(char *)
+# Get referencing sensor list
+ReferencingSensorListGet(char *)
+# Return UserDatas values
+GatheringUserDatasGet(double *, double *, double *, double *, double *, double *, double *, double *)
+# Get controller motion kernel min/max periods
+ControllerMotionKernelPeriodMinMaxGet(double *, double *, double *, double *, double *, double *)
+# Reset controller motion kernel min/max periods
+ControllerMotionKernelPeriodMinMaxReset()
+# Test TCP/IP transfert
+TestTCP(char InputString, char *)
+# Kill QNX processes for firmware update
+PrepareForUpdate()
+"""
+
+signaturePattern = re.compile(r'^# (.*)\n(\w+)\(([^)]*)\)$', re.MULTILINE)
+parameterPattern = re.compile(r'(unsigned short|double|int|bool|char) ?(\*)? ?(\w*)(?:\[(\w*)\])?')
+
+
+@functools.lru_cache(maxsize=None)
+def apiTable():
+    """Return {apiName: (description, parameters)}, parameters being (type, isOutput, name, size) tuples."""
+    table = dict()
+
+    for description, apiName, parameters in signaturePattern.findall(signatures):
+        parameters = [parameterPattern.fullmatch(' '.join(parameter.split())).groups()
+                      for parameter in parameters.split(',') if parameter.strip()]
+        table[apiName] = description, [(type, bool(pointer), name, size) for type, pointer, name, size in parameters]
+
+    return table
+
+
+def compileApiCall(apiName):
+    """Generate the XPS method of that API call from its signature.
+
+    The command is built by concatenation, the same way hand-written methods used to, and the reply parser is
+    resolved once for all when the outputs do not depend on the arguments.
+    """
+    description, parameters = apiTable()[apiName]
+    # command pieces are either literals (tuple) or python expressions (str), outputs either types (tuple) or
+    # expressions of the arguments (str).
+    arguments, pieces, outputs, listItems = [], [], [], []
+
+    def flushList():
+        if not listItems:
+            return
+
+        items = ', '.join(repr(item[0]) if isinstance(item, tuple) else item for item in listItems)
+        pieces.append(f"','.join(','.join(({items},)) for i in range(len({listName})))")
+        listItems.clear()
+
+    for type, isOutput, name, size in parameters:
+        if size is None:
+            flushList()
+            if isOutput:
+                pieces.append((f'{type} *',))
+                outputs.append((type,))
+            else:
+                arguments.append(name)
+                pieces.append(name if type == 'char' else f'str({name})')
+
+        elif isOutput and size:
+            flushList()
+            arguments.append(size)
+            pieces.append(f"','.join({size} * ({f'{type} *'!r},))")
+            outputs.append(f'{size} * ({type!r},)')
+
+        elif isOutput:
+            listItems.append((f'{type} *',))
+            outputs.append(f'len({listName}) * ({type!r},)')
 
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
+        else:
+            listName = name if not listItems else listName
+            arguments.append(name)
+            listItems.append(f'{name}[i]' if type == 'char' else f'str({name}[i])')
+
+    flushList()
+
+    # merging literals, so that the command expression reads like a hand-written one.
+    tokens = [(f'{apiName}(',)]
+    for piece in pieces:
+        tokens.extend([(',',), piece] if len(tokens) > 1 else [piece])
+    tokens.append((')',))
+
+    expression = []
+    for token in tokens:
+        if isinstance(token, tuple) and expression and isinstance(expression[-1], tuple):
+            expression[-1] = (expression[-1][0] + token[0],)
+        else:
+            expression.append(token)
 
-        return [error, returnedString]
+    command = ' + '.join(repr(token[0]) if isinstance(token, tuple) else token for token in expression)
+    namespace = dict(replyParser=replyParser)
 
-    # ReferencingActionListGet :  Get referencing action list
+    if all(isinstance(output, tuple) for output in outputs):
+        namespace['parser'] = replyParser(*sum(outputs, ()))
+        parser = 'parser'
+    else:
+        outputs = ' + '.join(repr(output) if isinstance(output, tuple) else output for output in outputs)
+        parser = f'replyParser(*({outputs}))'
 
-    def ReferencingActionListGet(self, socketId):
+    source = (f"def {apiName}(self, socketId{''.join(f', {argument}' for argument in arguments)}):\n"
+              f"    return self._execute(socketId, {command}, {parser})\n")
+    exec(source, namespace)
 
-        if (XPS.__usedSockets[socketId] == 0):
-            return
+    function = namespace[apiName]
+    function.__doc__ = description
+    function.__qualname__ = f'XPS.{apiName}'
+    function.__module__ = __name__
 
-        command = 'ReferencingActionListGet(char *)'
+    return function
 
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
 
-        return [error, returnedString]
+class XPS(object):
+    # Defines
+    MAX_NB_SOCKETS = 100
+    BUFFER_SIZE = 4096
+    END_OF_API = b',EndOfAPI'
+    hangLimit = 45
 
-    # ReferencingSensorListGet :  Get referencing sensor list
+    # Initialization Function
+    def __init__(self):
+        # each client owns its sockets, so that several clients can coexist in the same process.
+        self.__sockets = {}
+        self.__buffers = {}
+        # per socket hangLimit, e.g. while a long motion is pending.
+        self.__hangLimits = {}
+        # free socketIds used as a stack : ids are handed out from 0 upwards, then the last freed one is reused first.
+        self.__freeSocketIds = list(reversed(range(self.MAX_NB_SOCKETS)))
+
+    def __getattr__(self, name):
+        # API calls are compiled on first use, later lookups find them on the class like regular methods.
+        return XPS._bind(name).__get__(self, type(self))
+
+    def __dir__(self):
+        return sorted(set(object.__dir__(self)) | set(apiTable()))
+
+    @classmethod
+    def _bind(cls, apiName):
+        """Return the XPS method of that API call, compiled from its signature and cached on first use."""
+        if apiName not in XPS.__dict__:
+            if apiName not in apiTable():
+                raise AttributeError(f"'{cls.__name__}' object has no attribute '{apiName}'")
+
+            setattr(XPS, apiName, compileApiCall(apiName))
+
+        return XPS.__dict__[apiName]
+
+    # Send commands and get returns, commands are written back-to-back and replies are read in order.
+    def __sendAndReceive(self, socketId, *commands):
+        try:
+            self.__sockets[socketId].sendall(''.join(commands).encode())
+            replies = self.__receiveReplies(socketId, len(commands))
+        except socket.timeout:
+            return len(commands) * [[-2, '']]
+        except socket.error:
+            return len(commands) * [[-2, '']]
 
-    def ReferencingSensorListGet(self, socketId):
+        return [splitReply(reply) for reply in replies]
 
-        if (XPS.__usedSockets[socketId] == 0):
+    # Send command and decode return
+    def _execute(self, socketId, command, parser):
+        if socketId not in self.__sockets:
             return
 
-        command = 'ReferencingSensorListGet(char *)'
+        [[error, returnedString]] = self.__sendAndReceive(socketId, command)
+        return parser(error, returnedString)
 
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
+    def batch(self, socketId, *calls):
+        """ Pipeline several API calls on one socket, so that they cost a single round trip.
 
-        return [error, returnedString]
-
-    # GatheringUserDatasGet :  Return UserDatas values
-
-    def GatheringUserDatasGet(self, socketId):
-
-        if (XPS.__usedSockets[socketId] == 0):
+        Each call is given as (apiName, arg1, arg2, ...), socketId excluded, e.g. ('GroupStatusGet', 'HEXAPOD').
+        Return decoded replies, in the same order as calls.
+        """
+        if socketId not in self.__sockets:
             return
 
-        command = 'GatheringUserDatasGet(double *,double *,double *,double *,double *,double *,double *,double *)'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        if (error != 0):
-            return [error, returnedString]
-
-        i, j, retList = 0, 0, [error]
-
-        for paramNb in range(8):
+        commands, parsers = zip(*[XPS._bind(apiName)(_commandRecorder, socketId, *args) for apiName, *args in calls])
+        replies = self.__sendAndReceive(socketId, *commands)
 
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
+        return [parser(error, returnedString) for parser, (error, returnedString) in zip(parsers, replies)]
 
-            retList.append(eval(returnedString[i:i + j]))
+    def __receiveReplies(self, socketId, nbReplies):
+        """ Read into the socket buffer until nbReplies ,EndOfAPI are found, only newly received bytes are scanned. """
+        sock = self.__sockets[socketId]
+        buffer = self.__buffers[socketId]
+        replies = []
+        nbytes = begin = 0
 
-            i, j = i + j + 1, 0
+        while True:
+            # buffer is full, double its size so that large replies are still received in linear time.
+            if nbytes == len(buffer):
+                buffer.extend(bytes(len(buffer)))
 
-        return retList
+            self.waitForInput(sock, self.getHangLimit(socketId))
 
-    # ControllerMotionKernelPeriodMinMaxGet :  Get controller motion kernel min/max periods
+            with memoryview(buffer) as view:
+                received = sock.recv_into(view[nbytes:])
 
-    def ControllerMotionKernelPeriodMinMaxGet(self, socketId):
+            if not received:
+                raise socket.error('Connection closed by hxp')
 
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'ControllerMotionKernelPeriodMinMaxGet(double *,double *,double *,double *,double *,double *)'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        if (error != 0):
-            return [error, returnedString]
-
-        i, j, retList = 0, 0, [error]
+            # terminator might straddle two chunks.
+            start = max(nbytes - len(XPS.END_OF_API) + 1, begin)
+            nbytes += received
 
-        for paramNb in range(6):
+            # one chunk can hold the end of a reply and the beginning of the next ones.
+            while True:
+                end = buffer.find(XPS.END_OF_API, start, nbytes)
 
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
+                if end == -1:
+                    break
 
-            retList.append(eval(returnedString[i:i + j]))
+                replies.append(bytes(buffer[begin:end]))
+                begin = start = end + len(XPS.END_OF_API)
 
-            i, j = i + j + 1, 0
+                if len(replies) == nbReplies:
+                    return replies
 
-        return retList
+    def waitForInput(self, sock, hangLimit=None):
+        """ Block/timeout until input is available. """
+        hangLimit = self.hangLimit if hangLimit is None else hangLimit
 
-    # ControllerMotionKernelPeriodMinMaxReset :  Reset controller motion kernel min/max periods
+        readers, writers, broken = select.select([sock.fileno()], [], [], hangLimit)
+        if len(readers) == 0:
+            raise socket.timeout('Timed out reading character from hxp')
 
-    def ControllerMotionKernelPeriodMinMaxReset(self, socketId):
+    def setHangLimit(self, socketId, hangLimit=None):
+        """ Wait for replies up to hangLimit seconds on that socket only, back to the default hangLimit if None. """
+        if hangLimit is None:
+            self.__hangLimits.pop(socketId, None)
+        else:
+            self.__hangLimits[socketId] = hangLimit
 
-        if (XPS.__usedSockets[socketId] == 0):
-            return
+    def getHangLimit(self, socketId):
+        """ Return the time replies are waited for on that socket, in seconds. """
+        return self.__hangLimits.get(socketId, self.hangLimit)
 
-        command = 'ControllerMotionKernelPeriodMinMaxReset()'
+    # TCP_ConnectToServer
+    def TCP_ConnectToServer(self, IP, port, timeOut):
+        if not self.__freeSocketIds:
+            return -1
 
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            sock.settimeout(timeOut)
+            sock.connect((IP, port))
+            sock.setblocking(1)
+        except socket.error:
+            sock.close()
+            return -1
 
-        return [error, returnedString]
+        socketId = self.__freeSocketIds.pop()
+        self.__sockets[socketId] = sock
+        self.__buffers[socketId] = bytearray(XPS.BUFFER_SIZE)
 
-    # TestTCP :  Test TCP/IP transfert
+        return socketId
 
-    def TestTCP(self, socketId, InputString):
+    # TCP_SetTimeout
+    def TCP_SetTimeout(self, socketId, timeOut):
+        if socketId in self.__sockets:
+            self.__sockets[socketId].settimeout(timeOut)
 
-        if (XPS.__usedSockets[socketId] == 0):
+    # TCP_CloseSocket
+    def TCP_CloseSocket(self, socketId):
+        # only sockets owned by this client can be closed.
+        sock = self.__sockets.pop(socketId, None)
+        if sock is None:
             return
 
-        command = 'TestTCP(' + InputString + ',char *)'
-
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
-
-        return [error, returnedString]
-
-    # PrepareForUpdate :  Kill QNX processes for firmware update
+        self.__buffers.pop(socketId)
+        self.__hangLimits.pop(socketId, None)
+        self.__freeSocketIds.append(socketId)
 
-    def PrepareForUpdate(self, socketId):
-
-        if (XPS.__usedSockets[socketId] == 0):
-            return
-
-        command = 'PrepareForUpdate()'
+        try:
+            sock.close()
+        except socket.error:
+            pass
 
-        [error, returnedString] = self.__sendAndReceive(socketId, command)
+    # GetLibraryVersion
+    def GetLibraryVersion(self):
+        return ['HXP Firmware V2.1.x']
 
-        return [error, returnedString]
@@ -2,43 +2,67 @@
 #
 # for TMCM-1180 firmware v4.45.
 
-from struct import pack, unpack
+import struct
 
 import numpy as np
 
+PACKET_SIZE = 9
 
-class sendPacket(object):
-    def __init__(self, moduleAddress=0, cmd=0, ctype=0, motorAddress=0, data=0):
-        object.__init__(self)
-        self.moduleAddress = np.uint8(moduleAddress)
-        self.cmd = np.uint8(cmd)
-        self.ctype = np.uint8(ctype)
-        self.motorAddress = np.uint8(motorAddress)
-        self.data = np.int32(data)
+# precompiled TMCL layouts : command without checksum, full packet, and the bytes the checksum is summed on.
+commandStruct = struct.Struct('>BBBBi')
+packetStruct = struct.Struct('>BBBBiB')
+checksumStruct = struct.Struct('>8B')
 
-    @property
-    def checksum(self):
-        data = pack('>BBBBi', self.moduleAddress, self.cmd, self.ctype, self.motorAddress, self.data)
-        checksum = sum(data)
-        checksum %= 256
-        return checksum
+# packets without data only depend on (cmd, ctype, motorAddress), see queryPacket.
+queryCache = dict()
 
-    @property
-    def cmdBytes(self):
-        return pack('>BBBBiB', self.moduleAddress, self.cmd, self.ctype, self.motorAddress, self.data, self.checksum)
 
+def checksum(buffer, offset=0):
+    """Return the checksum of the packet starting at offset in buffer."""
+    return sum(checksumStruct.unpack_from(buffer, offset)) & 0xff
 
-class recvPacket(object):
-    def __init__(self, bytes, fmtRet='>BBBBiB'):
-        self.getRet(*(unpack(fmtRet, bytes)))
 
-    def getRet(self, replyAddress, moduleAddress, status, cmd, data, checksum):
-        self.replyAddress = replyAddress
-        self.moduleAddress = moduleAddress
-        self.status = status
-        self.cmd = cmd
-        self.data = data
-        self.checksum = checksum
+def encodeInto(buffer, offset, cmd, ctype=0, motorAddress=0, data=0, moduleAddress=1):
+    """Pack a TMCL packet into buffer at offset, checksum included.
+
+    :param buffer: writable buffer, at least offset + PACKET_SIZE bytes long.
+    :param offset: packet offset in buffer.
+    :type data: int
+    """
+    commandStruct.pack_into(buffer, offset, moduleAddress, cmd, ctype, motorAddress, int(data))
+    buffer[offset + 8] = checksum(buffer, offset)
+
+
+def encode(cmd, ctype=0, motorAddress=0, data=0, moduleAddress=1):
+    """Return a TMCL packet, checksum included."""
+    buffer = bytearray(PACKET_SIZE)
+    encodeInto(buffer, 0, cmd, ctype=ctype, motorAddress=motorAddress, data=data, moduleAddress=moduleAddress)
+    return bytes(buffer)
+
+
+def decodeFrom(buffer, offset=0):
+    """Unpack the TMCL reply starting at offset in buffer.
+
+    :return: replyAddress, moduleAddress, status, cmd, data.
+    :raise: ValueError if checksum is wrong.
+    """
+    replyAddress, moduleAddress, status, cmd, data, packetChecksum = packetStruct.unpack_from(buffer, offset)
+
+    if checksum(buffer, offset) != packetChecksum:
+        raise ValueError('wrong checksum')
+
+    return replyAddress, moduleAddress, status, cmd, data
+
+
+def queryPacket(cmd, ctype, motorAddress, moduleAddress=1):
+    """Return a packet without data, encoded once and then served from cache."""
+    key = (cmd, ctype, motorAddress, moduleAddress)
+
+    try:
+        return queryCache[key]
+    except KeyError:
+        queryCache[key] = encode(cmd, ctype=ctype, motorAddress=motorAddress, moduleAddress=moduleAddress)
+        return queryCache[key]
 
 
 class TMCM(object):
@@ -144,75 +168,47 @@ class TMCM(object):
     def stop():
         """stop function
         """
-        packet = sendPacket(moduleAddress=TMCM.MODULE_ADDRESS,
-                            cmd=TMCM.TMCL_MST,
-                            ctype=0,
-                            motorAddress=TMCM.MOTOR_ADDRESS)
-        return packet.cmdBytes
+        return queryPacket(TMCM.TMCL_MST, 0, TMCM.MOTOR_ADDRESS, moduleAddress=TMCM.MODULE_ADDRESS)
 
     @staticmethod
     def MVP(direction, counts):
         # mvp function
         data = -counts if direction == TMCM.DIRECTION_A else counts
 
-        packet = sendPacket(moduleAddress=TMCM.MODULE_ADDRESS,
-                            cmd=TMCM.TMCL_MVP,
-                            ctype=TMCM.MVP_REL,
-                            motorAddress=TMCM.MOTOR_ADDRESS,
-                            data=data)
-        return packet.cmdBytes
+        return encode(TMCM.TMCL_MVP, ctype=TMCM.MVP_REL, motorAddress=TMCM.MOTOR_ADDRESS, data=data,
+                      moduleAddress=TMCM.MODULE_ADDRESS)
 
     @staticmethod
     def sap(paramId, data):
         """set axis function
         """
-        packet = sendPacket(moduleAddress=TMCM.MODULE_ADDRESS,
-                            cmd=TMCM.TMCL_SAP,
-                            ctype=paramId,
-                            motorAddress=TMCM.MOTOR_ADDRESS,
-                            data=data)
-        return packet.cmdBytes
+        return encode(TMCM.TMCL_SAP, ctype=paramId, motorAddress=TMCM.MOTOR_ADDRESS, data=data,
+                      moduleAddress=TMCM.MODULE_ADDRESS)
 
     @staticmethod
     def gap(paramId):
         """get axis parameter function
         """
-        packet = sendPacket(moduleAddress=TMCM.MODULE_ADDRESS,
-                            cmd=TMCM.TMCL_GAP,
-                            ctype=paramId,
-                            motorAddress=TMCM.MOTOR_ADDRESS)
-        return packet.cmdBytes
+        return queryPacket(TMCM.TMCL_GAP, paramId, TMCM.MOTOR_ADDRESS, moduleAddress=TMCM.MODULE_ADDRESS)
 
     @staticmethod
     def sgp(paramId, data, motorAddress):
         """set global parameter function
         """
-        packet = sendPacket(moduleAddress=TMCM.MODULE_ADDRESS,
-                            cmd=TMCM.TMCL_SGP,
-                            ctype=paramId,
-                            motorAddress=motorAddress,
-                            data=data)
-        return packet.cmdBytes
+        return encode(TMCM.TMCL_SGP, ctype=paramId, motorAddress=motorAddress, data=data,
+                      moduleAddress=TMCM.MODULE_ADDRESS)
 
     @staticmethod
     def ggp(paramId, motorAddress):
         """get global parameter function
         """
-        packet = sendPacket(moduleAddress=TMCM.MODULE_ADDRESS,
-                            cmd=TMCM.TMCL_GGP,
-                            ctype=paramId,
-                            motorAddress=motorAddress)
-        return packet.cmdBytes
+        return queryPacket(TMCM.TMCL_GGP, paramId, motorAddress, moduleAddress=TMCM.MODULE_ADDRESS)
 
     @staticmethod
     def gio(paramId, motorAddress):
         """get input/outputfunction
         """
-        packet = sendPacket(moduleAddress=TMCM.MODULE_ADDRESS,
-                            cmd=TMCM.TMCL_GIO,
-                            ctype=paramId,
-                            motorAddress=motorAddress)
-        return packet.cmdBytes
+        return queryPacket(TMCM.TMCL_GIO, paramId, motorAddress, moduleAddress=TMCM.MODULE_ADDRESS)
 
     @staticmethod
     def mm2ustep(stepIdx, valueMm):
@@ -238,3 +234,11 @@ class TMCM(object):
         :rtype:float
         """
         return np.float64(usteps / TMCM.mm2ustep(stepIdx, 1.0))
+
+
+# status queries are sent at every motion loop iteration, encode them once and for all.
+for paramId in [1, 3, 10, 11]:
+    TMCM.gap(paramId)
+
+TMCM.gio(paramId=10, motorAddress=0)
+TMCM.ggp(paramId=11, motorAddress=2)
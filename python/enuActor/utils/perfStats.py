@@ -0,0 +1,71 @@
+import math
+import threading
+from collections import Counter
+
+import numpy as np
+
+
+class LatencyHistogram(object):
+    # log-spaced bins, 10 per decade from 10us to 1000s, plus underflow and overflow.
+    binsPerDecade = 10
+    edges = np.logspace(-5, 3, 8 * binsPerDecade + 1)
+
+    def __init__(self):
+        """Latency distribution in fixed memory, whatever the number of samples."""
+        self.counts = [0] * (len(LatencyHistogram.edges) + 1)
+        self.total = 0.
+        self.max = 0.
+
+    @property
+    def count(self):
+        return sum(self.counts)
+
+    def add(self, elapsed):
+        """Add one sample, in seconds."""
+        # bin index computed directly, no search.
+        i = math.floor((math.log10(elapsed) + 5) * LatencyHistogram.binsPerDecade) + 1 if elapsed > 0 else 0
+        self.counts[min(max(i, 0), len(self.counts) - 1)] += 1
+        self.total += elapsed
+        self.max = max(self.max, elapsed)
+
+    def percentile(self, q):
+        """Return the upper edge of the bin holding the qth percentile, in seconds."""
+        cumsum = np.cumsum(self.counts)
+        if not cumsum[-1]:
+            return np.nan
+
+        i = np.searchsorted(cumsum, q / 100 * cumsum[-1], side='left')
+        return min(LatencyHistogram.edges[min(i, len(LatencyHistogram.edges) - 1)], self.max)
+
+
+class PerfStats(object):
+    def __init__(self):
+        """Per (function, socket) latency histograms and error code counters."""
+        self.lock = threading.Lock()
+        self.histograms = dict()
+        self.errors = dict()
+
+    def add(self, funcName, sockName, elapsed, errorCode=0):
+        """Record one call, errorCode != 0 are counted as well."""
+        key = funcName, sockName
+
+        with self.lock:
+            if key not in self.histograms:
+                self.histograms[key] = LatencyHistogram()
+                self.errors[key] = Counter()
+
+            self.histograms[key].add(elapsed)
+            if errorCode:
+                self.errors[key][errorCode] += 1
+
+    def reset(self):
+        with self.lock:
+            self.histograms.clear()
+            self.errors.clear()
+
+    def summary(self, percentiles=(50, 90, 99)):
+        """Return [(funcName, sockName, count, mean, percentiles..., max, {errorCode: count})], latencies in seconds."""
+        with self.lock:
+            return [(funcName, sockName, hist.count, hist.total / hist.count,
+                     *[hist.percentile(q) for q in percentiles], hist.max, dict(self.errors[funcName, sockName]))
+                    for (funcName, sockName), hist in sorted(self.histograms.items())]
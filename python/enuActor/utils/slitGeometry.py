@@ -0,0 +1,151 @@
+import functools
+
+import numpy as np
+
+axes = ['X', 'Y', 'Z', 'U', 'V', 'W']
+
+
+@functools.lru_cache(maxsize=64)
+def rotationMatrix(U, V, W):
+    """Rotation of a coordinate system defined by its U, V, W angles (deg), Rz(W).Ry(V).Rx(U), cached per system."""
+    [cU, cV, cW] = np.cos(np.deg2rad([U, V, W]))
+    [sU, sV, sW] = np.sin(np.deg2rad([U, V, W]))
+
+    Rx = np.array([[1, 0, 0], [0, cU, -sU], [0, sU, cU]])
+    Ry = np.array([[cV, 0, sV], [0, 1, 0], [-sV, 0, cV]])
+    Rz = np.array([[cW, -sW, 0], [sW, cW, 0], [0, 0, 1]])
+
+    R = Rz @ Ry @ Rx
+    R.flags.writeable = False
+
+    return R
+
+
+def rotationMatrices(angles):
+    """Vectorized rotationMatrix, (N, 3) U, V, W angles (deg) to (N, 3, 3) matrices."""
+    U, V, W = np.deg2rad(np.asarray(angles, dtype=float)).T
+    cU, cV, cW, sU, sV, sW = np.cos(U), np.cos(V), np.cos(W), np.sin(U), np.sin(V), np.sin(W)
+
+    return np.stack([np.stack([cW * cV, cW * sV * sU - sW * cU, cW * sV * cU + sW * sU], axis=-1),
+                     np.stack([sW * cV, sW * sV * sU + cW * cU, sW * sV * cU - cW * sU], axis=-1),
+                     np.stack([-sV, cV * sU, cV * cU], axis=-1)], axis=-2)
+
+
+def anglesFromMatrices(R):
+    """Inverse of rotationMatrices, (N, 3, 3) matrices to (N, 3) U, V, W angles (deg)."""
+    U = np.arctan2(R[:, 2, 1], R[:, 2, 2])
+    V = np.arcsin(np.clip(-R[:, 2, 0], -1, 1))
+    W = np.arctan2(R[:, 1, 0], R[:, 0, 0])
+
+    return np.rad2deg(np.stack([U, V, W], axis=-1))
+
+
+def toParent(poses, system):
+    """Express (N, 6) poses given in system, itself defined by [X, Y, Z, U, V, W] in its parent (e.g Work in Base)."""
+    poses = np.atleast_2d(np.asarray(poses, dtype=float))
+    R = rotationMatrix(*map(float, system[3:]))
+
+    positions = poses[:, :3] @ R.T + np.asarray(system[:3], dtype=float)
+    angles = anglesFromMatrices(R @ rotationMatrices(poses[:, 3:]))
+
+    return np.hstack([positions, angles])
+
+
+def fromParent(poses, system):
+    """Inverse of toParent, express (N, 6) poses given in the parent of system in system itself."""
+    poses = np.atleast_2d(np.asarray(poses, dtype=float))
+    R = rotationMatrix(*map(float, system[3:]))
+
+    positions = (poses[:, :3] - np.asarray(system[:3], dtype=float)) @ R
+    angles = anglesFromMatrices(R.T @ rotationMatrices(poses[:, 3:]))
+
+    return np.hstack([positions, angles])
+
+
+def convertToWorld(coords):
+    """Rotate X, Y of (N, 6) coordinates by their own W angle, Z, U, V, W are left untouched."""
+    coords = np.array(np.atleast_2d(coords), dtype=float)
+    W = np.deg2rad(coords[:, 5])
+    X, Y = coords[:, 0].copy(), coords[:, 1].copy()
+
+    coords[:, 0] = X * np.cos(W) - Y * np.sin(W)
+    coords[:, 1] = X * np.sin(W) + Y * np.cos(W)
+
+    return coords
+
+
+def slitPositions(coords, config):
+    """Interpret slit position of (N, 6) coordinates, return one slitPosition string per row."""
+    coords = np.atleast_2d(np.asarray(coords, dtype=float))
+    tolerance = config['positionTolerance']
+    [xPixToMm, yPixToMm] = config['pix_to_mm']
+
+    # consider any nans or angle out of tolerance as undef.
+    undef = np.isnan(coords).any(axis=1) | (np.abs(coords[:, 3:]).max(axis=1) > tolerance)
+    offset = np.abs(coords[:, :3]) > tolerance
+    home = ~undef & ~offset.any(axis=1)
+
+    positions = np.where(undef, 'undef', np.where(home, 'home', '')).astype(object)
+
+    for i in np.flatnonzero(~undef & ~home):
+        [focus, ditherY, ditherX] = coords[i, :3].tolist()
+        posStr = []
+
+        if offset[i, 0]:
+            sign = '+' if focus > 0 else '-'
+            posStr.append(f'focus{sign}{round(abs(focus), 2)}mm')
+        if offset[i, 2]:
+            sign = '+' if ditherX > 0 else '-'
+            posStr.append(f'ditherFib{sign}{round(abs(ditherX) / xPixToMm, 1)}pix')
+        if offset[i, 1]:
+            sign = '+' if ditherY > 0 else '-'
+            posStr.append(f'ditherWav{sign}{round(abs(ditherY) / yPixToMm, 1)}pix')
+
+        # format correctly with space.
+        positions[i] = f'''"{' '.join(posStr)}"'''
+
+    return positions.tolist()
+
+
+def ditherCoords(coords, config, X=None, Y=None, unit='mm'):
+    """
+    Return coordinates dithered along the configured dither axes.
+
+    Parameters
+    ----------
+    coords : array_like
+        Starting (6,) coordinates, zeros for a relative move.
+    config : dict
+        Slit configuration, providing axes, pix_to_mm, dither_xpix_to_v_angle and radius.
+    X, Y : float, optional
+        Dither values, left untouched if None.
+    unit : str
+        mm, microns or pixels.
+
+    Returns
+    -------
+    coords : `np.ndarray`
+        New (6,) coordinates.
+    """
+    focusAxis = np.array(config['focus_axis'], dtype=bool)
+    ditherXaxis = np.array(config['dither_x_axis'], dtype=bool)
+    ditherYaxis = np.array(config['dither_y_axis'], dtype=bool)
+
+    coeffX, coeffY = dict(mm=[1, 1], microns=[0.001, 0.001], pixels=config['pix_to_mm'])[unit]
+
+    coords = np.array(coords, dtype=float)
+    coords[ditherXaxis] = coeffX * X if X is not None else coords[ditherXaxis]
+    coords[ditherYaxis] = coeffY * Y if Y is not None else coords[ditherYaxis]
+
+    # overriding  with the new method (INSTRM-2575).
+    if unit == 'pixels' and X is not None:
+        V = X * config['dither_xpix_to_v_angle']
+        radius = config['radius']
+
+        phi = np.deg2rad(-V)
+        # overriding coords.
+        coords[focusAxis] = radius * (np.cos(phi) - 1.0)
+        coords[ditherXaxis] = radius * np.sin(phi)
+        coords[4] = V
+
+    return coords
@@ -0,0 +1,84 @@
+import time
+from collections import namedtuple
+
+import numpy as np
+from enuActor.utils.slitTelemetry import Poller
+
+# one controller health sample, load are ratios, periods in seconds, voltages in volts.
+HealthSample = namedtuple('HealthSample', ['timestamp', 'received', 'cpuTemperature', 'fanSpeed',
+                                           'totalLoad', 'correctorLoad', 'profilerLoad', 'servitudesLoad',
+                                           'correctorPeriodMax', 'profilerPeriodMax', 'servitudesPeriodMax',
+                                           'voltages', 'overloaded'])
+
+
+class HealthMonitor(Poller):
+    name = 'slitHealth'
+
+    def __init__(self, sample, period, historySize=1440, loadLimit=0.8, correctorPeriod=1e-4, periodFactor=1.5,
+                 onOverload=None):
+        """Sample hexapod controller health at a low rate, flagging motion kernel overload.
+
+        The kernel is considered overloaded if its total load ratio exceeds loadLimit, or if the corrector period
+        got stretched beyond periodFactor * correctorPeriod since the previous sample.
+
+        :param sample: callable returning the replies of CPUTemperatureAndFanSpeedGet,
+                       ControllerMotionKernelTimeLoadGet, ControllerMotionKernelPeriodMinMaxGet and
+                       CPUCoreAndBoardSupplyVoltagesGet.
+        :param period: time between two samples in seconds.
+        :param historySize: number of samples kept in history, a day at one sample per minute.
+        :param loadLimit: total kernel load ratio limit.
+        :param correctorPeriod: nominal corrector period in seconds.
+        :param periodFactor: corrector period stretch limit.
+        :param onOverload: callable(overloaded, sample) called whenever the overload flag changes.
+        """
+        Poller.__init__(self, sample, period, historySize=historySize)
+        self.loadLimit = loadLimit
+        self.correctorPeriod = correctorPeriod
+        self.periodFactor = periodFactor
+        self.onOverload = onOverload
+
+    @property
+    def overloaded(self):
+        """Overload flag of the latest sample, False if none."""
+        latest = self.latest
+        return latest is not None and latest.overloaded
+
+    def makeSnapshot(self, timestamp, reply):
+        """Decode replies, min/max periods being the ones since the previous sample."""
+        [cpuTemperature, fanSpeed], loads, periods, voltages = reply[:4]
+        [totalLoad, correctorLoad, profilerLoad, servitudesLoad] = loads
+        [__, correctorPeriodMax, __, profilerPeriodMax, __, servitudesPeriodMax] = periods
+
+        overloaded = totalLoad > self.loadLimit or correctorPeriodMax > self.periodFactor * self.correctorPeriod
+
+        return HealthSample(timestamp, time.time(), cpuTemperature, fanSpeed,
+                            totalLoad, correctorLoad, profilerLoad, servitudesLoad,
+                            correctorPeriodMax, profilerPeriodMax, servitudesPeriodMax,
+                            tuple(voltages), overloaded)
+
+    def onSnapshot(self, snapshot):
+        """Report overload flag changes."""
+        previous = self.history[-2].overloaded if len(self.history) > 1 else False
+
+        if snapshot.overloaded != previous and self.onOverload is not None:
+            self.onOverload(snapshot.overloaded, snapshot)
+
+    def summary(self, since=0):
+        """Summarize history.
+
+        :param since: only samples taken after since are summarized.
+        :return: temperature, max temperature, fan speed, mean and max total load, max corrector period,
+                 number of overloaded samples, number of samples ; None if no sample.
+        :rtype: tuple
+        """
+        samples = self.getHistory(since=since)
+
+        if not samples:
+            return None
+
+        latest = samples[-1]
+        totalLoad = np.array([sample.totalLoad for sample in samples])
+
+        return (latest.cpuTemperature, max(sample.cpuTemperature for sample in samples), latest.fanSpeed,
+                totalLoad.mean(), totalLoad.max(), max(sample.correctorPeriodMax for sample in samples),
+                sum(sample.overloaded for sample in samples), len(samples))
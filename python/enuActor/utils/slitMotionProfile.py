@@ -1,94 +1,143 @@
 import numpy as np
-from scipy.optimize import minimize
 
 
-def makeJerkArray(targetAcceleration, jerkTime, step):
-    yMax = targetAcceleration * 2 / jerkTime
-    a = yMax / (jerkTime / 2)
+# Analytic S-curve : jerk ramps linearly up then down over jerkTime to reach the acceleration, which is held for
+# timeAtConstantAcceleration, then brought back to zero symmetrically. Each phase being a polynomial in time, it is
+# integrated exactly instead of simulated, see tests/numericProfile.py for the simulation.
 
-    x1 = np.arange(0, jerkTime / 2, step)
-    y1 = x1 * a
 
-    x2 = np.arange(jerkTime / 2, jerkTime + step, step)
-    y2 = -x2 * a + yMax * 2
+def solveProfile(targetSpeed, maxAcceleration=5, jerkTime=0.05):
+    """Return (acceleration, timeAtConstantAcceleration) needed to reach abs(targetSpeed)."""
+    targetSpeed = abs(targetSpeed)
 
-    x = np.append(x1, x2)
-    y = np.append(y1, y2)
+    # a full jerk phase at maxAcceleration already brings you to maxAcceleration * jerkTime.
+    if maxAcceleration * jerkTime >= targetSpeed:
+        return targetSpeed / jerkTime, 0.
 
-    return x, y
+    return maxAcceleration, targetSpeed / maxAcceleration - jerkTime
 
 
-def makeFullJerkArray(targetAcceleration, timeAtConstantAcceleration, jerkTime, step):
-    x1, y1 = makeJerkArray(targetAcceleration, jerkTime, step)
+def profileSegments(targetSpeed, maxAcceleration=5, jerkTime=0.05):
+    """
+    Return the motion profile as consecutive segments where jerk is linear in time.
 
-    if not timeAtConstantAcceleration:
-        x2 = y2 = []
-        offset = x1.max()
-    else:
-        x2 = np.arange(0, timeAtConstantAcceleration, step) + step + x1.max()
-        y2 = np.zeros(len(x2))
-        offset = x2.max()
+    Parameters
+    ----------
+    targetSpeed : float
+        Signed target speed, a negative speed gives the mirrored profile.
+    maxAcceleration : float
+        Maximum acceleration.
+    jerkTime : float
+        Time to ramp acceleration up (and down), in seconds.
 
-    x3, y3 = makeJerkArray(targetAcceleration, jerkTime, step)
-    y3 *= -1
-    x3 += (step + offset)
+    Returns
+    -------
+    segments : `np.ndarray`
+        (6, 7) array, one row per segment : start time, duration, jerk at start, jerk slope, and acceleration, speed,
+        position at start. The last segment is at constant speed and lasts forever.
+    """
+    acceleration, timeAtConstantAcceleration = solveProfile(targetSpeed, maxAcceleration, jerkTime)
+    halfTime = jerkTime / 2
+    slope = np.copysign(4 * acceleration / jerkTime ** 2, targetSpeed)
+    jerkMax = slope * halfTime
 
-    x = np.concatenate([x1, x2, x3])
-    y = np.concatenate([y1, y2, y3])
+    phases = [(halfTime, 0, slope), (halfTime, jerkMax, -slope), (timeAtConstantAcceleration, 0, 0),
+              (halfTime, 0, -slope), (halfTime, -jerkMax, slope), (np.inf, 0, 0)]
 
-    # Extending modeling to 1s.
-    xExtended = np.arange(x[-1], 1, step) + step
-    yExtended = np.zeros(len(xExtended))
-    x = np.append(x, xExtended)
-    y = np.append(y, yExtended)
+    segments = np.zeros((len(phases), 7))
+    t0 = a0 = v0 = p0 = 0.
 
-    return x, y
+    for i, (duration, j0, s) in enumerate(phases):
+        segments[i] = t0, duration, j0, s, a0, v0, p0
 
+        if np.isfinite(duration):
+            t0, [a0, v0, p0] = t0 + duration, integrateSegment(segments[i], duration)
 
-def getMaxSpeed(targetAcceleration, timeAtConstantAcceleration, jerkTime, step):
-    """Calculate maximum speed given targetAcceleration amd timeAtConstantAcceleration. """
-    x, y = makeFullJerkArray(targetAcceleration, timeAtConstantAcceleration, jerkTime=jerkTime, step=step)
-    acceleration = np.cumsum(step * y)
-    speed = np.cumsum(step * acceleration)
-    return np.max(speed)
+    return segments
 
 
-def makeJerkProfile(targetSpeed, maxAcceleration=5, jerkTime=0.05):
-    """Make jerkProfile, acceleration, speed, position profiles can be calculated from this."""
-    step = jerkTime / 2000
+def integrateSegment(segment, t):
+    """Return acceleration, speed, position t seconds after segment start."""
+    __, __, j0, s, a0, v0, p0 = segment
+    t = np.asarray(t, dtype=float)
 
-    def findTargetAcceleration(targetAcceleration):
-        return abs(getMaxSpeed(targetAcceleration, 0, jerkTime=jerkTime, step=step) - targetSpeed)
+    acceleration = a0 + j0 * t + s * t ** 2 / 2
+    speed = v0 + a0 * t + j0 * t ** 2 / 2 + s * t ** 3 / 6
+    position = p0 + v0 * t + a0 * t ** 2 / 2 + j0 * t ** 3 / 6 + s * t ** 4 / 24
 
-    def findTimeAtConstantAcceleration(timeAtConstantAcceleration):
-        return abs(getMaxSpeed(maxAcceleration, timeAtConstantAcceleration, jerkTime=jerkTime, step=step) - targetSpeed)
+    return acceleration, speed, position
 
-    timeAtConstantAcceleration = 0
-    targetAcceleration = maxAcceleration
 
-    maxSpeed = getMaxSpeed(maxAcceleration, timeAtConstantAcceleration, jerkTime=jerkTime, step=step)
+def motionProfile(t, targetSpeed, maxAcceleration=5, jerkTime=0.05):
+    """Return jerk, acceleration, speed, position profiles at times t."""
+    segments = profileSegments(targetSpeed, maxAcceleration, jerkTime)
+    t = np.asarray(t, dtype=float)
+    # zero-length segments (no constant acceleration) are skipped by searchsorted.
+    iSegment = np.searchsorted(segments[:, 0], t, side='right') - 1
+    segment = segments[np.clip(iSegment, 0, None)].T
+    dt = t - segment[0]
 
-    if maxSpeed > targetSpeed:
-        targetAcceleration = \
-            minimize(findTargetAcceleration, x0=(maxAcceleration * targetSpeed / maxSpeed), method='Nelder-Mead').x[0]
-    else:
-        timeAtConstantAcceleration = \
-            minimize(findTimeAtConstantAcceleration, x0=((targetSpeed - maxSpeed) / maxAcceleration),
-                     method='Nelder-Mead').x[0]
+    jerk = np.where(np.isinf(segment[1]), 0, segment[2] + segment[3] * dt)
 
-    return makeFullJerkArray(targetAcceleration, timeAtConstantAcceleration, jerkTime=jerkTime, step=step)
+    return (jerk, *integrateSegment(segment, dt))
+
+
+def moveDuration(displacement, velocity, acceleration, jerkTime):
+    """
+    Return the duration of a point to point move following the same S-curve, velocity being reached or not.
+
+    Parameters
+    ----------
+    displacement : float
+        Move length, sign does not matter.
+    velocity : float
+        Maximum velocity.
+    acceleration : float
+        Maximum acceleration.
+    jerkTime : float
+        Time to ramp acceleration up (and down), in seconds.
+
+    Returns
+    -------
+    duration : float
+        Move duration in seconds, settling excluded.
+    """
+    displacement = abs(displacement)
+
+    if not displacement:
+        return 0.
+
+    __, timeAtConstantAcceleration = solveProfile(velocity, acceleration, jerkTime)
+    accelerationTime = 2 * jerkTime + timeAtConstantAcceleration
+
+    # acceleration and deceleration both cover velocity * accelerationTime / 2.
+    if displacement >= velocity * accelerationTime:
+        return displacement / velocity + accelerationTime
+
+    # velocity is never reached, acceleration neither for short moves.
+    if displacement <= 2 * acceleration * jerkTime ** 2:
+        return 4 * jerkTime
+
+    peakVelocity = acceleration / 2 * (np.sqrt(jerkTime ** 2 + 4 * displacement / acceleration) - jerkTime)
+    return 2 * (peakVelocity / acceleration + jerkTime)
+
+
+def makeJerkProfile(targetSpeed, maxAcceleration=5, jerkTime=0.05, step=None):
+    """Make jerkProfile sampled every step up to 1s (or the end of the acceleration)."""
+    step = jerkTime / 2000 if step is None else step
+    segments = profileSegments(targetSpeed, maxAcceleration, jerkTime)
+
+    x = np.arange(0, max(1, segments[-1, 0]) + step, step)
+    jerk, __, __, __ = motionProfile(x, targetSpeed, maxAcceleration, jerkTime)
+
+    return x, jerk
 
 
 def calculateDistanceBeforeAtSpeed(targetSpeed, safetyFactor=2):
-    """Calculate distance before reaching targetSpeed."""
-    # simulate dataset
-    x, y = makeJerkProfile(targetSpeed, maxAcceleration=targetSpeed * 4, jerkTime=0.05)
-    step = np.diff(x).mean()
-    acceleration = np.cumsum(step * y)
-    speed = np.cumsum(step * acceleration)
-    position = np.cumsum(step * speed)
-    # finding how much distance to reach targetSpeed.
-    iAtSpeed = np.argmin(abs(speed - targetSpeed))
-    distance = position[iAtSpeed]
-    # simulation is quite accurate but let's be safe and take a factor 2
+    """Calculate distance before reaching targetSpeed, always positive whatever the direction."""
+    acceleration, timeAtConstantAcceleration = solveProfile(targetSpeed, maxAcceleration=abs(targetSpeed) * 4,
+                                                            jerkTime=0.05)
+    # acceleration profile is symmetric, average speed is half the target speed.
+    distance = abs(targetSpeed) * (2 * 0.05 + timeAtConstantAcceleration) / 2
+    # let's be safe and take a factor 2
     return distance * safetyFactor
@@ -0,0 +1,280 @@
+import datetime
+import math
+import os
+import struct
+import time
+
+import numpy as np
+import pandas as pd
+
+# polled positions are cartesian, gathered ones are actuator positions, the gathering does not know about X..W.
+cartesianColumns = ['X', 'Y', 'Z', 'U', 'V', 'W']
+gatheringTypes = [f'HEXAPOD.{actuator}.CurrentPosition' for actuator in range(1, 7)]
+
+
+def makeColumns(coordColumns):
+    """Return all columns for those six coordinate columns."""
+    if len(coordColumns) != 6:
+        raise ValueError(f'expected 6 coordinate columns, got {len(coordColumns)}')
+
+    return ['status'] + list(coordColumns) + ['timestamp']
+
+
+def makeDtype(columns):
+    """Return the fixed size record for those columns, one per sample."""
+    return np.dtype([('status', '<i8')] + [(column, '<f8') for column in columns[1:]])
+
+
+def gatheringColumns(types):
+    """Return coordinate columns named after the gathered types, eg HEXAPOD.1 for HEXAPOD.1.CurrentPosition."""
+    return [gatheringType[:-len('.CurrentPosition')] if gatheringType.endswith('.CurrentPosition') else gatheringType
+            for gatheringType in types]
+
+
+columns = makeColumns(cartesianColumns)
+dtype = makeDtype(columns)
+# gathering base frequency in Hz, a sample is taken every divisor servo cycles.
+servoRate = 10000
+
+# binary file header : magic, version, record size, comma separated column names.
+magic = b'PFSSLIT\x00'
+version = 1
+header = struct.Struct('<8sII112s')
+
+
+class SlitPositionWriter(object):
+    def __init__(self, filePath, blockSize=10000, coordColumns=None):
+        """Append-only binary writer, samples are buffered in a fixed-size numpy block, flushed to disk once full.
+
+        Memory stays constant whatever the recording duration, and only the current block is lost on a crash.
+
+        :param filePath: binary file path.
+        :param blockSize: number of samples per block.
+        :param coordColumns: names of the six recorded coordinates, cartesianColumns by default.
+        """
+        self.columns = makeColumns(cartesianColumns if coordColumns is None else coordColumns)
+        names = ','.join(self.columns).encode()
+
+        if len(names) > header.size - 16:
+            raise ValueError(f'column names too long to fit in header : {names}')
+
+        self.filePath = filePath
+        self.block = np.zeros(blockSize, dtype=makeDtype(self.columns))
+        self.nRows = 0
+        self.nSamples = 0
+
+        self.file = open(filePath, 'wb')
+        self.file.write(header.pack(magic, version, self.block.dtype.itemsize, names))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def append(self, status, coords, timestamp):
+        """Add one sample."""
+        self.block[self.nRows] = (status, *coords, timestamp)
+        self.nRows += 1
+        self.nSamples += 1
+
+        if self.nRows == len(self.block):
+            self.flush()
+
+    def extend(self, records):
+        """Add samples from a structured array with the same dtype."""
+        for start in range(0, len(records), len(self.block)):
+            self.flush()
+            chunk = records[start:start + len(self.block)]
+            self.block[:len(chunk)] = chunk
+            self.nRows = len(chunk)
+            self.nSamples += len(chunk)
+
+        if self.nRows == len(self.block):
+            self.flush()
+
+    def flush(self):
+        """Write current block to disk."""
+        if not self.nRows:
+            return
+
+        self.file.write(self.block[:self.nRows].tobytes())
+        self.file.flush()
+        self.nRows = 0
+
+    def close(self):
+        self.flush()
+        self.file.close()
+
+
+def load(filePath):
+    """Memory-map a binary recording, an incomplete trailing record is ignored."""
+    with open(filePath, 'rb') as file:
+        fileMagic, fileVersion, recordSize, fileColumns = header.unpack(file.read(header.size))
+
+    fileDtype = makeDtype(fileColumns.rstrip(b'\x00').decode().split(','))
+
+    if fileMagic != magic or recordSize != fileDtype.itemsize:
+        raise ValueError(f'{filePath} is not a slit position recording')
+
+    nSamples = (os.path.getsize(filePath) - header.size) // recordSize
+
+    return np.memmap(filePath, dtype=fileDtype, mode='r', offset=header.size, shape=(nSamples,))
+
+
+def exportCsv(filePath, csvPath=None, chunkSize=100000):
+    """Export a binary recording to csv, chunk by chunk, return csv file path."""
+    csvPath = f'{os.path.splitext(filePath)[0]}.csv' if csvPath is None else csvPath
+    records = load(filePath)
+
+    with open(csvPath, 'w') as csv:
+        for start in range(0, max(len(records), 1), chunkSize):
+            df = pd.DataFrame(records[start:start + chunkSize], columns=records.dtype.names)
+            df.index += start
+            df.to_csv(csv, header=not start)
+
+    return csvPath
+
+
+def fileName(start, specNum=0, extension='bin'):
+    """Return SM{specNum}_slitPosition_{isoformat}.{extension}."""
+    # Convert it to datetime obje
+    dt_object = datetime.datetime.fromtimestamp(start)
+    # Convert datetime object to ISO format without microseconds
+    isoformat = dt_object.replace(microsecond=0).isoformat().replace(':', '-')
+
+    return f'SM{specNum}_slitPosition_{isoformat}.{extension}'
+
+
+def checkReply(reply, funcName):
+    """Raise RuntimeError if the controller returned an error, return the values otherwise."""
+    error, *values = reply
+
+    if error != 0:
+        raise RuntimeError(f'{funcName}: failed with code {error}')
+
+    return values
+
+
+def gatherSlitPosition(xps, socketId, duration, writer, divisor=1, types=None, rate=servoRate, chunkSize=500):
+    """
+    Record slit position with the hexapod controller gathering, at servo rate / divisor.
+
+    Samples are taken and timestamped by the controller itself, the buffer is downloaded in bulk once the acquisition
+    is over, pipelining chunkSize GatheringDataGet per round trip.
+
+    Parameters
+    ----------
+    xps : `hxp_drivers.XPS`
+        Hexapod client.
+    socketId : int
+        Connected socket, not used by anything else during the recording.
+    duration : float
+        Recording duration in seconds.
+    writer : `SlitPositionWriter`
+        Where samples are streamed, its coordinate columns must be gatheringColumns(types).
+    divisor : int, optional
+        Sample every divisor servo cycles, increased if the controller buffer is too small for that duration.
+    types : list of str, optional
+        Six gathering types, gatheringTypes by default, ie actuators positions.
+    rate : float, optional
+        Servo rate in Hz.
+    chunkSize : int, optional
+        Number of samples downloaded per round trip.
+
+    Returns
+    -------
+    int
+        Number of recorded samples.
+
+    Raises
+    ------
+    ValueError
+        If there are not six types, or if writer columns do not match them.
+    RuntimeError
+        If the controller returns an error.
+    """
+    types = gatheringTypes if types is None else types
+
+    if len(types) != 6:
+        raise ValueError(f'expected 6 gathering types, got {len(types)}')
+
+    if writer.columns != makeColumns(gatheringColumns(types)):
+        raise ValueError(f'writer columns {writer.columns[1:7]} do not match gathering types {types}')
+
+    checkReply(xps.GatheringReset(socketId), 'GatheringReset')
+    checkReply(xps.GatheringConfigurationSet(socketId, types), 'GatheringConfigurationSet')
+    __, maxSamples = checkReply(xps.GatheringCurrentNumberGet(socketId), 'GatheringCurrentNumberGet')
+
+    # lowering the sampling rate if the whole duration does not fit in the controller buffer.
+    divisor = max(int(divisor), math.ceil(duration * rate / maxSamples))
+    nSamples = math.ceil(duration * rate / divisor)
+
+    s1 = time.time()
+    checkReply(xps.GatheringRun(socketId, nSamples, divisor), 'GatheringRun')
+    s2 = time.time()
+    start = (s1 + s2) / 2
+
+    # gathering stops by itself once nSamples are acquired.
+    while True:
+        time.sleep(min(0.5, duration))
+        current, __ = checkReply(xps.GatheringCurrentNumberGet(socketId), 'GatheringCurrentNumberGet')
+
+        if current >= nSamples:
+            break
+
+        if time.time() - start > duration + 10:
+            checkReply(xps.GatheringStop(socketId), 'GatheringStop')
+            break
+
+    for index in range(0, current, chunkSize):
+        indexes = range(index, min(index + chunkSize, current))
+        records = np.zeros(len(indexes), dtype=writer.block.dtype)
+
+        for i, (error, line) in enumerate(xps.batch(socketId, *[('GatheringDataGet', i) for i in indexes])):
+            checkReply([error], 'GatheringDataGet')
+            records[i] = (error, *[float(value) for value in line.split(';')], 0)
+
+        records['timestamp'] = start + np.array(indexes) * divisor / rate
+        writer.extend(records)
+
+    return current
+
+
+def pollSlitPosition(xps, socketId, duration, writer, period=0.01):
+    """
+    Record slit position polling GroupPositionCurrentGet every period, host timestamped.
+
+    Parameters
+    ----------
+    xps : `hxp_drivers.XPS`
+        Hexapod client.
+    socketId : int
+        Connected socket, not used by anything else during the recording.
+    duration : float
+        Recording duration in seconds.
+    writer : `SlitPositionWriter`
+        Where samples are streamed.
+    period : float, optional
+        Time between two samples in seconds.
+
+    Returns
+    -------
+    int
+        Number of recorded samples.
+    """
+    start = time.time()
+    nSamples = writer.nSamples
+
+    while (time.time() - start) < duration:
+        s1 = time.time()
+        status, *coords = xps.GroupPositionCurrentGet(socketId, 'HEXAPOD', 6)
+        s2 = time.time()
+
+        # keeping errors as they were, with nan coordinates.
+        coords = coords if len(coords) == 6 else 6 * [np.nan]
+        writer.append(status, coords, (s1 + s2) / 2)
+
+        time.sleep(period)
+
+    return writer.nSamples - nSamples
@@ -0,0 +1,109 @@
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import deque, namedtuple
+
+# one sample, timestamp is taken right before the query so that it is never newer than the data, received right after.
+Snapshot = namedtuple('Snapshot', ['timestamp', 'received', 'coords', 'hxpStatus'])
+
+
+class Poller(ABC):
+    name = 'poller'
+
+    def __init__(self, sample, period, historySize=600):
+        """Call sample in a background thread every period, keeping the latest snapshot and a bounded history.
+
+        :param sample: callable querying the controller, its reply is turned into a snapshot by makeSnapshot.
+        :param period: time between two samples in seconds.
+        :param historySize: number of snapshots kept in history.
+        """
+        self.sample = sample
+        self.period = period
+        self.history = deque(maxlen=historySize)
+        self.latest = None
+        self.lastError = None
+
+        self.lock = threading.Lock()
+        self.exitASAP = threading.Event()
+        self.thread = None
+        self.logger = logging.getLogger(self.name)
+
+    @property
+    def running(self):
+        return self.thread is not None and self.thread.is_alive()
+
+    def start(self):
+        """Start sampling thread."""
+        self.exitASAP.clear()
+        self.thread = threading.Thread(target=self.loop, name=self.name, daemon=True)
+        self.thread.start()
+
+        return self
+
+    def stop(self, timeout=5):
+        """Stop sampling thread, waiting for the current sample to complete."""
+        self.exitASAP.set()
+
+        if self.running:
+            self.thread.join(timeout)
+
+    def loop(self):
+        """Sample every period, whatever the query duration, until stopped."""
+        nextSample = time.time()
+
+        while not self.exitASAP.wait(max(nextSample - time.time(), 0)):
+            nextSample += self.period
+            timestamp = time.time()
+
+            try:
+                snapshot = self.makeSnapshot(timestamp, self.sample())
+            except Exception as e:
+                # failures are not fatal, data simply gets stale.
+                if str(e) != str(self.lastError):
+                    self.logger.warning(f'{self.name} sample failed : {e}')
+                self.lastError = e
+                continue
+
+            self.lastError = None
+
+            with self.lock:
+                self.latest = snapshot
+                self.history.append(snapshot)
+
+            self.onSnapshot(snapshot)
+
+            # do not try to catch up after a slow query.
+            nextSample = max(nextSample, time.time())
+
+    @abstractmethod
+    def makeSnapshot(self, timestamp, reply):
+        """Turn sample reply into a snapshot, timestamp being the time right before the query."""
+
+    def onSnapshot(self, snapshot):
+        """Called from the sampling thread after each new snapshot."""
+        pass
+
+    def snapshot(self, maxAge, since=0):
+        """Return latest snapshot if received less than maxAge seconds ago and queried after since, None otherwise."""
+        with self.lock:
+            latest = self.latest
+
+        if latest is None or latest.timestamp < since or time.time() - latest.received > maxAge:
+            return None
+
+        return latest
+
+    def getHistory(self, since=0):
+        """Return snapshots taken after since, oldest first."""
+        with self.lock:
+            return [snapshot for snapshot in self.history if snapshot.timestamp >= since]
+
+
+class SlitTelemetry(Poller):
+    name = 'slitTelemetry'
+
+    def makeSnapshot(self, timestamp, reply):
+        """Sample is expected to return (coords, hxpStatus), typically a batch on its own socket."""
+        coords, hxpStatus = reply
+        return Snapshot(timestamp, time.time(), tuple(coords), int(hxpStatus))
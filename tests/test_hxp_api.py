@@ -0,0 +1,49 @@
+"""XPS methods are exec-compiled from hxp_drivers.signatures, check them against the former hand-written ones.
+
+hxp_api_baseline.json was recorded from the hand-written driver : for every API method, the arguments it was called
+with, the command it sent, a canned reply with one field per output, and the number of outputs it returned.
+"""
+import json
+import os
+
+import pytest
+from enuActor.drivers import hxp_drivers
+
+with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'hxp_api_baseline.json')) as baselineFile:
+    baseline = json.load(baselineFile)
+
+
+def call(apiName, *args):
+    """Return (command, parser) of that API call, without executing it."""
+    return hxp_drivers.XPS._bind(apiName)(hxp_drivers.CommandRecorder(), 0, *args)
+
+
+def test_same_api_names():
+    assert sorted(baseline) == sorted(hxp_drivers.apiTable())
+
+
+@pytest.mark.parametrize('apiName', sorted(baseline))
+def test_method_exists(apiName):
+    assert callable(getattr(hxp_drivers.XPS(), apiName))
+
+
+@pytest.mark.parametrize('apiName', sorted(baseline))
+def test_command(apiName):
+    command, parser = call(apiName, *baseline[apiName]['args'])
+    assert command == baseline[apiName]['command']
+
+
+@pytest.mark.parametrize('apiName', sorted(baseline))
+def test_output_count(apiName):
+    command, parser = call(apiName, *baseline[apiName]['args'])
+    error, *outputs = parser(0, baseline[apiName]['reply'])
+
+    assert error == 0
+    assert len(outputs) == baseline[apiName]['nOutputs']
+
+
+@pytest.mark.parametrize('apiName', sorted(baseline))
+def test_error_passthrough(apiName):
+    command, parser = call(apiName, *baseline[apiName]['args'])
+    assert parser(-17, 'error') == [-17, 'error']
+
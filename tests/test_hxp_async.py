@@ -0,0 +1,87 @@
+"""AsyncXPS queries and batches against a fake asyncio controller, including deadlines."""
+import asyncio
+import time
+
+from enuActor.drivers import hxp_async, hxp_drivers
+
+
+async def startController(replies, delay=0):
+    """Serve one canned reply per received command, each one sent delay seconds after the previous one."""
+    replies = list(replies)
+
+    async def handle(reader, writer):
+        try:
+            while replies:
+                await reader.readuntil(b')')
+                await asyncio.sleep(delay)
+                writer.write(replies.pop(0) + hxp_drivers.XPS.END_OF_API)
+                await writer.drain()
+            await reader.read()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle, '127.0.0.1', 0)
+    return server, server.sockets[0].getsockname()[1]
+
+
+def run(replies, calls, delay=0, deadline=None):
+    """Connect an AsyncXPS to a fake controller and run calls(xps, socketId), return its result and duration."""
+
+    async def main():
+        server, port = await startController(replies, delay)
+        xps = hxp_async.AsyncXPS()
+        socketId = await xps.TCP_ConnectToServer('127.0.0.1', port, 2)
+        xps.setHangLimit(socketId, deadline)
+
+        start = time.perf_counter()
+        try:
+            result = await calls(xps, socketId)
+        finally:
+            await xps.TCP_CloseSocket(socketId)
+            server.close()
+
+        return result, time.perf_counter() - start
+
+    return asyncio.run(main())
+
+
+def test_query():
+    result, __ = run([b'0,12'], lambda xps, socketId: xps.GroupStatusGet(socketId, 'HEXAPOD'))
+    assert result == [0, 12]
+
+
+def test_batch():
+    calls = lambda xps, socketId: xps.batch(socketId, ('GroupStatusGet', 'HEXAPOD'),
+                                            ('GroupPositionCurrentGet', 'HEXAPOD', 6))
+    [status, position], __ = run([b'0,12', b'0,1,2,3,4,5,6'], calls)
+
+    assert status == [0, 12]
+    assert position == [0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0]
+
+
+def test_query_timeout():
+    result, duration = run([b'0,12'], lambda xps, socketId: xps.GroupStatusGet(socketId, 'HEXAPOD'),
+                           delay=1, deadline=0.2)
+    assert result == [-2, '']
+    assert duration < 0.8
+
+
+def test_batch_timeout():
+    # every reply comes within the deadline, the whole batch does not.
+    calls = lambda xps, socketId: xps.batch(socketId, *3 * [('GroupStatusGet', 'HEXAPOD')])
+    result, duration = run(3 * [b'0,12'], calls, delay=0.15, deadline=0.3)
+
+    assert result == 3 * [[-2, '']]
+    assert duration < 0.4
+
+
+def test_socket_dropped_after_timeout():
+    async def calls(xps, socketId):
+        await xps.GroupStatusGet(socketId, 'HEXAPOD')
+        return await xps.GroupStatusGet(socketId, 'HEXAPOD')
+
+    # a late reply would be read by the next call, so the socket is not usable anymore.
+    result, __ = run([b'0,12', b'0,11'], calls, delay=0.5, deadline=0.1)
+    assert result is None
@@ -0,0 +1,79 @@
+"""XPS replies read from a fake controller, garbled replies must come back as error -2 instead of raising."""
+import socket
+import threading
+
+import pytest
+from enuActor.drivers import hxp_drivers
+
+
+class FakeController(object):
+    """Answer each received command, terminated by its closing parenthesis, with the next canned reply."""
+
+    def __init__(self, *replies):
+        self.replies = list(replies)
+        self.server = socket.create_server(('127.0.0.1', 0))
+        self.port = self.server.getsockname()[1]
+        self.thread = threading.Thread(target=self.serve, daemon=True)
+        self.thread.start()
+
+    def serve(self):
+        conn, __ = self.server.accept()
+        received = b''
+
+        with conn:
+            while self.replies:
+                data = conn.recv(4096)
+                if not data:
+                    return
+                received += data
+                while b')' in received and self.replies:
+                    __, __, received = received.partition(b')')
+                    conn.sendall(self.replies.pop(0) + hxp_drivers.XPS.END_OF_API)
+
+    def close(self):
+        self.server.close()
+
+
+@pytest.fixture
+def connect():
+    controllers = []
+
+    def connect(*replies):
+        controller = FakeController(*replies)
+        controllers.append(controller)
+        xps = hxp_drivers.XPS()
+        return xps, xps.TCP_ConnectToServer('127.0.0.1', controller.port, 2)
+
+    yield connect
+
+    for controller in controllers:
+        controller.close()
+
+
+@pytest.mark.parametrize('reply, expected', [
+    (b'0,7', [0, '7']),
+    (b'-17,', [-17, '']),
+    (b'garbled,7', [-2, '']),
+    (b'\xff\xfe,7', [-2, '']),
+])
+def test_splitReply(reply, expected):
+    assert hxp_drivers.splitReply(reply) == expected
+
+
+def test_query(connect):
+    xps, socketId = connect(b'0,12')
+    assert xps.GroupStatusGet(socketId, 'HEXAPOD') == [0, 12]
+
+
+@pytest.mark.parametrize('reply', [b'x,12', b'\xff,12', b'0,twelve'])
+def test_garbled_query(connect, reply):
+    xps, socketId = connect(reply)
+    assert xps.GroupStatusGet(socketId, 'HEXAPOD') == [-2, '']
+
+
+def test_garbled_batch(connect):
+    xps, socketId = connect(b'0,12', b'\xff,1.0,2.0,3.0,4.0,5.0,6.0')
+    status, position = xps.batch(socketId, ('GroupStatusGet', 'HEXAPOD'), ('GroupPositionCurrentGet', 'HEXAPOD', 6))
+
+    assert status == [0, 12]
+    assert position == [-2, '']
@@ -0,0 +1,41 @@
+"""bin/recordSlitPosition.py run against the slit simulator."""
+import importlib.util
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+from enuActor.Simulators.slit import SlitSim
+from enuActor.utils import slitRecording
+
+scriptPath = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'bin', 'recordSlitPosition.py')
+
+
+@pytest.fixture
+def script(monkeypatch):
+    spec = importlib.util.spec_from_file_location('recordSlitPosition', scriptPath)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    sim = SlitSim()
+    sim.pos = [0.1, -0.2, 0.3, 0.01, -0.02, 0.03]
+    monkeypatch.setattr(module.hxp_drivers, 'XPS', lambda: sim)
+
+    return module
+
+
+def test_gathering(script, tmp_path):
+    filePath = script.recordSlitPosition('127.0.0.1', 0.2, rootDir=str(tmp_path), gathering=True, divisor=100,
+                                         csv=True)
+    records = slitRecording.load(filePath)
+
+    assert list(records.dtype.names) == ['status', *slitRecording.gatheringColumns(slitRecording.gatheringTypes),
+                                         'timestamp']
+    # 0.2s at servo rate / divisor.
+    assert len(records) == 20
+    assert np.allclose(records['HEXAPOD.1'], 0.1)
+    assert np.all(np.diff(records['timestamp']) > 0)
+
+    csv = pd.read_csv(filePath.replace('.bin', '.csv'), index_col=0)
+    assert list(csv.columns) == list(records.dtype.names)
+    assert len(csv) == len(records)
@@ -0,0 +1,88 @@
+"""Closed form S-curve against the numeric simulation kept as a reference in numericProfile.
+
+The numeric profile is sampled every jerkTime / 2000 and its parameters are found with Nelder-Mead, it drifts up to ~3%
+away from the exact solution, hence the 5% tolerance.
+"""
+import numpy as np
+import numericProfile
+import pytest
+from enuActor.utils import slitMotionProfile
+from scipy.optimize import brentq
+
+rtol = 0.05
+
+
+def numericAcceleration(targetSpeed, maxAcceleration, jerkTime):
+    """Return time and distance to reach targetSpeed from the numeric profile."""
+    x, y = numericProfile.makeJerkProfileNumeric(targetSpeed, maxAcceleration=maxAcceleration, jerkTime=jerkTime)
+    step = np.diff(x).mean()
+    acceleration = np.cumsum(step * y)
+    speed = np.cumsum(step * acceleration)
+    position = np.cumsum(step * speed)
+    iAtSpeed = np.argmin(abs(speed - targetSpeed))
+
+    return x[iAtSpeed], position[iAtSpeed]
+
+
+def numericMoveDuration(displacement, velocity, acceleration, jerkTime):
+    """Accelerate, cruise if velocity is reached, decelerate symmetrically."""
+    accelerationTime, accelerationDistance = numericAcceleration(velocity, acceleration, jerkTime)
+
+    if 2 * accelerationDistance <= displacement:
+        return 2 * accelerationTime + (displacement - 2 * accelerationDistance) / velocity
+
+    # velocity is never reached, finding the peak velocity for which acceleration and deceleration cover the move.
+    peakVelocity = brentq(lambda v: 2 * numericAcceleration(v, acceleration, jerkTime)[1] - displacement,
+                          1e-6 * velocity, velocity, xtol=1e-9)
+
+    return 2 * numericAcceleration(peakVelocity, acceleration, jerkTime)[0]
+
+
+@pytest.mark.parametrize('targetSpeed', [0.01, 0.05, 0.3, 1.0, 3.0])
+def test_distanceBeforeAtSpeed(targetSpeed):
+    numeric = numericProfile.calculateDistanceBeforeAtSpeedNumeric(targetSpeed)
+    analytic = slitMotionProfile.calculateDistanceBeforeAtSpeed(targetSpeed)
+
+    assert analytic == pytest.approx(numeric, rel=rtol)
+    assert slitMotionProfile.calculateDistanceBeforeAtSpeed(-targetSpeed) == analytic
+
+
+@pytest.mark.parametrize('targetSpeed, maxAcceleration, jerkTime', [
+    (0.05, 5, 0.05),  # maxAcceleration is never reached.
+    (0.1, 2, 0.05),  # maxAcceleration is just reached.
+    (0.3, 1.2, 0.05),
+    (1.0, 4.0, 0.05),
+    (2.0, 8.0, 0.005),
+])
+def test_acceleration(targetSpeed, maxAcceleration, jerkTime):
+    acceleration, timeAtConstantAcceleration = slitMotionProfile.solveProfile(targetSpeed, maxAcceleration, jerkTime)
+    accelerationTime = 2 * jerkTime + timeAtConstantAcceleration
+    numericTime, numericDistance = numericAcceleration(targetSpeed, maxAcceleration, jerkTime)
+
+    __, __, speed, position = slitMotionProfile.motionProfile(accelerationTime, targetSpeed, maxAcceleration, jerkTime)
+
+    assert acceleration <= maxAcceleration * (1 + 1e-12)
+    assert speed == pytest.approx(targetSpeed, rel=1e-12)
+    assert accelerationTime == pytest.approx(numericTime, rel=rtol)
+    assert position == pytest.approx(numericDistance, rel=rtol)
+
+
+@pytest.mark.parametrize('displacement, velocity, acceleration, jerkTime', [
+    (0.01, 1.0, 4.0, 0.05),  # neither velocity nor acceleration are reached.
+    (0.1, 1.0, 4.0, 0.05),  # acceleration is reached, not velocity.
+    (0.25, 1.0, 4.0, 0.05),
+    (-0.1, 1.0, 4.0, 0.05),
+    (0.3, 1.0, 4.0, 0.05),  # velocity is just reached.
+    (2.0, 0.3, 1.2, 0.05),
+    (5.0, 1.0, 4.0, 0.05),
+    (1.0, 2.0, 8.0, 0.005),
+])
+def test_moveDuration(displacement, velocity, acceleration, jerkTime):
+    analytic = slitMotionProfile.moveDuration(displacement, velocity, acceleration, jerkTime)
+    numeric = numericMoveDuration(abs(displacement), velocity, acceleration, jerkTime)
+
+    assert analytic == pytest.approx(numeric, rel=rtol)
+
+
+def test_moveDuration_null():
+    assert slitMotionProfile.moveDuration(0, 1.0, 4.0, 0.05) == 0